@@ -0,0 +1,37 @@
+"""create TbSpotlightChunkSummary table
+
+Revision ID: 15f9cea6cc04
+Revises: 527cce61c57d
+Create Date: 2026-10-18 14:41:19.206537
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '15f9cea6cc04'
+down_revision: Union[str, None] = '527cce61c57d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('TbSpotlightChunkSummary',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('chunk_hash', sa.String(length=64), nullable=False),
+    sa.Column('prompt_version', sa.String(length=32), nullable=False),
+    sa.Column('model', sa.String(length=64), nullable=False),
+    sa.Column('summary', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('chunk_hash', 'prompt_version', 'model', name='uq_TbSpotlightChunkSummary_cache_key')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('TbSpotlightChunkSummary')
@@ -0,0 +1,51 @@
+"""create TbSpotlightScore and TbSpotlightSummary tables
+
+Revision ID: 3c8e1f0b7a52
+Revises: e3d73f4a277a
+Create Date: 2026-10-18 10:05:14.627301
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c8e1f0b7a52'
+down_revision: Union[str, None] = 'e3d73f4a277a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 이전에는 repository 가 Base.metadata.create_all 로 테이블을 만들었으므로, 이미 있는 DB 에서는 건너뛴다.
+    # 이후 revision 에서 추가되는 컬럼과 키를 제외한, create_all 로 만들어지던 형태로 생성한다.
+    existing_tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if 'TbSpotlightScore' not in existing_tables:
+        op.create_table('TbSpotlightScore',
+        sa.Column('id', sa.String(length=32), nullable=False),
+        sa.Column('tb_ka_message_id', sa.String(length=32), nullable=False),
+        sa.Column('score', sa.Integer(), nullable=False),
+        sa.Column('for_date', sa.Date(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'TbSpotlightSummary' not in existing_tables:
+        op.create_table('TbSpotlightSummary',
+        sa.Column('id', sa.String(length=32), nullable=False),
+        sa.Column('summary', sa.Text(), nullable=False),
+        sa.Column('for_date', sa.Date(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # upgrade 는 create_all 로 이미 만들어진 테이블을 그대로 두므로, 이 revision 이 만든 테이블인지 구분할 수 없다.
+    # 기존 spotlight 데이터가 삭제되지 않도록 downgrade 에서는 테이블을 지우지 않는다. (되돌릴 수 없는 revision)
+    pass
@@ -0,0 +1,38 @@
+"""add unique key (tb_ka_message_id, for_date) to TbSpotlightScore
+
+Revision ID: 527cce61c57d
+Revises: de39314e0aca
+Create Date: 2026-10-18 13:26:08.351974
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '527cce61c57d'
+down_revision: Union[str, None] = 'de39314e0aca'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 유니크 키 생성 전, 같은 (tb_ka_message_id, for_date) 의 중복 row 중 가장 최근 row 만 남긴다.
+    op.execute("""
+        DELETE older
+        FROM TbSpotlightScore older
+        JOIN TbSpotlightScore newer
+          ON older.tb_ka_message_id = newer.tb_ka_message_id
+         AND older.for_date = newer.for_date
+         AND (older.created_at < newer.created_at
+              OR (older.created_at = newer.created_at AND older.id < newer.id))
+    """)
+    op.create_unique_constraint('uq_TbSpotlightScore_message_date', 'TbSpotlightScore',
+                                ['tb_ka_message_id', 'for_date'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_TbSpotlightScore_message_date', 'TbSpotlightScore', type_='unique')
@@ -0,0 +1,44 @@
+"""create TbTagBackfillCheckpoint table
+
+Revision ID: a91d3c7e5b20
+Revises: f4634d94c079
+Create Date: 2026-10-18 19:41:12.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a91d3c7e5b20'
+down_revision: Union[str, None] = 'f4634d94c079'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('TbTagBackfillCheckpoint',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('run_id', sa.String(length=64), nullable=False),
+    sa.Column('shard_start', sa.Date(), nullable=False),
+    sa.Column('shard_end', sa.Date(), nullable=False),
+    sa.Column('status', sa.String(length=16), nullable=False),
+    sa.Column('feed_count', sa.Integer(), nullable=False),
+    sa.Column('succeeded_count', sa.Integer(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('run_id', 'shard_start', name='uq_TbTagBackfillCheckpoint_run_shard')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('TbTagBackfillCheckpoint')
@@ -0,0 +1,35 @@
+"""add score cache key columns to TbSpotlightScore
+
+Revision ID: cbc15ebe6fae
+Revises: 3c8e1f0b7a52
+Create Date: 2026-10-18 10:12:31.482113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cbc15ebe6fae'
+down_revision: Union[str, None] = '3c8e1f0b7a52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('TbSpotlightScore', sa.Column('message_hash', sa.String(length=64), nullable=True))
+    op.add_column('TbSpotlightScore', sa.Column('prompt_version', sa.String(length=32), nullable=True))
+    op.add_column('TbSpotlightScore', sa.Column('model', sa.String(length=64), nullable=True))
+    op.create_index('ix_TbSpotlightScore_score_cache_key', 'TbSpotlightScore',
+                    ['message_hash', 'prompt_version', 'model'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_TbSpotlightScore_score_cache_key', table_name='TbSpotlightScore')
+    op.drop_column('TbSpotlightScore', 'model')
+    op.drop_column('TbSpotlightScore', 'prompt_version')
+    op.drop_column('TbSpotlightScore', 'message_hash')
@@ -0,0 +1,28 @@
+"""add message_set_hash to TbSpotlightSummary
+
+Revision ID: de39314e0aca
+Revises: cbc15ebe6fae
+Create Date: 2026-10-18 11:03:52.917604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'de39314e0aca'
+down_revision: Union[str, None] = 'cbc15ebe6fae'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('TbSpotlightSummary', sa.Column('message_set_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('TbSpotlightSummary', 'message_set_hash')
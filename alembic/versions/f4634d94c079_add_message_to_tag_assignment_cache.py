@@ -0,0 +1,28 @@
+"""add message column to TbTagAssignmentCache
+
+Revision ID: f4634d94c079
+Revises: fc2f00e840e3
+Create Date: 2026-10-18 17:20:44.903615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4634d94c079'
+down_revision: Union[str, None] = 'fc2f00e840e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('TbTagAssignmentCache', sa.Column('message', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('TbTagAssignmentCache', 'message')
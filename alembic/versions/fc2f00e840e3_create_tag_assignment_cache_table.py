@@ -0,0 +1,41 @@
+"""create TbTagAssignmentCache table
+
+Revision ID: fc2f00e840e3
+Revises: 15f9cea6cc04
+Create Date: 2026-10-18 16:02:37.514208
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fc2f00e840e3'
+down_revision: Union[str, None] = '15f9cea6cc04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('TbTagAssignmentCache',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('message_hash', sa.String(length=64), nullable=False),
+    sa.Column('catalog_hash', sa.String(length=64), nullable=False),
+    sa.Column('model', sa.String(length=64), nullable=False),
+    sa.Column('tag_codes', sa.Text(), nullable=False),
+    sa.Column('hit_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('last_hit_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('message_hash', 'catalog_hash', 'model', name='uq_TbTagAssignmentCache_cache_key')
+    )
+    op.create_index('ix_TbTagAssignmentCache_last_hit_at', 'TbTagAssignmentCache', ['last_hit_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_TbTagAssignmentCache_last_hit_at', table_name='TbTagAssignmentCache')
+    op.drop_table('TbTagAssignmentCache')
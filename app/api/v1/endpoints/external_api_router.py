@@ -5,26 +5,24 @@ from fastapi import APIRouter
 from app.schemas.external.feed_dto import FeedDto
 from app.schemas.external.subject_tag_dto import SubjectTagDto
 from app.schemas.external.tag_dto import TagDto
-from app.clients.handong_feed_app_client import HandongFeedAppClient
+from app.clients.handong_feed_app_client import handong_feed_app_client_singleton
+from app.services.tag_catalog_cache_service import tag_catalog_cache_service_singleton
 
 external_api_router = APIRouter()
 
 @external_api_router.get("/get-all-tags", response_model=List[TagDto.ReadResDto])
-def get_all_tags():
-    service = HandongFeedAppClient()
-    return service.get_all_tags()
+async def get_all_tags():
+    # 태그 목록은 거의 바뀌지 않으므로 TTL 동안은 캐시된 목록을 반환한다. (TAG_CATALOG_CACHE_TTL_SECONDS)
+    return (await tag_catalog_cache_service_singleton.get_catalog_async()).tags
 
 @external_api_router.post("/get-feeds", response_model=List[FeedDto.ReadRespDto])
-def get_feeds(req: FeedDto.ReadReqDto):
-    service = HandongFeedAppClient()
-    return service.get_feeds(req)
+async def get_feeds(req: FeedDto.ReadReqDto):
+    return await handong_feed_app_client_singleton.get_feeds_async(req)
 
 @external_api_router.post("/assign-tag/{subject_id}", response_model=SubjectTagDto.AssignRespDto)
-def assign_tag(subject_id: str, assign_req: SubjectTagDto.AssignReqDto):
-    service = HandongFeedAppClient()
-    return service.assign_tag(subject_id, assign_req)
+async def assign_tag(subject_id: str, assign_req: SubjectTagDto.AssignReqDto):
+    return await handong_feed_app_client_singleton.assign_tag_async(subject_id, assign_req)
 
 @external_api_router.post("/assign-tag/{subject_id}/batch", response_model=List[SubjectTagDto.AssignRespDto])
-def assign_tags_batch(subject_id: str, assign_reqs: List[SubjectTagDto.AssignReqDto]):
-    service = HandongFeedAppClient()
-    return service.assign_tags_batch(subject_id, assign_reqs)
\ No newline at end of file
+async def assign_tags_batch(subject_id: str, assign_reqs: List[SubjectTagDto.AssignReqDto]):
+    return await handong_feed_app_client_singleton.assign_tags_batch_async(subject_id, assign_reqs)
\ No newline at end of file
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.schemas.spotlight_dto import SpotlightDto
+from app.services.spotlight_job_service import spotlight_job_service_singleton
 from app.services.spotlight_service import SpotlightService
 
 
@@ -10,15 +13,55 @@ class SpotlightRouter:
     def __init__(self):
         self.router = APIRouter()
 
+        self.router.add_api_route("/jobs", self.submit_spotlight_job, methods=["POST"], status_code=202)
+        self.router.add_api_route("/jobs/{job_id}", self.get_spotlight_job, methods=["GET"])
         self.router.add_api_route("/{target_date}", self.get_spotlight, methods=["GET"])
+        self.router.add_api_route("/{target_date}/stored", self.get_stored_spotlight, methods=["GET"])
 
     @staticmethod
-    def get_spotlight(target_date: str, db: Session = Depends(get_db)) -> SpotlightDto.GetSpotlightRespDto:
-        """target_date 의 spotlight 를 get"""
+    def get_spotlight(
+            target_date: date,
+            incremental: bool = Query(False, description="아직 점수가 없거나 점수 생성에 실패한 메시지만 점수를 매길지 여부"),
+            collapse_duplicates: bool = Query(False, description="유사 중복 메시지는 대표 메시지의 점수만 반환할지 여부"),
+            db: Session = Depends(get_db)
+    ) -> SpotlightDto.GetSpotlightRespDto:
+        """
+        target_date(YYYY-MM-DD) 의 spotlight 를 get.
+        target_date 가 날짜 형식이 아니면(/jobs 처럼 잘못된 경로 포함) LLM 을 호출하지 않고 422 를 반환합니다.
+        """
         service = SpotlightService(db)
-        get_spotlight_resp_dto = service.get_spotlight(SpotlightDto.GetSpotlightReqDto(target_date=target_date))
+        get_spotlight_resp_dto = service.get_spotlight(
+            SpotlightDto.GetSpotlightReqDto(
+                target_date=target_date.isoformat(), incremental=incremental, collapse_duplicates=collapse_duplicates
+            )
+        )
         return  get_spotlight_resp_dto
 
+    @staticmethod
+    def get_stored_spotlight(target_date: date, db: Session = Depends(get_db)) -> SpotlightDto.GetSpotlightRespDto:
+        """LLM 호출 없이 target_date(YYYY-MM-DD) 에 저장된 spotlight 를 get"""
+        service = SpotlightService(db)
+        get_spotlight_resp_dto = service.get_stored_spotlight(target_date.isoformat())
+        if get_spotlight_resp_dto is None:
+            raise HTTPException(status_code=404, detail=f"{target_date} 에 저장된 spotlight 가 없습니다.")
+        return get_spotlight_resp_dto
+
+    @staticmethod
+    def submit_spotlight_job(job_req: SpotlightDto.SubmitSpotlightJobReqDto) -> SpotlightDto.SpotlightJobRespDto:
+        """
+        target_date 의 spotlight 생성을 백그라운드 job 으로 제출하고 job 정보를 즉시 반환.
+        같은 요청(target_date, incremental, collapse_duplicates)의 job 이 이미 진행 중이면 해당 job 을 반환.
+        """
+        return spotlight_job_service_singleton.submit_job(job_req)
+
+    @staticmethod
+    def get_spotlight_job(job_id: str) -> SpotlightDto.SpotlightJobRespDto:
+        """spotlight job 의 진행 상황을 get. 완료된 job 이면 result 에 GetSpotlightRespDto 가 담김"""
+        job = spotlight_job_service_singleton.get_job(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"spotlight job 을 찾을 수 없습니다: {job_id}")
+        return job
+
 
 
 spotlight_router = SpotlightRouter().router
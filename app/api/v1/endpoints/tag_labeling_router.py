@@ -3,9 +3,11 @@ from fastapi import APIRouter, Query, Depends
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.schemas.tag_fail_feed_dto import FailFeedResp
+from app.services.tag_assignment_cache_service import tag_assignment_cache_service_singleton
+from app.services.tag_catalog_cache_service import tag_catalog_cache_service_singleton
 from app.services.tag_fail_log_service import TagFailLogService
 from app.services.tag_labeling_service import TagLabelingService
-from app.schemas.tag_labeling_dto import MessageTagLabelingRespDto
+from app.schemas.tag_labeling_dto import MessageTagLabelingRespDto, TagAssignmentCacheStatsRespDto, TagCatalogCacheStatsRespDto
 
 tag_labeling_router = APIRouter()
 
@@ -15,20 +17,26 @@ def assign_tags(
         start_date: str = Query(..., description="조회 시작 날짜 (yyyy-mm-dd)"),
         end_date: str = Query(..., description="조회 종료 날짜 (yyyy-mm-dd)"),
         is_filter_new: int = Query(1, description="신규 메시지 필터링 여부 (1 또는 나머지)"),
-        limit: int = Query(100, description="조회할 최대 메시지 수")
+        only_unassigned_feeds: int = Query(1, description="태그가 할당되지 않은 피드만 처리할지 여부 (1 또는 나머지)"),
+        limit: int = Query(100, ge=1, description="처리할 최대 피드 수 (피드 stream 에서 읽을 피드 수의 상한)")
 ):
     """
     주어진 날짜 범위와 필터, 제한 정보를 기반으로 각 메시지에 적합한 태그 코드를 할당합니다.
 
     - start_date, end_date: yyyy-mm-dd 형식의 문자열 (예: "2025-01-01")
     - is_filter_new: 신규 메시지 필터링 여부 (1 또는 나머지, 1일 때 true)
-    - limit: 조회할 메시지 최대 개수
+    - only_unassigned_feeds: 태그가 할당되지 않은 피드만 처리할지 여부 (1 또는 나머지, 1일 때 true)
+    - limit: 처리할 최대 피드 수. 피드는 시간 구간별로 나누어 읽는 stream 으로 가져오며, limit 은 그 stream 에서 읽을 피드 수의 상한입니다.
+      응답에 모든 피드의 할당 결과를 담으므로 limit 만큼의 결과가 메모리에 모입니다.
+      쌓인 피드를 모두 처리하려면 결과를 모아 두지 않는 tag_assignment_action.py 나 tag_assignment_backfill.py 를 사용합니다.
 
     Returns:
         MessageTagLabelingRespDto: 각 메시지에 할당된 태그 정보를 포함하는 DTO.
     """
     service = TagLabelingService(db)
-    return service.process_feeds_with_date(start_date, end_date, is_filter_new, limit)
+    return service.process_feeds_with_date(
+        start_date, end_date, is_filter_new=is_filter_new, onlyUnassignedFeeds=only_unassigned_feeds, limit=limit
+    )
 
 @tag_labeling_router.get("/fail-feeds", response_model=FailFeedResp)
 def get_tag_assign_fail_feeds(db: Session = Depends(get_db)):
@@ -51,4 +59,36 @@ def process_fail_feeds(db: Session = Depends(get_db)):
             MessageTagLabelingRespDto: 각 메시지에 할당된 태그 정보를 포함하는 DTO.
     """
     service = TagLabelingService(db)
-    return service.process_failed_feeds()
\ No newline at end of file
+    return service.process_failed_feeds()
+
+@tag_labeling_router.get("/cache-stats", response_model=TagAssignmentCacheStatsRespDto)
+def get_tag_assignment_cache_stats():
+    """
+    태그 할당 캐시의 hit/miss 수와 hit rate(서버 시작 이후 누적), 현재 저장된 캐시 row 수를 반환합니다.
+
+    Returns:
+        TagAssignmentCacheStatsRespDto: 태그 할당 캐시 통계 DTO.
+    """
+    return tag_assignment_cache_service_singleton.get_stats()
+
+@tag_labeling_router.get("/tag-catalog", response_model=TagCatalogCacheStatsRespDto)
+def get_tag_catalog_cache_stats():
+    """
+    태그 목록 캐시의 상태(catalog_hash, ETag, 마지막 확인 이후 지난 시간)와 서버 시작 이후의 사용 횟수를 반환합니다.
+
+    Returns:
+        TagCatalogCacheStatsRespDto: 태그 목록 캐시 상태 DTO.
+    """
+    return tag_catalog_cache_service_singleton.get_stats()
+
+@tag_labeling_router.post("/tag-catalog/invalidate", response_model=TagCatalogCacheStatsRespDto)
+def invalidate_tag_catalog_cache():
+    """
+    태그 목록 캐시를 비워, 다음 태그 할당이나 태그 목록 조회에서 feed-app 의 태그 목록 전체를 다시 받도록 합니다.
+    feed-app 에서 태그를 추가/수정한 뒤 TTL 을 기다리지 않고 바로 반영할 때 사용합니다.
+
+    Returns:
+        TagCatalogCacheStatsRespDto: 캐시를 비운 뒤의 태그 목록 캐시 상태 DTO.
+    """
+    tag_catalog_cache_service_singleton.invalidate()
+    return tag_catalog_cache_service_singleton.get_stats()
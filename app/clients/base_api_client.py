@@ -1,43 +1,190 @@
+import asyncio
 import logging
-import requests
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from app.clients.llm_providers.event_loop import run_on_background_loop, run_sync
 from app.core.config import EnvVariables
 
+# 재시도해도 요청의 결과가 달라지지 않는 HTTP 메서드
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# 일시적인 서버 상태로 보고 재시도하는 응답 상태 코드
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+# 요청이 서버에 전달되기 전에 실패한 오류. 멱등이 아닌 요청도 재시도할 수 있다.
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# 재시도 사이 대기 시간의 상한(초)
+_MAX_BACKOFF_SECONDS = 10.0
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 class BaseAPIClient:
+    """
+    httpx 기반 외부 API 클라이언트.
+
+    - 동기 호출(get/post/patch)과 async 호출(aget/apost/apatch)은 각각 하나의 connection pool 을 공유하며,
+      keep-alive 연결 수와 connect/read/write/pool 대기 시간을 FEED_API_* 환경 변수로 제한합니다.
+    - 멱등 메서드(IDEMPOTENT_METHODS, 또는 idempotent=True 로 호출한 요청)는 네트워크 오류와 RETRYABLE_STATUS_CODES 응답에 대해
+      지수 backoff(full jitter) 로 최대 FEED_API_MAX_RETRIES 번 재시도합니다. 429/503 의 Retry-After 헤더가 있으면 따릅니다.
+      멱등이 아닌 요청(POST 등)은 연결을 맺지 못해 서버에 전달되지 않은 경우에만 재시도합니다.
+    - FEED_API_HTTP2 가 true 이고 `h2` 패키지가 설치되어 있으면 HTTP/2 를 사용합니다. (서버가 지원하지 않으면 HTTP/1.1 로 연결)
+    - async client 는 LLM provider 와 같은 백그라운드 이벤트 루프에 묶여 생성되므로,
+      FastAPI 핸들러나 스크립트의 asyncio.run 등 어떤 이벤트 루프에서 await 해도 같은 connection pool 을 사용합니다.
+
+    여러 스레드에서 하나의 인스턴스를 공유해도 안전하므로, 요청마다 새로 만들지 말고 싱글톤을 사용합니다.
+    """
+
     def __init__(self, api_key: str = None):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Content-Type": "application/json"
-        })
+        self.headers = {"Content-Type": "application/json"}
         key = api_key if api_key is not None else EnvVariables.FEED_API_KEY
         if key:
-            self.session.headers.update({"X-API-Key": key})
+            self.headers["X-API-Key"] = key
         else:
             logging.warning("API 키가 제공되지 않았습니다. 인증이 필요한 API 호출은 실패할 수 있습니다.")
-        # 타임아웃 설정 (connect=5초, read=30초)
-        self.session.timeout = (5, 30)
 
-    def _send_request(self, method, url, **kwargs):
+        self.timeout = httpx.Timeout(
+            connect=EnvVariables.FEED_API_CONNECT_TIMEOUT_SECONDS,
+            read=EnvVariables.FEED_API_READ_TIMEOUT_SECONDS,
+            write=EnvVariables.FEED_API_READ_TIMEOUT_SECONDS,
+            pool=EnvVariables.FEED_API_CONNECT_TIMEOUT_SECONDS,
+        )
+        self.limits = httpx.Limits(
+            max_connections=EnvVariables.FEED_API_MAX_CONNECTIONS,
+            max_keepalive_connections=EnvVariables.FEED_API_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=EnvVariables.FEED_API_KEEPALIVE_EXPIRY_SECONDS,
+        )
+        self.http2 = EnvVariables.FEED_API_HTTP2 and _http2_available()
+        if EnvVariables.FEED_API_HTTP2 and not self.http2:
+            logging.info("`h2` 패키지가 설치되어 있지 않아 HTTP/1.1 을 사용합니다. (pip install \"httpx[http2]\")")
+        self.max_retries = EnvVariables.FEED_API_MAX_RETRIES
+        self.retry_backoff_seconds = EnvVariables.FEED_API_RETRY_BACKOFF_SECONDS
+
+        self.session = httpx.Client(headers=self.headers, timeout=self.timeout, limits=self.limits, http2=self.http2)
+        self._async_session: httpx.AsyncClient | None = None
+        self._async_session_lock = threading.Lock()
+
+    def _get_async_session(self) -> httpx.AsyncClient:
+        if self._async_session is None:
+            with self._async_session_lock:
+                if self._async_session is None:
+                    self._async_session = httpx.AsyncClient(
+                        headers=self.headers, timeout=self.timeout, limits=self.limits, http2=self.http2
+                    )
+        return self._async_session
+
+    def _send_request(self, method, url, idempotent: bool | None = None, **kwargs):
         """
-        HTTP 요청을 보내고 공통적으로 예외를 처리하는 private 메서드
+        HTTP 요청을 보내고 공통적으로 재시도와 예외를 처리하는 private 메서드
 
         Args:
             method (str): HTTP 메서드 ('GET', 'POST', 'PATCH' 등)
             url (str): 요청할 URL
+            idempotent (bool): 재시도 가능 여부 (기본값: method 가 IDEMPOTENT_METHODS 에 속하는지)
             kwargs: 추가 요청 옵션
 
         Returns:
-            requests.Response: 요청 결과 응답
+            httpx.Response: 요청 결과 응답
         """
-        try:
-            response = self.session.request(method, url, **kwargs)
-            response.raise_for_status()
+        kwargs = self._prepare_kwargs(kwargs)
+        idempotent = self._is_idempotent(method, idempotent)
+        for attempt in range(1, self.max_retries + 2):
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if attempt <= self.max_retries and (idempotent or isinstance(e, _NOT_SENT_ERRORS)):
+                    time.sleep(self._log_retry(method, url, attempt, e))
+                    continue
+                logging.error(f"{method} 요청 실패 (네트워크 오류) - URL: {url}, 오류: {e}")
+                raise
+
+            if idempotent and attempt <= self.max_retries and response.status_code in RETRYABLE_STATUS_CODES:
+                time.sleep(self._log_retry(method, url, attempt, response))
+                continue
+            return self._raise_for_status(method, url, response)
+
+    async def _send_request_async(self, method, url, idempotent: bool | None = None, **kwargs):
+        """_send_request 의 async 버전. 백그라운드 이벤트 루프의 async client 로 요청합니다."""
+        return await run_on_background_loop(self._send_request_on_loop(method, url, idempotent, **kwargs))
+
+    async def _send_request_on_loop(self, method, url, idempotent: bool | None, **kwargs):
+        kwargs = self._prepare_kwargs(kwargs)
+        idempotent = self._is_idempotent(method, idempotent)
+        session = self._get_async_session()
+        for attempt in range(1, self.max_retries + 2):
+            try:
+                response = await session.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if attempt <= self.max_retries and (idempotent or isinstance(e, _NOT_SENT_ERRORS)):
+                    await asyncio.sleep(self._log_retry(method, url, attempt, e))
+                    continue
+                logging.error(f"{method} 요청 실패 (네트워크 오류) - URL: {url}, 오류: {e}")
+                raise
+
+            if idempotent and attempt <= self.max_retries and response.status_code in RETRYABLE_STATUS_CODES:
+                await asyncio.sleep(self._log_retry(method, url, attempt, response))
+                continue
+            return self._raise_for_status(method, url, response)
+
+    @staticmethod
+    def _prepare_kwargs(kwargs: dict) -> dict:
+        # requests 와 같이 값이 None 인 query parameter 는 보내지 않는다. (httpx 는 빈 문자열로 보낸다)
+        params = kwargs.get("params")
+        if isinstance(params, dict):
+            kwargs = {**kwargs, "params": {key: value for key, value in params.items() if value is not None}}
+        return kwargs
+
+    @staticmethod
+    def _is_idempotent(method: str, idempotent: bool | None) -> bool:
+        return method.upper() in IDEMPOTENT_METHODS if idempotent is None else idempotent
+
+    @staticmethod
+    def _raise_for_status(method: str, url: str, response: httpx.Response) -> httpx.Response:
+        # 304 Not Modified 는 조건부 요청(If-None-Match 등)에 대한 정상 응답이다.
+        if response.status_code == 304:
             return response
-        except requests.exceptions.HTTPError as e:
+        try:
+            return response.raise_for_status()
+        except httpx.HTTPStatusError as e:
             logging.error(f"{method} 요청 실패 (HTTP 오류) - URL: {url}, 상태 코드: {e.response.status_code}, 오류: {e}")
             raise
-        except requests.exceptions.RequestException as e:
-            logging.error(f"{method} 요청 실패 (네트워크 오류) - URL: {url}, 오류: {e}")
-            raise
+
+    def _log_retry(self, method: str, url: str, attempt: int, cause) -> float:
+        """재시도 전 대기 시간(초)을 계산하고 로그를 남깁니다."""
+        delay = self._retry_delay(attempt, cause if isinstance(cause, httpx.Response) else None)
+        reason = f"상태 코드 {cause.status_code}" if isinstance(cause, httpx.Response) else f"{type(cause).__name__}: {cause}"
+        logging.warning(f"{method} 요청 재시도 {attempt}/{self.max_retries} ({delay:.2f}초 후) - URL: {url}, 원인: {reason}")
+        return delay
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None) -> float:
+        """Retry-After 헤더가 있으면 그 값을, 없으면 0 ~ backoff * 2^(attempt-1) 사이의 임의의 값(full jitter)을 사용합니다."""
+        retry_after = self._parse_retry_after(response) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, _MAX_BACKOFF_SECONDS)
+        return random.uniform(0, min(self.retry_backoff_seconds * 2 ** (attempt - 1), _MAX_BACKOFF_SECONDS))
+
+    @staticmethod
+    def _parse_retry_after(response: httpx.Response) -> float | None:
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
 
     def get(self, url, **kwargs):
         return self._send_request('GET', url, **kwargs)
@@ -46,4 +193,20 @@ class BaseAPIClient:
         return self._send_request('POST', url, **kwargs)
 
     def patch(self, url, **kwargs):
-        return self._send_request('PATCH', url, **kwargs)
\ No newline at end of file
+        return self._send_request('PATCH', url, **kwargs)
+
+    async def aget(self, url, **kwargs):
+        return await self._send_request_async('GET', url, **kwargs)
+
+    async def apost(self, url, **kwargs):
+        return await self._send_request_async('POST', url, **kwargs)
+
+    async def apatch(self, url, **kwargs):
+        return await self._send_request_async('PATCH', url, **kwargs)
+
+    def close(self) -> None:
+        """동기 connection pool 을 닫고, async connection pool 은 백그라운드 이벤트 루프에서 닫습니다."""
+        self.session.close()
+        if self._async_session is not None:
+            run_sync(self._async_session.aclose())
+            self._async_session = None
@@ -1,8 +1,11 @@
+import asyncio
 import logging
-import requests
-from typing import List
+import httpx
+import time
+from typing import Iterator, List, Optional, Tuple
 
-from app.clients.base_api_client import BaseAPIClient
+from app.clients.base_api_client import BaseAPIClient, _NOT_SENT_ERRORS
+from app.clients.llm_providers.event_loop import run_sync
 from app.core.config import EnvVariables
 from app.schemas.external.feed_dto import FeedDto
 from app.schemas.external.subject_tag_dto import SubjectTagDto
@@ -20,6 +23,11 @@ class HandongFeedAppClient(BaseAPIClient):
         feed_api_key = EnvVariables.FEED_API_KEY
         super().__init__(api_key=feed_api_key)
         self.feed_base_api_url = EnvVariables.FEED_API_BASE_URL
+        # 서버가 bulk route 를 지원하지 않으면(404/405) false 로 바뀌어 이후에는 subject 별 요청만 보낸다.
+        self.bulk_routes_enabled = EnvVariables.FEED_API_BULK_ROUTES
+        self.bulk_concurrency = EnvVariables.FEED_API_BULK_CONCURRENCY
+        self.feed_page_size = EnvVariables.FEED_PAGE_SIZE
+        self.feed_page_window_seconds = EnvVariables.FEED_PAGE_WINDOW_SECONDS
 
 
     def get_all_tags(self) -> List[TagDto.ReadResDto]:
@@ -32,18 +40,80 @@ class HandongFeedAppClient(BaseAPIClient):
         Raises:
             Exception: 호출 실패 시 예외 발생
         """
-        url = f"{self.feed_base_api_url}/tag"
         try:
-            response = self.get(url)
-            response.raise_for_status()
-            tags_json = response.json()
-            tag_read_res_dto_list = [TagDto.ReadResDto(**item) for item in tags_json]
-            logger.info("Successfully retrieved and parsed tags from HanDongFeed App")
-            return tag_read_res_dto_list
+            return self._parse_tags(self.get(self._tags_url()))
         except Exception as e:
             logger.error(f"Failed to retrieve tags: {e}")
             raise Exception(f"Failed to get all tags: {e}") from e
 
+    async def get_all_tags_async(self) -> List[TagDto.ReadResDto]:
+        """get_all_tags 의 async 버전"""
+        try:
+            return self._parse_tags(await self.aget(self._tags_url()))
+        except Exception as e:
+            logger.error(f"Failed to retrieve tags: {e}")
+            raise Exception(f"Failed to get all tags: {e}") from e
+
+    def get_all_tags_conditional(self,
+                                 etag: str | None = None,
+                                 last_modified: str | None = None
+                                 ) -> Tuple[Optional[List[TagDto.ReadResDto]], Optional[str], Optional[str]]:
+        """
+        GET /api/external/tag 를 If-None-Match / If-Modified-Since 헤더와 함께 호출하여 태그 목록이 바뀌었는지 확인합니다.
+
+        Args:
+            etag (str): 이전 응답의 ETag 헤더 값
+            last_modified (str): 이전 응답의 Last-Modified 헤더 값
+
+        Returns:
+            (태그 목록, ETag, Last-Modified): 304 Not Modified 이면 태그 목록은 None 이고, 헤더 값은 이전 값을 유지합니다.
+
+        Raises:
+            Exception: 호출 실패 시 예외 발생
+        """
+        try:
+            response = self.get(self._tags_url(), headers=self._conditional_headers(etag, last_modified))
+            return self._parse_conditional_tags(response, etag, last_modified)
+        except Exception as e:
+            logger.error(f"Failed to retrieve tags: {e}")
+            raise Exception(f"Failed to get all tags: {e}") from e
+
+    async def get_all_tags_conditional_async(self,
+                                             etag: str | None = None,
+                                             last_modified: str | None = None
+                                             ) -> Tuple[Optional[List[TagDto.ReadResDto]], Optional[str], Optional[str]]:
+        """get_all_tags_conditional 의 async 버전"""
+        try:
+            response = await self.aget(self._tags_url(), headers=self._conditional_headers(etag, last_modified))
+            return self._parse_conditional_tags(response, etag, last_modified)
+        except Exception as e:
+            logger.error(f"Failed to retrieve tags: {e}")
+            raise Exception(f"Failed to get all tags: {e}") from e
+
+    @staticmethod
+    def _conditional_headers(etag: str | None, last_modified: str | None) -> dict:
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _parse_conditional_tags(self, response: httpx.Response, etag: str | None, last_modified: str | None):
+        if response.status_code == 304:
+            logger.info("Tags are not modified (304 Not Modified)")
+            return None, etag, last_modified
+        return self._parse_tags(response), response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+    def _tags_url(self) -> str:
+        return f"{self.feed_base_api_url}/tag"
+
+    @staticmethod
+    def _parse_tags(response: httpx.Response) -> List[TagDto.ReadResDto]:
+        tag_read_res_dto_list = [TagDto.ReadResDto(**item) for item in response.json()]
+        logger.info("Successfully retrieved and parsed tags from HanDongFeed App")
+        return tag_read_res_dto_list
+
     def get_feeds(self, feed_req: FeedDto.ReadReqDto) -> List[FeedDto.ReadRespDto]:
         """
         GET /api/external/feed API를 호출하여 피드 데이터를 가져오고,
@@ -64,16 +134,80 @@ class HandongFeedAppClient(BaseAPIClient):
         # if "isFilterNew" in params:
         #     params["isFilterNew"] = "1" if params["isFilterNew"] else "0"
         try:
-            response = self.get(url, params=params)
-            response.raise_for_status()
-            feed_json = response.json()
-            feed_read_resp_dtos = [FeedDto.ReadRespDto(**item) for item in feed_json]
-            logger.info("Successfully retrieved and parsed feed details from HanDongFeed App")
-            return feed_read_resp_dtos
+            return self._parse_feeds(self.get(url, params=params))
+        except Exception as e:
+            logger.error(f"Failed to retrieve feed: {e}")
+            raise Exception(f"Failed to get feed: {e}") from e
+
+    async def get_feeds_async(self, feed_req: FeedDto.ReadReqDto) -> List[FeedDto.ReadRespDto]:
+        """get_feeds 의 async 버전"""
+        url = f"{self.feed_base_api_url}/feed"
+        params = feed_req.model_dump(exclude_unset=True)
+        try:
+            return self._parse_feeds(await self.aget(url, params=params))
         except Exception as e:
             logger.error(f"Failed to retrieve feed: {e}")
             raise Exception(f"Failed to get feed: {e}") from e
 
+    @staticmethod
+    def _parse_feeds(response: httpx.Response) -> List[FeedDto.ReadRespDto]:
+        feed_read_resp_dtos = [FeedDto.ReadRespDto(**item) for item in response.json()]
+        logger.info("Successfully retrieved and parsed feed details from HanDongFeed App")
+        return feed_read_resp_dtos
+
+    def iter_feeds(self, feed_req: FeedDto.ReadReqDto, page_size: int | None = None) -> Iterator[FeedDto.ReadRespDto]:
+        """
+        GET /api/external/feed 를 시간 구간(start ~ end)별로 나누어 호출하며 피드를 하나씩 반환하는 generator.
+        한 번에 최대 page_size 개의 피드만 받아 파싱하므로, 조회 구간의 피드 수와 관계없이 메모리 사용량이 일정합니다.
+
+        feed API 는 cursor 를 지원하지 않으므로 다음과 같이 겹치지 않는 시간 구간을 앞에서부터 차례로 조회합니다.
+          - 응답이 page_size 개로 가득 차면 잘린 피드가 있을 수 있으므로, 결과를 버리고 구간을 절반으로 줄여 다시 조회합니다.
+          - 응답이 page_size 의 1/4 보다 적으면 다음 구간의 길이를 두 배로 늘립니다.
+          - 1초 구간도 가득 차면 더 나눌 수 없으므로 경고를 남기고 받은 피드만 반환합니다.
+
+        Args:
+            feed_req (FeedReqDto): 조회 조건. start 가 없으면 0, end 가 없으면 현재 시각이며, limit 은 전체 최대 피드 수입니다. (없으면 전체)
+            page_size (int): 한 번의 요청으로 받을 최대 피드 수 (기본값: FEED_PAGE_SIZE)
+
+        Raises:
+            Exception: API 호출 실패 또는 JSON 파싱 에러 발생 시 예외 전달.
+        """
+        page_size = page_size or self.feed_page_size
+        cursor = feed_req.start or 0
+        end = feed_req.end if feed_req.end is not None else int(time.time())
+        remaining = feed_req.limit
+        window = self.feed_page_window_seconds
+
+        while cursor <= end and (remaining is None or remaining > 0):
+            window_end = min(cursor + window - 1, end)
+            page_req = feed_req.model_copy(update={"start": cursor, "end": window_end, "limit": page_size})
+            page = self._get_feed_page(page_req)
+
+            if len(page) >= page_size and window_end > cursor:
+                window = max((window_end - cursor + 1) // 2, 1)
+                continue
+            if len(page) >= page_size:
+                logger.warning(f"More than {page_size} feeds were sent at {cursor}, some feeds may be skipped. "
+                               f"Increase FEED_PAGE_SIZE to fetch them.")
+
+            logger.info(f"Retrieved {len(page)} feeds for window {cursor} ~ {window_end}")
+            for item in page[:remaining]:
+                yield FeedDto.ReadRespDto(**item)
+            if remaining is not None:
+                remaining -= min(len(page), remaining)
+
+            cursor = window_end + 1
+            if len(page) < page_size // 4:
+                window *= 2
+
+    def _get_feed_page(self, page_req: FeedDto.ReadReqDto) -> list:
+        url = f"{self.feed_base_api_url}/feed"
+        try:
+            return self.get(url, params=page_req.model_dump(exclude_unset=True)).json()
+        except Exception as e:
+            logger.error(f"Failed to retrieve feed page: {e}")
+            raise Exception(f"Failed to get feed: {e}") from e
+
 
     def assign_tags_batch(self, subject_id: str, assign_reqs: List[SubjectTagDto.AssignReqDto]) -> List[SubjectTagDto.AssignRespDto]:
         """
@@ -108,19 +242,38 @@ class HandongFeedAppClient(BaseAPIClient):
         url = f"{self.feed_base_api_url}/subject-tag/{subject_id}/tag-assign-batch"
         payload = [assignment.model_dump() for assignment in assign_reqs]
         try:
-            response = self.post(url, json=payload)
-            response.raise_for_status()
-            result_json = response.json()
-            # 중복 저장 실패 검사
-            for item in result_json:
-                if item.get("id", 0) == -1:
-                    raise Exception(f"중복으로 인해 저장 실패한 태그 배정: {item}")
-            logger.info(f"Successfully assigned tags batch for subject_id {subject_id}")
-            return [SubjectTagDto.AssignRespDto(**item) for item in result_json]
+            return self._parse_assign_batch(subject_id, self.post(url, json=payload).json())
         except Exception as e:
             logger.error(f"Failed to assign tags batch for subject_id {subject_id}: {e}")
             raise Exception(f"Failed to assign tags batch for subject_id {subject_id}: {e}") from e
 
+    async def assign_tags_batch_async(self,
+                                      subject_id: str,
+                                      assign_reqs: List[SubjectTagDto.AssignReqDto],
+                                      allow_existing_tags: bool = False) -> List[SubjectTagDto.AssignRespDto]:
+        """assign_tags_batch 의 async 버전. allow_existing_tags 는 _parse_assign_batch 를 참고합니다."""
+        url = f"{self.feed_base_api_url}/subject-tag/{subject_id}/tag-assign-batch"
+        payload = [assignment.model_dump() for assignment in assign_reqs]
+        try:
+            return self._parse_assign_batch(subject_id, (await self.apost(url, json=payload)).json(), allow_existing_tags)
+        except Exception as e:
+            logger.error(f"Failed to assign tags batch for subject_id {subject_id}: {e}")
+            raise Exception(f"Failed to assign tags batch for subject_id {subject_id}: {e}") from e
+
+    @staticmethod
+    def _parse_assign_batch(subject_id: str, result_json: list, allow_existing_tags: bool = False) -> List[SubjectTagDto.AssignRespDto]:
+        """
+        태그 배정 결과를 파싱합니다. id 가 -1 인 항목(이미 배정된 태그)이 있으면 중복 저장 실패로 예외를 던집니다.
+        allow_existing_tags 가 true 이면(재태깅) 이미 배정된 태그는 건너뛰고, 새로 배정된 태그만 반환합니다.
+        """
+        existing = [item for item in result_json if item.get("id", 0) == -1]
+        if existing and not allow_existing_tags:
+            # 중복 저장 실패
+            raise Exception(f"중복으로 인해 저장 실패한 태그 배정: {existing[0]}")
+        logger.info(f"Successfully assigned tags batch for subject_id {subject_id}"
+                    + (f" ({len(existing)} already assigned)" if existing else ""))
+        return [SubjectTagDto.AssignRespDto(**item) for item in result_json if item.get("id", 0) != -1]
+
 
     def assign_tag(self, subject_id: str, assign_req: SubjectTagDto.AssignReqDto) -> SubjectTagDto.AssignRespDto:
         """
@@ -149,17 +302,146 @@ class HandongFeedAppClient(BaseAPIClient):
         url = f"{self.feed_base_api_url}/subject-tag/{subject_id}/tag-assign"
         payload = assign_req.model_dump()
         try:
-            response = self.post(url, json=payload)
-            response.raise_for_status()
-            result_json = response.json()
-            if result_json.get("id", 0) == -1:
-                raise Exception(f"중복으로 인해 저장 실패한 단일 태그 배정: {result_json}")
-            logger.info(f"Successfully assigned tag for subject_id {subject_id}")
-            return SubjectTagDto.AssignRespDto(**result_json)
+            return self._parse_assign(subject_id, self.post(url, json=payload))
+        except Exception as e:
+            logger.error(f"Failed to assign tag for subject_id {subject_id}: {e}")
+            raise Exception(f"Failed to assign tag for subject_id {subject_id}: {e}") from e
+
+    async def assign_tag_async(self, subject_id: str, assign_req: SubjectTagDto.AssignReqDto) -> SubjectTagDto.AssignRespDto:
+        """assign_tag 의 async 버전"""
+        url = f"{self.feed_base_api_url}/subject-tag/{subject_id}/tag-assign"
+        payload = assign_req.model_dump()
+        try:
+            return self._parse_assign(subject_id, await self.apost(url, json=payload))
         except Exception as e:
             logger.error(f"Failed to assign tag for subject_id {subject_id}: {e}")
             raise Exception(f"Failed to assign tag for subject_id {subject_id}: {e}") from e
 
+    @staticmethod
+    def _parse_assign(subject_id: str, response: httpx.Response) -> SubjectTagDto.AssignRespDto:
+        result_json = response.json()
+        if result_json.get("id", 0) == -1:
+            raise Exception(f"중복으로 인해 저장 실패한 단일 태그 배정: {result_json}")
+        logger.info(f"Successfully assigned tag for subject_id {subject_id}")
+        return SubjectTagDto.AssignRespDto(**result_json)
+
+
+    def assign_tags_bulk(self,
+                         assign_reqs_by_subject: List[Tuple[str, List[SubjectTagDto.AssignReqDto]]],
+                         allow_existing_tags: bool = False,
+                         ) -> List[List[SubjectTagDto.AssignRespDto] | Exception]:
+        """
+        여러 subject 의 태그 배정을 한 번에 요청하고, subject 별 결과를 입력 순서대로 반환합니다.
+        실패한 subject 의 결과는 assign_tags_batch 가 던지는 것과 같은 Exception 입니다. (중복 저장 실패 포함)
+        allow_existing_tags 가 true 이면(재태깅) 이미 배정된 태그는 실패로 보지 않고, 새로 배정된 태그만 결과에 담습니다.
+
+        FEED_API_BULK_ROUTES 가 true 이면 POST /api/external/subject-tag/tag-assign-bulk 한 번으로 요청하고,
+        서버가 bulk route 를 지원하지 않거나(404/405) 연결하지 못해 요청이 전달되지 않은 경우에만 subject 별 tag-assign-batch 요청을
+        최대 FEED_API_BULK_CONCURRENCY 개씩 동시에 보냅니다. POST 는 멱등이 아니므로, 그 외의 실패(5xx, 응답 timeout, 잘못된 응답 등)는
+        서버가 이미 저장했을 수 있어 다시 보내지 않고 모든 subject 의 결과를 Exception 으로 반환합니다.
+
+        bulk 요청 예시:
+        [
+          {"subjectId": "1", "assignments": [{"tagCode": "club", "forDate": "2025-01-01", "confidentValue": 0.33}]},
+          {"subjectId": "2", "assignments": [{"tagCode": "event", "forDate": null, "confidentValue": -1.0}]}
+        ]
+
+        bulk 응답 예시 (요청 순서와 같음):
+        [
+          {"subjectId": "1", "assignments": [{"id": 10, "tbSubjectId": 1, "tagCode": "club", ...}]},
+          {"subjectId": "2", "error": "Subject not found"}
+        ]
+
+        Args:
+            assign_reqs_by_subject (List[Tuple[str, List[AssignReqDto]]]): (subject ID, 태그 배정 요청 목록) 목록
+            allow_existing_tags (bool): 이미 배정된 태그를 중복 저장 실패로 보지 않을지 여부
+
+        Returns:
+            List[List[AssignRespDto] | Exception]: subject 별 태그 배정 결과 또는 실패 원인
+        """
+        return run_sync(self.assign_tags_bulk_async(assign_reqs_by_subject, allow_existing_tags))
+
+    async def assign_tags_bulk_async(self,
+                                     assign_reqs_by_subject: List[Tuple[str, List[SubjectTagDto.AssignReqDto]]],
+                                     allow_existing_tags: bool = False,
+                                     ) -> List[List[SubjectTagDto.AssignRespDto] | Exception]:
+        """assign_tags_bulk 의 async 버전"""
+        if not assign_reqs_by_subject:
+            return []
+
+        if self.bulk_routes_enabled:
+            url = f"{self.feed_base_api_url}/subject-tag/tag-assign-bulk"
+            payload = [
+                {"subjectId": subject_id, "assignments": [assignment.model_dump() for assignment in assign_reqs]}
+                for subject_id, assign_reqs in assign_reqs_by_subject
+            ]
+            subject_ids = [subject_id for subject_id, _ in assign_reqs_by_subject]
+            try:
+                response = await self._request_bulk_route("POST", url, json=payload)
+                if response is not None:
+                    return self._parse_assign_bulk(subject_ids, response.json(), allow_existing_tags)
+            except Exception as e:
+                # 서버가 이미 저장했을 수 있으므로 subject 별로 다시 요청하지 않는다. (다시 보내면 중복 저장 실패가 된다)
+                logger.error(f"Bulk tag assignment failed, not retrying per subject: {e}")
+                return [Exception(f"Failed to assign tags batch for subject_id {subject_id}: {e}") for subject_id in subject_ids]
+
+        semaphore = asyncio.Semaphore(self.bulk_concurrency)
+
+        async def assign(subject_id: str, assign_reqs: List[SubjectTagDto.AssignReqDto]):
+            async with semaphore:
+                return await self.assign_tags_batch_async(subject_id, assign_reqs, allow_existing_tags)
+
+        return list(await asyncio.gather(
+            *(assign(subject_id, assign_reqs) for subject_id, assign_reqs in assign_reqs_by_subject),
+            return_exceptions=True,
+        ))
+
+    def _parse_assign_bulk(self,
+                           subject_ids: List[str],
+                           result_json: list,
+                           allow_existing_tags: bool = False) -> List[List[SubjectTagDto.AssignRespDto] | Exception]:
+        if not isinstance(result_json, list) or len(result_json) != len(subject_ids):
+            raise Exception(f"Expected {len(subject_ids)} results but got {result_json!r:.200}")
+
+        results: List[List[SubjectTagDto.AssignRespDto] | Exception] = []
+        for subject_id, item in zip(subject_ids, result_json):
+            try:
+                if str(item.get("subjectId")) != str(subject_id):
+                    raise Exception(f"Unexpected subjectId in bulk response: {item.get('subjectId')}")
+                if item.get("error"):
+                    raise Exception(item["error"])
+                results.append(self._parse_assign_batch(subject_id, item.get("assignments") or [], allow_existing_tags))
+            except Exception as e:
+                logger.error(f"Failed to assign tags batch for subject_id {subject_id}: {e}")
+                results.append(Exception(f"Failed to assign tags batch for subject_id {subject_id}: {e}"))
+        return results
+
+    async def _request_bulk_route(self, method: str, url: str, idempotent: bool | None = None, **kwargs) -> Optional[httpx.Response]:
+        """
+        bulk route 로 요청을 보내고 응답을 반환합니다. subject 별 요청으로 처리해도 되는 실패라면 None 을 반환합니다.
+
+        - 서버가 bulk route 를 지원하지 않으면(404/405) None 을 반환하고, 이후에는 bulk route 를 사용하지 않습니다.
+        - 멱등 요청은 어떤 실패든 None 을 반환합니다.
+        - 멱등이 아닌 요청은 서버에 전달되지 않은 연결 오류(_NOT_SENT_ERRORS)만 None 을 반환하고, 그 외의 실패는 예외를 그대로 던집니다.
+        """
+        try:
+            return await self._send_request_async(method, url, idempotent=idempotent, **kwargs)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in (404, 405):
+                logger.warning(f"Bulk route is not supported by the server ({e.response.status_code}), "
+                               f"falling back to per-subject requests: {url}")
+                self.bulk_routes_enabled = False
+                return None
+            if not self._is_idempotent(method, idempotent):
+                raise
+            logger.warning(f"Bulk request failed, falling back to per-subject requests: {e}")
+            return None
+        except httpx.HTTPError as e:
+            if not self._is_idempotent(method, idempotent) and not isinstance(e, _NOT_SENT_ERRORS):
+                raise
+            logger.warning(f"Bulk request failed, falling back to per-subject requests: {e}")
+            return None
+
 
     def get_latest_for_date(self) -> SubjectTagDto.GetLatestForDateResDto:
         """
@@ -174,7 +456,6 @@ class HandongFeedAppClient(BaseAPIClient):
         url = f"{self.feed_base_api_url}/subject-tag/latest-for-date"
         try:
             response = self.get(url)
-            response.raise_for_status()
 
             # 204 No Content 응답 처리
             if response.status_code == 204:
@@ -202,24 +483,82 @@ class HandongFeedAppClient(BaseAPIClient):
         url = f"{self.feed_base_api_url}/subject/{subject_id}/tag-assigned"
 
         try:
-            response = self.patch(url)
+            # 태그 할당 완료 상태를 true 로 바꾸는 요청이므로 여러 번 보내도 결과가 같다.
+            self._check_tag_assigned_response(self.patch(url, idempotent=True))
+        except httpx.HTTPError as e:
+            raise self._tag_assigned_error(subject_id, e) from e
 
-            # 예상한 204 No Content 응답 처리
-            if response.status_code == 204:
-                return
+    async def update_is_tag_assigned_true_async(self, subject_id: int):
+        """update_is_tag_assigned_true 의 async 버전"""
+        url = f"{self.feed_base_api_url}/subject/{subject_id}/tag-assigned"
+        try:
+            self._check_tag_assigned_response(await self.apatch(url, idempotent=True))
+        except httpx.HTTPError as e:
+            raise self._tag_assigned_error(subject_id, e) from e
+
+    def update_is_tag_assigned_true_bulk(self, subject_ids: List[int]) -> List[Optional[Exception]]:
+        """
+        여러 subject 의 태그 할당 완료 상태를 한 번에 갱신하고, subject 별 결과(성공 시 None, 실패 시 Exception)를 입력 순서대로 반환합니다.
+
+        FEED_API_BULK_ROUTES 가 true 이면 PATCH /api/external/subject/tag-assigned 한 번으로 요청하고 (204 No Content 이면 모두 성공),
+        서버가 bulk route 를 지원하지 않거나 bulk 요청이 실패하면 subject 별 요청을 최대 FEED_API_BULK_CONCURRENCY 개씩 동시에 보냅니다.
+
+        bulk 요청 예시:
+        {"subjectIds": [1, 2, 3]}
+
+        Args:
+            subject_ids (List[int]): 업데이트할 주제 ID 목록
+
+        Returns:
+            List[Optional[Exception]]: subject 별 실패 원인 (성공 시 None)
+        """
+        return run_sync(self.update_is_tag_assigned_true_bulk_async(subject_ids))
 
-            # 예상 외의 정상 응답 (ex: 200, 201)이 오면 의심
-            raise Exception(f"Unexpected success response: {response.status_code}")
+    async def update_is_tag_assigned_true_bulk_async(self, subject_ids: List[int]) -> List[Optional[Exception]]:
+        """update_is_tag_assigned_true_bulk 의 async 버전"""
+        if not subject_ids:
+            return []
 
-        except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code
+        if self.bulk_routes_enabled:
+            url = f"{self.feed_base_api_url}/subject/tag-assigned"
+            response = await self._request_bulk_route("PATCH", url, idempotent=True, json={"subjectIds": subject_ids})
+            if response is not None and response.status_code == 204:
+                return [None] * len(subject_ids)
+
+        semaphore = asyncio.Semaphore(self.bulk_concurrency)
+
+        async def update(subject_id: int):
+            async with semaphore:
+                await self.update_is_tag_assigned_true_async(subject_id)
+
+        return [
+            result if isinstance(result, Exception) else None
+            for result in await asyncio.gather(*(update(subject_id) for subject_id in subject_ids), return_exceptions=True)
+        ]
+
+    @staticmethod
+    def _check_tag_assigned_response(response: httpx.Response) -> None:
+        # 예상한 204 No Content 응답 처리
+        if response.status_code == 204:
+            return
+
+        # 예상 외의 정상 응답 (ex: 200, 201)이 오면 의심
+        raise Exception(f"Unexpected success response: {response.status_code}")
+
+    @staticmethod
+    def _tag_assigned_error(subject_id: int, error: httpx.HTTPError) -> Exception:
+        if isinstance(error, httpx.HTTPStatusError):
+            status_code = error.response.status_code
 
             if status_code == 404:
-                raise Exception(f"Subject not found with ID: {subject_id}") from e
+                return Exception(f"Subject not found with ID: {subject_id}")
             elif status_code == 403:
-                raise Exception(f"Access denied when updating subject with ID: {subject_id}") from e
+                return Exception(f"Access denied when updating subject with ID: {subject_id}")
             else:
-                raise Exception(f"HTTP error occurred while updating subject: {e}") from e
+                return Exception(f"HTTP error occurred while updating subject: {error}")
+
+        return Exception(f"Failed to update is_tag_assigned for subject: {subject_id}. Error: {error}")
+
 
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Failed to update is_tag_assigned for subject: {subject_id}. Error: {e}") from e
\ No newline at end of file
+# 싱글톤으로 connection pool 을 공유하기 위함
+handong_feed_app_client_singleton = HandongFeedAppClient()
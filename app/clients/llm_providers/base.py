@@ -0,0 +1,147 @@
+import asyncio
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from app.clients.llm_providers.event_loop import run_on_background_loop, run_sync
+from app.core.config import EnvVariables
+
+
+@dataclass
+class LLMUsage:
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+@dataclass
+class LLMResponse:
+    text: str
+    model: str
+    usage: LLMUsage = field(default_factory=LLMUsage)
+    latency_seconds: float = 0.0
+
+
+@dataclass
+class LLMUsageStats:
+    """provider 별 누적 사용량"""
+    requests: int = 0
+    failures: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_latency_seconds: float = 0.0
+
+
+class LLMProvider(ABC):
+    """
+    LLM provider 의 공통 async 인터페이스.
+
+    - chat(): async 호출. 어느 이벤트 루프에서 호출하든 provider 의 백그라운드 루프에서 실행됩니다.
+    - chat_sync(): 동기 코드(스레드)용 호출. 백그라운드 루프에서 실행하고 결과를 기다립니다.
+    - 모든 호출에 timeout 이 적용되며, 응답의 토큰 사용량과 지연 시간은 provider 별로 누적됩니다. (get_usage_stats)
+
+    새 provider 는 이 클래스를 상속하여 _chat() 을 구현하고 registry.register_provider 로 등록합니다.
+    """
+
+    name: str = ""
+    # true 이면 LLM_STRUCTURED_OUTPUT 과 관계없이 json_schema 를 _chat() 에 전달합니다. (schema 로 응답을 만드는 mock provider 용)
+    always_use_json_schema: bool = False
+
+    def __init__(self, default_model: str | None = None):
+        self.default_model = default_model
+        self._usage_stats = LLMUsageStats()
+        self._usage_lock = threading.Lock()
+
+    async def chat(self,
+                   messages: List[Dict[str, str]],
+                   model: str | None = None,
+                   json_mode: bool = False,
+                   json_schema: Optional[dict] = None,
+                   timeout: float | None = None) -> LLMResponse:
+        """
+        messages ({"role": "system" | "user" | "assistant", "content": ...} 목록) 로 LLM 을 호출하고 응답을 반환합니다.
+
+        Args:
+            model: 사용할 모델. 없으면 provider 의 기본 모델을 사용합니다.
+            json_mode: true 이면 provider 의 JSON 응답 모드를 사용합니다.
+            json_schema: 응답 JSON 의 schema. LLM_STRUCTURED_OUTPUT 이 켜져 있으면 provider 의 structured output 모드
+                         (Ollama format, Gemini response_schema)로 응답이 schema 를 따르도록 강제하며, JSON 모드를 함께 사용합니다.
+                         mock provider 는 LLM_STRUCTURED_OUTPUT 과 관계없이 항상 이 schema 에 맞는 응답을 생성합니다.
+            timeout: 호출 제한 시간(초). 없으면 LLM_REQUEST_TIMEOUT_SECONDS 를 사용합니다.
+        """
+        return await run_on_background_loop(self._timed_chat(messages, model, json_mode, json_schema, timeout))
+
+    def chat_sync(self,
+                  messages: List[Dict[str, str]],
+                  model: str | None = None,
+                  json_mode: bool = False,
+                  json_schema: Optional[dict] = None,
+                  timeout: float | None = None) -> LLMResponse:
+        """chat() 의 동기 버전"""
+        return run_sync(self._timed_chat(messages, model, json_mode, json_schema, timeout))
+
+    def get_usage_stats(self) -> LLMUsageStats:
+        with self._usage_lock:
+            return LLMUsageStats(**vars(self._usage_stats))
+
+    async def _timed_chat(self,
+                          messages: List[Dict[str, str]],
+                          model: str | None,
+                          json_mode: bool,
+                          json_schema: Optional[dict],
+                          timeout: float | None) -> LLMResponse:
+        model = model or self.default_model
+        timeout = timeout or EnvVariables.LLM_REQUEST_TIMEOUT_SECONDS
+        if json_schema is not None:
+            if EnvVariables.LLM_STRUCTURED_OUTPUT or self.always_use_json_schema:
+                json_mode = True
+            else:
+                json_schema = None
+        started_at = time.perf_counter()
+        try:
+            response = await asyncio.wait_for(
+                self._chat(messages, model, json_mode, json_schema),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError as e:
+            self._record_failure()
+            raise Exception(f"{self.name} 호출 시간 초과 ({timeout}s)") from e
+        except Exception:
+            self._record_failure()
+            raise
+
+        response.latency_seconds = time.perf_counter() - started_at
+        with self._usage_lock:
+            self._usage_stats.requests += 1
+            self._usage_stats.prompt_tokens += response.usage.prompt_tokens
+            self._usage_stats.completion_tokens += response.usage.completion_tokens
+            self._usage_stats.total_latency_seconds += response.latency_seconds
+        return response
+
+    def _record_failure(self) -> None:
+        with self._usage_lock:
+            self._usage_stats.requests += 1
+            self._usage_stats.failures += 1
+
+    @abstractmethod
+    async def _chat(self,
+                    messages: List[Dict[str, str]],
+                    model: str | None,
+                    json_mode: bool,
+                    json_schema: Optional[dict]) -> LLMResponse:
+        """
+        provider 별 실제 호출 구현. 백그라운드 이벤트 루프에서 실행됩니다.
+        json_schema 가 주어지면 json_mode 도 true 이며, provider 의 structured output 모드로 전달해야 합니다.
+        """
+
+    @staticmethod
+    def split_system_prompt(messages: List[Dict[str, str]]) -> tuple[str | None, List[Dict[str, str]]]:
+        """system 메시지들을 하나의 system prompt 로 합치고, 나머지 메시지와 분리하여 반환합니다."""
+        system_prompts = [m["content"] for m in messages if m["role"] == "system"]
+        others = [m for m in messages if m["role"] != "system"]
+        return ("\n".join(system_prompts) if system_prompts else None), others
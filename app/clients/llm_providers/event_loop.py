@@ -0,0 +1,50 @@
+"""
+동기 코드(스레드)에서 async LLM provider 를 호출하기 위한 백그라운드 이벤트 루프.
+
+provider 의 HTTP client 는 이 루프에 묶여 생성되므로, 모든 provider 호출은 이 루프에서 실행됩니다.
+"""
+import asyncio
+import threading
+from typing import Awaitable, TypeVar
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """프로세스 공용 백그라운드 이벤트 루프를 반환합니다. 처음 호출될 때 데몬 스레드에서 루프를 시작합니다."""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="llm-provider-loop", daemon=True)
+                thread.start()
+                _loop = loop
+    return _loop
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """coroutine 을 백그라운드 루프에서 실행하고 결과를 기다려 반환합니다. 백그라운드 루프 안에서는 호출할 수 없습니다."""
+    loop = get_background_loop()
+    if _is_running_on(loop):
+        coro.close()
+        raise Exception("백그라운드 이벤트 루프 안에서는 run_sync 를 호출할 수 없습니다. await 를 사용해 주세요.")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+async def run_on_background_loop(coro: Awaitable[T]) -> T:
+    """다른 이벤트 루프(예: FastAPI)에서 coroutine 을 백그라운드 루프로 넘겨 실행하고 결과를 await 합니다."""
+    loop = get_background_loop()
+    if _is_running_on(loop):
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+
+def _is_running_on(loop: asyncio.AbstractEventLoop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
@@ -0,0 +1,199 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from google import genai
+from google.genai import errors as genai_errors
+from google.genai import types
+
+from app.clients.llm_providers.base import LLMProvider, LLMResponse, LLMUsage
+from app.core.config import EnvVariables
+from app.util.hash_utils import sha256_hex
+
+logger = logging.getLogger(__name__)
+
+# 일시적인 오류(timeout, 429, 5xx)로 context cache 생성에 실패한 prompt 는 이 시간(초) 동안 생성을 다시 시도하지 않는다.
+_CACHE_CREATE_RETRY_SECONDS = 60
+
+
+class GeminiProvider(LLMProvider):
+    """
+    Gemini API 를 호출하는 provider. (기본 모델: GEMINI_MODEL)
+
+    - genai.Client 는 한 번만 만들어 재사용하므로 내부 HTTP connection pool 을 공유합니다.
+    - GEMINI_CONTEXT_CACHE 가 켜져 있으면 system prompt 를 Gemini context cache 로 재사용합니다.
+    """
+
+    name = "gemini"
+
+    def __init__(self, default_model: str | None = None):
+        super().__init__(default_model or EnvVariables.GEMINI_MODEL)
+        self.client: genai.Client | None = None
+        # {(model, system prompt hash): (cached content 이름, 갱신 시각(monotonic))}
+        self.cached_contents: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        self.uncacheable_prompts: Set[Tuple[str, str]] = set()
+        # {(model, system prompt hash): cache 생성을 다시 시도할 수 있는 시각(monotonic)}
+        self.cache_retry_after: Dict[Tuple[str, str], float] = {}
+        # 같은 prompt 에 대한 cache 가 동시에 여러 번 생성되지 않도록 한다.
+        self.cache_lock = asyncio.Lock()
+
+    async def _chat(self,
+                    messages: List[Dict[str, str]],
+                    model: str | None,
+                    json_mode: bool,
+                    json_schema: Optional[dict]) -> LLMResponse:
+        if self.client is None:
+            self.client = genai.Client(api_key=EnvVariables.GEMINI_API_KEY)
+
+        system_prompt, others = self.split_system_prompt(messages)
+        contents = [
+            types.Content(role="model" if m["role"] == "assistant" else "user", parts=[types.Part(text=m["content"])])
+            for m in others
+        ]
+        response_mime_type = "application/json" if json_mode else None
+        response_schema = self.to_gemini_schema(json_schema) if json_schema is not None else None
+
+        try:
+            cached_content_name = await self.get_cached_content(model, system_prompt) if system_prompt else None
+            if cached_content_name:
+                try:
+                    response = await self.client.aio.models.generate_content(
+                        model=model,
+                        config=types.GenerateContentConfig(
+                            cached_content=cached_content_name,
+                            response_mime_type=response_mime_type,
+                            response_schema=response_schema,
+                        ),
+                        contents=contents,
+                    )
+                    return self.to_llm_response(response, model)
+                except genai_errors.ClientError as e:
+                    # cache 가 만료되었거나 삭제된 경우에만, 해당 cache 를 버리고 system prompt 를 직접 보내 다시 호출한다.
+                    # 429 등 그 밖의 오류는 rate limit 에 집계되지 않는 호출을 더 보내지 않도록 호출한 쪽의 재시도에 맡긴다.
+                    if not self.is_cached_content_missing(e):
+                        raise
+                    logger.warning(f"Gemini context cache 를 찾을 수 없어 cache 없이 재호출합니다: {e}")
+                    self.cached_contents.pop((model, sha256_hex(system_prompt)), None)
+
+            response = await self.client.aio.models.generate_content(
+                model=model,
+                config=types.GenerateContentConfig(
+                    system_instruction=system_prompt,
+                    response_mime_type=response_mime_type,
+                    response_schema=response_schema,
+                ),
+                contents=contents,
+            )
+            return self.to_llm_response(response, model)
+        except Exception as e:
+            logger.error(f"Gemini API call failed: {e}")
+            raise Exception("Gemini API 호출 실패: " + str(e)) from e
+
+    @staticmethod
+    def is_cached_content_missing(error: genai_errors.ClientError) -> bool:
+        """cached content 가 만료되었거나 삭제되어 찾을 수 없다는 오류인지 확인합니다."""
+        if error.code == 404:
+            return True
+        # 만료된 cache 는 "CachedContent not found (or permission denied)" 메시지의 403/400 으로 오기도 한다.
+        return error.code in (400, 403) and "cachedcontent" in (error.message or "").replace(" ", "").lower()
+
+    @staticmethod
+    def is_cache_unsupported(error: Exception) -> bool:
+        """
+        cache 생성 실패가 다시 시도해도 성공하지 않는 오류인지 확인합니다.
+        모델이 context caching 을 지원하지 않거나(404) prompt 가 최소 토큰 수보다 작은 경우(400 INVALID_ARGUMENT)입니다.
+        """
+        return isinstance(error, genai_errors.ClientError) and error.code in (400, 404)
+
+    async def get_cached_content(self, model: str, system_prompt: str) -> str | None:
+        """
+        system prompt 에 해당하는 Gemini context cache 이름을 반환합니다. 없거나 만료되었다면 새로 생성합니다.
+        모델이 context caching 을 지원하지 않거나 prompt 가 최소 토큰 수보다 작아 생성에 실패한 경우,
+        같은 prompt 에 대해서는 다시 시도하지 않고 None 을 반환합니다.
+        timeout, 429, 5xx 처럼 일시적인 오류로 실패한 경우에는 잠시 뒤의 호출에서 다시 생성을 시도합니다.
+        """
+        if not EnvVariables.GEMINI_CONTEXT_CACHE:
+            return None
+
+        cache_key = (model, sha256_hex(system_prompt))
+        async with self.cache_lock:
+            return await self._get_or_create_cached_content(cache_key, model, system_prompt)
+
+    async def _get_or_create_cached_content(self, cache_key: Tuple[str, str], model: str, system_prompt: str) -> str | None:
+        if cache_key in self.uncacheable_prompts or self.cache_retry_after.get(cache_key, 0) > time.monotonic():
+            return None
+
+        cached = self.cached_contents.get(cache_key)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+
+        ttl_seconds = EnvVariables.GEMINI_CONTEXT_CACHE_TTL_SECONDS
+        try:
+            cached_content = await self.client.aio.caches.create(
+                model=model,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=system_prompt,
+                    display_name=f"tag-catalog-{cache_key[1][:12]}",
+                    ttl=f"{ttl_seconds}s",
+                ),
+            )
+        except Exception as e:
+            if self.is_cache_unsupported(e):
+                logger.warning(f"Gemini context cache 를 사용할 수 없어 system prompt 를 직접 전달합니다: {e}")
+                self.uncacheable_prompts.add(cache_key)
+            else:
+                logger.warning(
+                    f"Gemini context cache 생성 실패, {_CACHE_CREATE_RETRY_SECONDS}s 동안 system prompt 를 직접 전달합니다: {e}"
+                )
+                self.cache_retry_after[cache_key] = time.monotonic() + _CACHE_CREATE_RETRY_SECONDS
+            return None
+
+        self.cache_retry_after.pop(cache_key, None)
+
+        # 만료 직전의 cache 를 사용하지 않도록 여유 시간을 두고 갱신한다.
+        expires_at = time.monotonic() + max(ttl_seconds - 60, ttl_seconds / 2)
+        self.cached_contents[cache_key] = (cached_content.name, expires_at)
+        logger.info(f"Gemini context cache 생성: {cached_content.name} (ttl={ttl_seconds}s)")
+        return cached_content.name
+
+    @staticmethod
+    def to_gemini_schema(json_schema: dict) -> types.Schema:
+        """
+        JSON schema 를 Gemini response_schema 로 변환합니다.
+        Gemini 가 지원하지 않는 키워드(uniqueItems 등)는 제외하며, 응답 검증 단계에서 다시 확인합니다.
+        """
+        schema = types.Schema(type=json_schema.get("type", "object").upper())
+        if "enum" in json_schema:
+            schema.enum = [str(value) for value in json_schema["enum"]]
+        if "items" in json_schema:
+            schema.items = GeminiProvider.to_gemini_schema(json_schema["items"])
+        if "properties" in json_schema:
+            schema.properties = {
+                key: GeminiProvider.to_gemini_schema(value) for key, value in json_schema["properties"].items()
+            }
+            # 배치 응답의 id 순서대로 생성되도록 한다.
+            schema.property_ordering = list(json_schema["properties"])
+        if "required" in json_schema:
+            schema.required = list(json_schema["required"])
+        if "minItems" in json_schema:
+            schema.min_items = json_schema["minItems"]
+        if "maxItems" in json_schema:
+            schema.max_items = json_schema["maxItems"]
+        if "minimum" in json_schema:
+            schema.minimum = json_schema["minimum"]
+        if "maximum" in json_schema:
+            schema.maximum = json_schema["maximum"]
+        return schema
+
+    @staticmethod
+    def to_llm_response(response, model: str) -> LLMResponse:
+        usage_metadata = response.usage_metadata
+        return LLMResponse(
+            text=response.text,
+            model=model,
+            usage=LLMUsage(
+                prompt_tokens=(usage_metadata.prompt_token_count or 0) if usage_metadata else 0,
+                completion_tokens=(usage_metadata.candidates_token_count or 0) if usage_metadata else 0,
+            ),
+        )
@@ -0,0 +1,93 @@
+import asyncio
+import json
+import random
+from typing import Any, Dict, List, Optional
+
+from app.clients.llm_providers.base import LLMProvider, LLMResponse, LLMUsage
+from app.core.config import EnvVariables
+from app.util.hash_utils import sha256_hex
+from app.util.token_utils import estimate_tokens
+
+
+class MockProvider(LLMProvider):
+    """
+    네트워크나 모델 없이 pipeline 을 부하 테스트하기 위한 로컬 mock provider.
+
+    - 같은 입력(messages, model)에는 항상 같은 응답을 반환합니다. (입력 hash 를 seed 로 사용)
+    - json_schema 가 주어지면 (LLM_STRUCTURED_OUTPUT 이 꺼져 있어도) schema 에 맞는 JSON 을, 없으면 입력 hash 가 담긴 한 문장을 반환합니다.
+    - 호출마다 MOCK_LLM_LATENCY_MS (± MOCK_LLM_LATENCY_JITTER_MS) 만큼 지연한 뒤 응답합니다.
+    """
+
+    name = "mock"
+    always_use_json_schema = True
+
+    def __init__(self,
+                 default_model: str | None = None,
+                 latency_ms: int | None = None,
+                 latency_jitter_ms: int | None = None):
+        super().__init__(default_model or "mock")
+        self.latency_ms = EnvVariables.MOCK_LLM_LATENCY_MS if latency_ms is None else latency_ms
+        self.latency_jitter_ms = EnvVariables.MOCK_LLM_LATENCY_JITTER_MS if latency_jitter_ms is None else latency_jitter_ms
+
+    async def _chat(self,
+                    messages: List[Dict[str, str]],
+                    model: str | None,
+                    json_mode: bool,
+                    json_schema: Optional[dict]) -> LLMResponse:
+        seed = sha256_hex(json.dumps([model, messages], ensure_ascii=False))
+        rng = random.Random(seed)
+
+        latency_ms = self.latency_ms + rng.uniform(-self.latency_jitter_ms, self.latency_jitter_ms)
+        if latency_ms > 0:
+            await asyncio.sleep(latency_ms / 1000)
+
+        if json_schema is not None:
+            text = json.dumps(self.build_value_from_schema(json_schema, rng), ensure_ascii=False)
+        elif json_mode:
+            text = json.dumps({"mock": seed[:12]})
+        else:
+            text = f"오늘은 mock 응답 {seed[:8]} 한 정보들이 주로 나왔네요! 전반적으로 테스트 한 분위기 인 듯해요!"
+
+        return LLMResponse(
+            text=text,
+            model=model,
+            usage=LLMUsage(
+                prompt_tokens=sum(estimate_tokens(m["content"]) for m in messages),
+                completion_tokens=estimate_tokens(text),
+            ),
+        )
+
+    @staticmethod
+    def build_value_from_schema(schema: dict, rng: random.Random) -> Any:
+        """JSON schema 의 type, enum, properties, items, minimum/maximum, minItems/maxItems 를 따르는 값을 생성합니다."""
+        if "enum" in schema:
+            return rng.choice(schema["enum"])
+
+        schema_type = schema.get("type", "object")
+        if schema_type == "object":
+            properties = schema.get("properties", {})
+            return {
+                key: MockProvider.build_value_from_schema(value_schema, rng)
+                for key, value_schema in properties.items()
+            }
+        if schema_type == "array":
+            item_schema = schema.get("items", {"type": "string"})
+            min_items = schema.get("minItems", 0)
+            max_items = schema.get("maxItems", max(min_items, 3))
+            count = rng.randint(min_items, max_items)
+            if "enum" in item_schema and schema.get("uniqueItems"):
+                return rng.sample(item_schema["enum"], min(count, len(item_schema["enum"])))
+            items = [MockProvider.build_value_from_schema(item_schema, rng) for _ in range(count)]
+            # 배치 응답의 id 처럼 enum 값이 항목 수만큼 있는 속성은 항목마다 서로 다른 값을 갖도록 한다.
+            for key, value_schema in item_schema.get("properties", {}).items():
+                if len(value_schema.get("enum", [])) >= count > 0:
+                    for item, value in zip(items, rng.sample(value_schema["enum"], count)):
+                        item[key] = value
+            return items
+        if schema_type == "integer":
+            return rng.randint(schema.get("minimum", 0), schema.get("maximum", 100))
+        if schema_type == "number":
+            return round(rng.uniform(schema.get("minimum", 0), schema.get("maximum", 1)), 3)
+        if schema_type == "boolean":
+            return rng.random() < 0.5
+        return f"mock-{rng.getrandbits(32):08x}"
@@ -0,0 +1,48 @@
+import logging
+from typing import Dict, List, Optional
+
+import ollama
+
+from app.clients.llm_providers.base import LLMProvider, LLMResponse, LLMUsage
+from app.core.config import EnvVariables
+
+logger = logging.getLogger(__name__)
+
+
+class OllamaProvider(LLMProvider):
+    """
+    Ollama 서버를 호출하는 provider. (기본 모델: OLLAMA_MODEL)
+    ollama.AsyncClient 는 백그라운드 이벤트 루프에서 처음 호출될 때 만들어 재사용합니다.
+    """
+
+    name = "ollama"
+
+    def __init__(self, default_model: str | None = None):
+        super().__init__(default_model or EnvVariables.OLLAMA_MODEL)
+        self.client: ollama.AsyncClient | None = None
+
+    async def _chat(self,
+                    messages: List[Dict[str, str]],
+                    model: str | None,
+                    json_mode: bool,
+                    json_schema: Optional[dict]) -> LLMResponse:
+        if not model:
+            raise Exception("OLLAMA_MODEL 환경 변수가 설정되지 않았습니다.")
+        if self.client is None:
+            self.client = ollama.AsyncClient()
+
+        # format 에 JSON schema 를 넘기면 Ollama 가 schema 를 따르는 응답만 생성한다. (structured outputs)
+        response_format = json_schema if json_schema is not None else ("json" if json_mode else None)
+        llm_resp = await self.client.chat(model=model, messages=messages, format=response_format)
+        try:
+            return LLMResponse(
+                text=llm_resp["message"]["content"],
+                model=model,
+                usage=LLMUsage(
+                    prompt_tokens=llm_resp.get("prompt_eval_count") or 0,
+                    completion_tokens=llm_resp.get("eval_count") or 0,
+                ),
+            )
+        except Exception as e:
+            logger.error(f"Ollama call failed: {e}")
+            raise Exception("Ollama 호출 실패: " + str(e)) from e
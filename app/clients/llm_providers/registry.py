@@ -0,0 +1,56 @@
+import threading
+from typing import Callable, Dict
+
+from app.clients.llm_providers.base import LLMProvider
+from app.core.config import EnvVariables
+
+# provider 이름 → provider 를 생성하는 함수. 실제 provider 모듈(및 SDK)은 처음 사용할 때 import 한다.
+_provider_factories: Dict[str, Callable[[], LLMProvider]] = {}
+_providers: Dict[str, LLMProvider] = {}
+_lock = threading.Lock()
+
+
+def register_provider(name: str, factory: Callable[[], LLMProvider]) -> None:
+    """provider 를 이름으로 등록합니다. 이미 생성된 같은 이름의 provider 가 있다면 교체됩니다."""
+    with _lock:
+        _provider_factories[name.lower()] = factory
+        _providers.pop(name.lower(), None)
+
+
+def get_provider(name: str | None = None) -> LLMProvider:
+    """
+    이름에 해당하는 프로세스 공용 provider 를 반환합니다. (기본값: LLM_PROVIDER)
+
+    Raises:
+        Exception: 등록되지 않은 provider 인 경우
+    """
+    name = (name or EnvVariables.LLM_PROVIDER).lower()
+    with _lock:
+        provider = _providers.get(name)
+        if provider is None:
+            factory = _provider_factories.get(name)
+            if factory is None:
+                raise Exception(f"지원하지 않는 LLM provider: {name} (사용 가능: {', '.join(sorted(_provider_factories))})")
+            provider = factory()
+            _providers[name] = provider
+        return provider
+
+
+def _ollama_provider() -> LLMProvider:
+    from app.clients.llm_providers.ollama_provider import OllamaProvider
+    return OllamaProvider()
+
+
+def _gemini_provider() -> LLMProvider:
+    from app.clients.llm_providers.gemini_provider import GeminiProvider
+    return GeminiProvider()
+
+
+def _mock_provider() -> LLMProvider:
+    from app.clients.llm_providers.mock_provider import MockProvider
+    return MockProvider()
+
+
+register_provider("ollama", _ollama_provider)
+register_provider("gemini", _gemini_provider)
+register_provider("mock", _mock_provider)
@@ -17,17 +17,87 @@ class EnvVariables:
 
     FEED_API_BASE_URL = os.getenv("FEED_API_BASE_URL")
     FEED_API_KEY = os.getenv("FEED_API_KEY")
+    FEED_API_CONNECT_TIMEOUT_SECONDS = float(os.getenv("FEED_API_CONNECT_TIMEOUT_SECONDS", "5"))
+    FEED_API_READ_TIMEOUT_SECONDS = float(os.getenv("FEED_API_READ_TIMEOUT_SECONDS", "30"))
+    FEED_API_MAX_CONNECTIONS = int(os.getenv("FEED_API_MAX_CONNECTIONS", "20"))
+    FEED_API_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("FEED_API_MAX_KEEPALIVE_CONNECTIONS", "10"))
+    FEED_API_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("FEED_API_KEEPALIVE_EXPIRY_SECONDS", "30"))
+    FEED_API_MAX_RETRIES = int(os.getenv("FEED_API_MAX_RETRIES", "3"))
+    FEED_API_RETRY_BACKOFF_SECONDS = float(os.getenv("FEED_API_RETRY_BACKOFF_SECONDS", "0.5"))
+    FEED_API_HTTP2 = os.getenv("FEED_API_HTTP2", "true").lower() == "true"
+    FEED_API_BULK_ROUTES = os.getenv("FEED_API_BULK_ROUTES", "false").lower() == "true"
+    FEED_API_BULK_CONCURRENCY = int(os.getenv("FEED_API_BULK_CONCURRENCY", "4"))
+    FEED_PAGE_SIZE = int(os.getenv("FEED_PAGE_SIZE", "200"))
+    FEED_PAGE_WINDOW_SECONDS = int(os.getenv("FEED_PAGE_WINDOW_SECONDS", str(24 * 60 * 60)))
 
     LLM_PROVIDER = os.getenv("LLM_PROVIDER", "ollama")
+    LLM_REQUEST_TIMEOUT_SECONDS = float(os.getenv("LLM_REQUEST_TIMEOUT_SECONDS", "120"))
+    LLM_STRUCTURED_OUTPUT = os.getenv("LLM_STRUCTURED_OUTPUT", "true").lower() == "true"
 
     HUGGING_FACE_TOKEN = os.getenv("HUGGING_FACE_TOKEN")
 
+    # PII NER
+    NER_MODEL_NAME = os.getenv("NER_MODEL_NAME", "Leo97/KoELECTRA-small-v3-modu-ner")
+    NER_MODEL_DIR = os.getenv("NER_MODEL_DIR")
+    NER_BACKEND = os.getenv("NER_BACKEND", "torch")
+    NER_ONNX_DIR = os.getenv("NER_ONNX_DIR", ".cache/ner_onnx")
+    NER_WARMUP_ON_STARTUP = os.getenv("NER_WARMUP_ON_STARTUP", "false").lower() == "true"
+    NER_BATCH_SIZE = int(os.getenv("NER_BATCH_SIZE", "16"))
+    NER_MAX_CHUNK_CHARS = int(os.getenv("NER_MAX_CHUNK_CHARS", "256"))
+
     OLLAMA_MODEL = os.getenv("OLLAMA_MODEL")
 
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
     GEMINI_API_URL = os.getenv("GEMINI_API_URL")
+    GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.0-flash-lite")
+    GEMINI_CONTEXT_CACHE = os.getenv("GEMINI_CONTEXT_CACHE", "false").lower() == "true"
+    GEMINI_CONTEXT_CACHE_TTL_SECONDS = int(os.getenv("GEMINI_CONTEXT_CACHE_TTL_SECONDS", "3600"))
+
+    # mock LLM provider (LLM_PROVIDER=mock / SPOTLIGHT_LLM_PROVIDER=mock)
+    MOCK_LLM_LATENCY_MS = int(os.getenv("MOCK_LLM_LATENCY_MS", "200"))
+    MOCK_LLM_LATENCY_JITTER_MS = int(os.getenv("MOCK_LLM_LATENCY_JITTER_MS", "0"))
 
     LLM_API_REQUESTS_PER_MINUTE = int(os.getenv("LLM_API_REQUESTS_PER_MINUTE", "15"))
+    # provider 별 분당 요청 수(rpm)/토큰 수(tpm) 한도. 예: {"gemini": {"rpm": 15, "tpm": 1000000}, "ollama": {}}
+    LLM_RATE_LIMITS = json.loads(os.getenv("LLM_RATE_LIMITS", "{}"))
+
+    # Tag assignment pipeline
+    LLM_TAG_BATCH_SIZE = int(os.getenv("LLM_TAG_BATCH_SIZE", "10"))
+    TAG_PIPELINE_MASK_WORKERS = int(os.getenv("TAG_PIPELINE_MASK_WORKERS", "1"))
+    TAG_PIPELINE_LLM_WORKERS = int(os.getenv("TAG_PIPELINE_LLM_WORKERS", "4"))
+    TAG_PIPELINE_WRITE_WORKERS = int(os.getenv("TAG_PIPELINE_WRITE_WORKERS", "4"))
+    TAG_PIPELINE_WRITE_BATCH_SIZE = int(os.getenv("TAG_PIPELINE_WRITE_BATCH_SIZE", "20"))
+    TAG_PIPELINE_SEGMENT_SIZE = int(os.getenv("TAG_PIPELINE_SEGMENT_SIZE", "500"))
+    TAG_PIPELINE_QUEUE_SIZE = int(os.getenv("TAG_PIPELINE_QUEUE_SIZE", "32"))
+
+    # Tag catalog cache (get_all_tags)
+    TAG_CATALOG_CACHE_TTL_SECONDS = int(os.getenv("TAG_CATALOG_CACHE_TTL_SECONDS", "300"))
+
+    # Tag assignment cache
+    TAG_ASSIGNMENT_CACHE = os.getenv("TAG_ASSIGNMENT_CACHE", "true").lower() == "true"
+    TAG_ASSIGNMENT_CACHE_TTL_SECONDS = int(os.getenv("TAG_ASSIGNMENT_CACHE_TTL_SECONDS", str(30 * 24 * 60 * 60)))
+    TAG_ASSIGNMENT_CACHE_MAX_ENTRIES = int(os.getenv("TAG_ASSIGNMENT_CACHE_MAX_ENTRIES", "100000"))
+
+    # Near-duplicate detection (tag assignment, spotlight score)
+    NEAR_DUPLICATE_DEDUP = os.getenv("NEAR_DUPLICATE_DEDUP", "true").lower() == "true"
+    NEAR_DUPLICATE_MAX_DISTANCE = int(os.getenv("NEAR_DUPLICATE_MAX_DISTANCE", "5"))
+    NEAR_DUPLICATE_MIN_CHARS = int(os.getenv("NEAR_DUPLICATE_MIN_CHARS", "30"))
+
+    # Local tag pre-classifier (TF-IDF + linear model, optional scikit-learn)
+    TAG_PRECLASSIFIER = os.getenv("TAG_PRECLASSIFIER", "false").lower() == "true"
+    TAG_PRECLASSIFIER_MODEL_PATH = os.getenv("TAG_PRECLASSIFIER_MODEL_PATH", ".cache/tag_preclassifier.pkl")
+    TAG_PRECLASSIFIER_THRESHOLD = float(os.getenv("TAG_PRECLASSIFIER_THRESHOLD", "0.9"))
+
+    # Spotlight
+    SPOTLIGHT_LLM_PROVIDER = os.getenv("SPOTLIGHT_LLM_PROVIDER", "ollama")
+    SPOTLIGHT_LLM_MODEL = os.getenv("SPOTLIGHT_LLM_MODEL", "mistral")
+    SPOTLIGHT_SCORE_CONCURRENCY = int(os.getenv("SPOTLIGHT_SCORE_CONCURRENCY", "4"))
+    SPOTLIGHT_SCORE_BATCH_SIZE = int(os.getenv("SPOTLIGHT_SCORE_BATCH_SIZE", "10"))
+    SPOTLIGHT_SCORE_BATCH_TOKEN_BUDGET = int(os.getenv("SPOTLIGHT_SCORE_BATCH_TOKEN_BUDGET", "3000"))
+    SPOTLIGHT_SUMMARY_CHUNK_TOKEN_BUDGET = int(os.getenv("SPOTLIGHT_SUMMARY_CHUNK_TOKEN_BUDGET", "3000"))
+    SPOTLIGHT_SUMMARY_CONCURRENCY = int(os.getenv("SPOTLIGHT_SUMMARY_CONCURRENCY", "4"))
+    SPOTLIGHT_JOB_WORKERS = int(os.getenv("SPOTLIGHT_JOB_WORKERS", "1"))
+    SPOTLIGHT_JOB_RETENTION_SECONDS = int(os.getenv("SPOTLIGHT_JOB_RETENTION_SECONDS", "3600"))
 
     SAMPLE_TAGS = json.loads(os.getenv("SAMPLE_TAGS", "[]"))
     SAMPLE_MESSAGES = json.loads(os.getenv("SAMPLE_MESSAGES", "[]"))
@@ -3,6 +3,7 @@ import logging
 from fastapi import FastAPI
 
 from app.api.router import api_router
+from app.core.config import EnvVariables
 
 
 logging.basicConfig(
@@ -15,6 +16,21 @@ app = FastAPI(title="Handong Feed Spotlight API")
 
 app.include_router(api_router, prefix="/api")
 
+
+@app.on_event("startup")
+def warm_up_ner_model():
+    # NER 모델은 기본적으로 처음 마스킹할 때 불러오며, 설정 시에만 서버 시작 시 미리 불러온다.
+    if EnvVariables.NER_WARMUP_ON_STARTUP:
+        from app.util.ner_provider import ner_provider_singleton
+        ner_provider_singleton.warm_up()
+
+
+@app.on_event("shutdown")
+def close_feed_app_client():
+    from app.clients.handong_feed_app_client import handong_feed_app_client_singleton
+    handong_feed_app_client_singleton.close()
+
+
 @app.get("/")
 def root():
     return {"message": "Welcome to Handong Feed Spotlight API"}
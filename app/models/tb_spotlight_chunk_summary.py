@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, DateTime, Text, UniqueConstraint
+from app.util.date_utils import get_seoul_time
+from app.core.database import Base
+
+class TbSpotlightChunkSummary(Base):
+    __tablename__ = "TbSpotlightChunkSummary"
+    __table_args__ = (
+        # (chunk_hash, prompt_version, model) 기반 부분 요약 캐시 키
+        UniqueConstraint("chunk_hash", "prompt_version", "model", name="uq_TbSpotlightChunkSummary_cache_key"),
+    )
+
+    id = Column(String(32), primary_key=True)
+    chunk_hash = Column(String(64), nullable=False)     # 요약한 메시지 묶음(chunk) 본문의 SHA-256 해시
+    prompt_version = Column(String(32), nullable=False) # 요약 생성에 사용한 프롬프트 버전
+    model = Column(String(64), nullable=False)          # 요약 생성에 사용한 LLM 모델명
+    summary = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=get_seoul_time)
@@ -1,12 +1,21 @@
-from sqlalchemy import Column, String, Integer, DateTime, Date
+from sqlalchemy import Column, String, Integer, DateTime, Date, Index, UniqueConstraint
 from app.util.date_utils import get_seoul_time
 from app.core.database import Base
 
 class TbSpotlightScore(Base):
     __tablename__ = "TbSpotlightScore"
+    __table_args__ = (
+        # 메시지별로 날짜당 하나의 점수만 저장 (save_scores 의 upsert 기준)
+        UniqueConstraint("tb_ka_message_id", "for_date", name="uq_TbSpotlightScore_message_date"),
+        # (message_hash, prompt_version, model) 기반 점수 캐시 조회용 인덱스
+        Index("ix_TbSpotlightScore_score_cache_key", "message_hash", "prompt_version", "model"),
+    )
 
     id = Column(String(32), primary_key=True)
     tb_ka_message_id = Column(String(32), nullable=False)
     score = Column(Integer, nullable=False)
     for_date = Column(Date, nullable=False)
+    message_hash = Column(String(64), nullable=True)    # 점수를 매긴 메시지 본문의 SHA-256 해시
+    prompt_version = Column(String(32), nullable=True)  # 점수 생성에 사용한 프롬프트 버전
+    model = Column(String(64), nullable=True)           # 점수 생성에 사용한 LLM 모델명
     created_at = Column(DateTime, default=get_seoul_time)
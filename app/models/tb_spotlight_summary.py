@@ -8,4 +8,5 @@ class TbSpotlightSummary(Base):
     id = Column(String(32), primary_key=True)
     summary = Column(Text, nullable=False)
     for_date = Column(Date, nullable=False)
+    message_set_hash = Column(String(64), nullable=True)    # summary 생성 시점에 점수가 매겨진 메시지 id 집합의 해시
     created_at = Column(DateTime, default=get_seoul_time)
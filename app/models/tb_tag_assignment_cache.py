@@ -0,0 +1,22 @@
+from sqlalchemy import Column, String, Integer, DateTime, Text, Index, UniqueConstraint
+from app.util.date_utils import get_seoul_time
+from app.core.database import Base
+
+class TbTagAssignmentCache(Base):
+    __tablename__ = "TbTagAssignmentCache"
+    __table_args__ = (
+        # (message_hash, catalog_hash, model) 기반 태그 할당 캐시 키
+        UniqueConstraint("message_hash", "catalog_hash", "model", name="uq_TbTagAssignmentCache_cache_key"),
+        # LRU 삭제 대상 조회용 인덱스
+        Index("ix_TbTagAssignmentCache_last_hit_at", "last_hit_at"),
+    )
+
+    id = Column(String(32), primary_key=True)
+    message_hash = Column(String(64), nullable=False)   # 태그를 할당한 정제된 메시지(cleaned_message)의 SHA-256 해시
+    catalog_hash = Column(String(64), nullable=False)   # 태그 할당에 사용한 태그 목록의 해시 (TagDto.compute_catalog_hash)
+    model = Column(String(64), nullable=False)          # 태그 할당에 사용한 "provider/모델명"
+    tag_codes = Column(Text, nullable=False)            # 할당된 태그 코드 배열 (JSON 문자열)
+    message = Column(Text, nullable=True)               # 정제된 메시지 (태그 사전 분류 모델 학습 데이터로 사용)
+    hit_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=get_seoul_time)   # TTL 기준 시각
+    last_hit_at = Column(DateTime, default=get_seoul_time)  # LRU 기준 시각 (저장 또는 마지막 조회 시각)
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, String, Integer, Date, DateTime, Text, UniqueConstraint
+from app.util.date_utils import get_seoul_time
+from app.core.database import Base
+
+class TbTagBackfillCheckpoint(Base):
+    __tablename__ = "TbTagBackfillCheckpoint"
+    __table_args__ = (
+        # 한 backfill 실행(run_id) 안에서 shard 는 시작 날짜로 구분한다.
+        UniqueConstraint("run_id", "shard_start", name="uq_TbTagBackfillCheckpoint_run_shard"),
+    )
+
+    id = Column(String(32), primary_key=True)
+    run_id = Column(String(64), nullable=False)             # backfill 실행 식별자 (같은 run_id 로 다시 실행하면 이어서 처리)
+    shard_start = Column(Date, nullable=False)              # shard 시작 날짜 (포함)
+    shard_end = Column(Date, nullable=False)                # shard 종료 날짜 (포함)
+    status = Column(String(16), nullable=False)             # pending / running / done / failed
+    feed_count = Column(Integer, nullable=False, default=0)         # 처리한 피드 수
+    succeeded_count = Column(Integer, nullable=False, default=0)    # 태그 할당에 성공한 피드 수
+    attempts = Column(Integer, nullable=False, default=0)           # 처리를 시작한 횟수
+    error_message = Column(Text, nullable=True)             # 마지막 실패 시 에러 메시지
+    started_at = Column(DateTime, nullable=True)            # 마지막으로 처리를 시작한 시각
+    finished_at = Column(DateTime, nullable=True)           # 처리를 마친(성공 또는 실패) 시각
+    created_at = Column(DateTime, default=get_seoul_time)
+    updated_at = Column(DateTime, default=get_seoul_time, onupdate=get_seoul_time)
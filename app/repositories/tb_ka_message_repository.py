@@ -8,7 +8,7 @@ class TbKaMessageRepository:
         self.db = db
 
     def get_messages_by_date(self, target_date: str):
-        """last_sent_at 이 target_date인 메세지 데이터를 조회"""
+        """last_sent_at 이 target_date인 메세지 데이터를 last_sent_at 순으로 조회"""
 
         query = text("""
             SELECT id, message
@@ -17,10 +17,38 @@ class TbKaMessageRepository:
               AND threshold < distance
               AND last_sent_at >= UNIX_TIMESTAMP(:target_date)
               AND last_sent_at < UNIX_TIMESTAMP(DATE_ADD(:target_date_next, INTERVAL 1 DAY))
+            ORDER BY last_sent_at, id
         """)
         result = self.db.execute(query, {
             "target_date": target_date,
             "target_date_next": target_date
         })
 
-        return result.mappings().all()
\ No newline at end of file
+        return result.mappings().all()
+
+    def get_unscored_messages_by_date(self, target_date: str):
+        """
+        last_sent_at 이 target_date인 메세지 중 target_date 의 TbSpotlightScore 가 아직 없는 메세지 데이터를 조회.
+        점수 생성에 실패한 (-1) row 만 있는 메세지도 다시 점수를 매길 수 있도록 함께 조회합니다.
+        """
+
+        query = text("""
+            SELECT m.id, m.message
+            FROM TbKaMessage m
+            LEFT JOIN TbSpotlightScore s
+              ON s.tb_ka_message_id = m.id
+             AND s.for_date = :target_date
+             AND s.score >= 0
+            WHERE m.deleted != 'Y'
+              AND m.threshold < m.distance
+              AND m.last_sent_at >= UNIX_TIMESTAMP(:target_date)
+              AND m.last_sent_at < UNIX_TIMESTAMP(DATE_ADD(:target_date_next, INTERVAL 1 DAY))
+              AND s.id IS NULL
+            ORDER BY m.last_sent_at, m.id
+        """)
+        result = self.db.execute(query, {
+            "target_date": target_date,
+            "target_date_next": target_date
+        })
+
+        return result.mappings().all()
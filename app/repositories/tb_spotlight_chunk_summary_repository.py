@@ -0,0 +1,61 @@
+import uuid
+from typing import Dict, List
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+
+from app.models.tb_spotlight_chunk_summary import TbSpotlightChunkSummary
+from app.util.date_utils import get_seoul_time
+
+# IN 절에 한 번에 넣을 최대 파라미터 수
+_IN_CLAUSE_CHUNK_SIZE = 500
+
+
+class SpotlightChunkSummaryRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def find_summaries(self, chunk_hashes: List[str], prompt_version: str, model: str) -> Dict[str, str]:
+        """
+        (chunk_hash, prompt_version, model) 이 일치하는 부분 요약을 조회하여 {chunk_hash: summary} 로 반환합니다.
+        """
+        unique_hashes = list(set(chunk_hashes))
+        summaries: Dict[str, str] = {}
+
+        for i in range(0, len(unique_hashes), _IN_CLAUSE_CHUNK_SIZE):
+            rows = (
+                self.db.query(TbSpotlightChunkSummary.chunk_hash, TbSpotlightChunkSummary.summary)
+                .filter(
+                    TbSpotlightChunkSummary.chunk_hash.in_(unique_hashes[i:i + _IN_CLAUSE_CHUNK_SIZE]),
+                    TbSpotlightChunkSummary.prompt_version == prompt_version,
+                    TbSpotlightChunkSummary.model == model,
+                )
+                .all()
+            )
+            summaries.update({chunk_hash: summary for chunk_hash, summary in rows})
+
+        return summaries
+
+    def save_summaries(self, summaries: Dict[str, str], prompt_version: str, model: str) -> None:
+        """
+        {chunk_hash: summary} 형태의 부분 요약들을 INSERT ... ON DUPLICATE KEY UPDATE 한 문장으로 저장합니다.
+        """
+        if not summaries:
+            return
+
+        created_at = get_seoul_time()
+        rows = [
+            {
+                "id": uuid.uuid4().hex,
+                "chunk_hash": chunk_hash,
+                "prompt_version": prompt_version,
+                "model": model,
+                "summary": summary,
+                "created_at": created_at,
+            }
+            for chunk_hash, summary in summaries.items()
+        ]
+
+        insert_stmt = mysql_insert(TbSpotlightChunkSummary)
+        upsert_stmt = insert_stmt.on_duplicate_key_update(summary=insert_stmt.inserted.summary)
+        self.db.execute(upsert_stmt, rows)
+        self.db.commit()
@@ -1,35 +1,121 @@
 import uuid
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional, Set
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.orm import Session
 
 from app.models.tb_spotlight_score import TbSpotlightScore
 from app.util.date_utils import get_seoul_time
 from app.schemas.spotlight_dto import SpotlightDto
-from app.core.database import Base
+
+# IN 절에 한 번에 넣을 최대 파라미터 수
+_IN_CLAUSE_CHUNK_SIZE = 500
 
 
 class SpotlightScoreRepository:
     def __init__(self, db: Session):
         self.db = db
-        Base.metadata.create_all(bind=self.db.get_bind())
 
-    def save_scores(self, scores: List[SpotlightDto.GenerateSpotlightScoreServDto], target_date: str) -> None:
+    def save_scores(self,
+                    scores: List[SpotlightDto.GenerateSpotlightScoreServDto],
+                    target_date: str,
+                    message_hashes: Optional[Dict[str, str]] = None,
+                    prompt_version: Optional[str] = None,
+                    model: Optional[str] = None) -> None:
         """
         주어진 스코어 DTO들을 TbSpotlightScore 테이블에 저장.
         target_date는 문자열 (예: "2025-03-17") 형식으로 전달되며, 이를 date 객체로 변환하여 저장.
+
+        (tb_ka_message_id, for_date) 유니크 키 기준의 INSERT ... ON DUPLICATE KEY UPDATE 한 문장으로 저장하므로,
+        같은 날짜에 이미 저장된 메시지는 새 row 를 만들지 않고 기존 row 의 점수와 캐시 키를 갱신합니다.
+        message_hashes 는 {tb_ka_message_id: message_hash} 형태로, 점수 캐시 조회에 사용할 키를 함께 저장합니다.
         """
+        if not scores:
+            return
 
         for_date_obj = datetime.strptime(target_date, "%Y-%m-%d").date()
+        message_hashes = message_hashes or {}
+        created_at = get_seoul_time()
+
+        rows = [
+            {
+                "id": uuid.uuid4().hex,
+                "tb_ka_message_id": score_dto.tb_ka_message_id,
+                "score": score_dto.score,
+                "for_date": for_date_obj,
+                "message_hash": message_hashes.get(score_dto.tb_ka_message_id),
+                "prompt_version": prompt_version,
+                "model": model,
+                "created_at": created_at,
+            }
+            for score_dto in scores
+        ]
 
-        for score_dto in scores:
-            new_score = TbSpotlightScore(
-                id=str(uuid.uuid4()).replace("-", "")[:32],
-                tb_ka_message_id=score_dto.tb_ka_message_id,
-                score=score_dto.score,
-                for_date=for_date_obj,
-                created_at=get_seoul_time()
+        insert_stmt = mysql_insert(TbSpotlightScore)
+        upsert_stmt = insert_stmt.on_duplicate_key_update(
+            score=insert_stmt.inserted.score,
+            message_hash=insert_stmt.inserted.message_hash,
+            prompt_version=insert_stmt.inserted.prompt_version,
+            model=insert_stmt.inserted.model,
+        )
+        self.db.execute(upsert_stmt, rows)
+        self.db.commit()
+
+    def find_cached_scores(self, message_hashes: List[str], prompt_version: str, model: str) -> Dict[str, int]:
+        """
+        (message_hash, prompt_version, model) 이 일치하는 기존 점수를 조회하여 {message_hash: score} 로 반환합니다.
+        점수 생성에 실패한 (-1) row 는 캐시로 사용하지 않습니다.
+        """
+        unique_hashes = list(set(message_hashes))
+        cached_scores: Dict[str, int] = {}
+
+        for i in range(0, len(unique_hashes), _IN_CLAUSE_CHUNK_SIZE):
+            rows = (
+                self.db.query(TbSpotlightScore.message_hash, TbSpotlightScore.score)
+                .filter(
+                    TbSpotlightScore.message_hash.in_(unique_hashes[i:i + _IN_CLAUSE_CHUNK_SIZE]),
+                    TbSpotlightScore.prompt_version == prompt_version,
+                    TbSpotlightScore.model == model,
+                    TbSpotlightScore.score >= 0,
+                )
+                .all()
             )
-            self.db.add(new_score)
+            for message_hash, score in rows:
+                cached_scores.setdefault(message_hash, score)
+
+        return cached_scores
+
+    def get_scores_by_date(self, target_date: str) -> List[SpotlightDto.GenerateSpotlightScoreServDto]:
+        """
+        target_date 에 저장된 점수를 조회합니다.
+        같은 메시지에 대해 여러 row 가 있다면 가장 최근에 저장된 점수를 사용합니다.
+        """
+        for_date_obj = datetime.strptime(target_date, "%Y-%m-%d").date()
+
+        rows = (
+            self.db.query(TbSpotlightScore)
+            .filter(TbSpotlightScore.for_date == for_date_obj)
+            .order_by(TbSpotlightScore.created_at)
+            .all()
+        )
+
+        latest_scores: Dict[str, int] = {}
+        for row in rows:
+            latest_scores[row.tb_ka_message_id] = row.score
+
+        return [
+            SpotlightDto.GenerateSpotlightScoreServDto(tb_ka_message_id=message_id, score=score)
+            for message_id, score in latest_scores.items()
+        ]
+
+    def get_scored_message_ids(self, target_date: str) -> Set[str]:
+        """target_date 에 점수가 저장된 메시지의 tb_ka_message_id 집합을 조회합니다."""
+        for_date_obj = datetime.strptime(target_date, "%Y-%m-%d").date()
 
-        self.db.commit()
\ No newline at end of file
+        rows = (
+            self.db.query(TbSpotlightScore.tb_ka_message_id)
+            .filter(TbSpotlightScore.for_date == for_date_obj)
+            .distinct()
+            .all()
+        )
+        return {message_id for (message_id,) in rows}
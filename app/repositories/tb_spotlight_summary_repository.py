@@ -1,21 +1,21 @@
 import uuid
 from datetime import datetime
+from typing import Optional
 from sqlalchemy.orm import Session
 
 from app.models.tb_spotlight_summary import TbSpotlightSummary
 from app.util.date_utils import get_seoul_time
-from app.core.database import Base
 
 class SpotlightSummaryRepository:
     def __init__(self, db: Session):
         self.db = db
-        Base.metadata.create_all(bind=self.db.get_bind())
 
 
-    def save_summary(self, summary: str, target_date: str) -> None:
+    def save_summary(self, summary: str, target_date: str, message_set_hash: Optional[str] = None) -> None:
         """
         주어진 summary 텍스트를 TbSpotlightSummary 테이블에 저장합니다.
         target_date는 문자열 (예: "2025-03-17") 형식으로 전달되며, 이를 date 객체로 변환하여 저장합니다.
+        message_set_hash 는 summary 생성 시점의 점수가 매겨진 메시지 집합 해시로, summary 재생성 여부 판단에 사용됩니다.
         """
 
         for_date_obj = datetime.strptime(target_date, "%Y-%m-%d").date()
@@ -24,7 +24,22 @@ class SpotlightSummaryRepository:
             id=str(uuid.uuid4()).replace("-", "")[:32],
             summary=summary,
             for_date=for_date_obj,
+            message_set_hash=message_set_hash,
             created_at=get_seoul_time()
         )
         self.db.add(new_summary)
-        self.db.commit()
\ No newline at end of file
+        self.db.commit()
+
+    def find_latest_summary(self, target_date: str) -> Optional[TbSpotlightSummary]:
+        """
+        target_date 에 저장된 summary 중 가장 최근에 저장된 summary 를 반환합니다. 없으면 None 을 반환합니다.
+        """
+
+        for_date_obj = datetime.strptime(target_date, "%Y-%m-%d").date()
+
+        return (
+            self.db.query(TbSpotlightSummary)
+            .filter(TbSpotlightSummary.for_date == for_date_obj)
+            .order_by(TbSpotlightSummary.created_at.desc())
+            .first()
+        )
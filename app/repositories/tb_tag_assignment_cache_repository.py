@@ -0,0 +1,162 @@
+import json
+import uuid
+from datetime import datetime
+from typing import Dict, List, Tuple
+from sqlalchemy import func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+
+from app.models.tb_tag_assignment_cache import TbTagAssignmentCache
+from app.util.date_utils import get_seoul_time
+
+# IN 절에 한 번에 넣을 최대 파라미터 수
+_IN_CLAUSE_CHUNK_SIZE = 500
+
+
+class TagAssignmentCacheRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def find_tag_codes(self,
+                       message_hashes: List[str],
+                       catalog_hash: str,
+                       model: str,
+                       created_after: datetime) -> Dict[str, List[str]]:
+        """
+        (message_hash, catalog_hash, model) 이 일치하고 created_after 이후에 저장된 태그 할당을 조회하여
+        {message_hash: tag_codes} 로 반환합니다. 조회된 row 는 last_hit_at 과 hit_count 를 갱신합니다. (LRU)
+        """
+        unique_hashes = list(set(message_hashes))
+        tag_codes_by_hash: Dict[str, List[str]] = {}
+
+        for i in range(0, len(unique_hashes), _IN_CLAUSE_CHUNK_SIZE):
+            rows = (
+                self.db.query(TbTagAssignmentCache.message_hash, TbTagAssignmentCache.tag_codes)
+                .filter(
+                    TbTagAssignmentCache.message_hash.in_(unique_hashes[i:i + _IN_CLAUSE_CHUNK_SIZE]),
+                    TbTagAssignmentCache.catalog_hash == catalog_hash,
+                    TbTagAssignmentCache.model == model,
+                    TbTagAssignmentCache.created_at >= created_after,
+                )
+                .all()
+            )
+            tag_codes_by_hash.update({message_hash: json.loads(tag_codes) for message_hash, tag_codes in rows})
+
+        hit_hashes = list(tag_codes_by_hash)
+        if hit_hashes:
+            last_hit_at = get_seoul_time()
+            for i in range(0, len(hit_hashes), _IN_CLAUSE_CHUNK_SIZE):
+                (
+                    self.db.query(TbTagAssignmentCache)
+                    .filter(
+                        TbTagAssignmentCache.message_hash.in_(hit_hashes[i:i + _IN_CLAUSE_CHUNK_SIZE]),
+                        TbTagAssignmentCache.catalog_hash == catalog_hash,
+                        TbTagAssignmentCache.model == model,
+                    )
+                    .update(
+                        {
+                            TbTagAssignmentCache.last_hit_at: last_hit_at,
+                            TbTagAssignmentCache.hit_count: TbTagAssignmentCache.hit_count + 1,
+                        },
+                        synchronize_session=False,
+                    )
+                )
+            self.db.commit()
+
+        return tag_codes_by_hash
+
+    def save_tag_codes(self,
+                       tag_codes_by_hash: Dict[str, List[str]],
+                       catalog_hash: str,
+                       model: str,
+                       messages_by_hash: Dict[str, str] | None = None) -> None:
+        """
+        {message_hash: tag_codes} 형태의 태그 할당을 INSERT ... ON DUPLICATE KEY UPDATE 한 문장으로 저장합니다.
+        이미 있는 키는 태그 코드와 생성 시각을 갱신하여 TTL 을 다시 시작합니다.
+        messages_by_hash 는 {message_hash: 정제된 메시지} 형태로, 태그 사전 분류 모델의 학습 데이터로 함께 저장합니다.
+        """
+        if not tag_codes_by_hash:
+            return
+
+        messages_by_hash = messages_by_hash or {}
+        created_at = get_seoul_time()
+        rows = [
+            {
+                "id": uuid.uuid4().hex,
+                "message_hash": message_hash,
+                "catalog_hash": catalog_hash,
+                "model": model,
+                "tag_codes": json.dumps(tag_codes, ensure_ascii=False),
+                "message": messages_by_hash.get(message_hash),
+                "hit_count": 0,
+                "created_at": created_at,
+                "last_hit_at": created_at,
+            }
+            for message_hash, tag_codes in tag_codes_by_hash.items()
+        ]
+
+        insert_stmt = mysql_insert(TbTagAssignmentCache)
+        upsert_stmt = insert_stmt.on_duplicate_key_update(
+            tag_codes=insert_stmt.inserted.tag_codes,
+            message=insert_stmt.inserted.message,
+            created_at=insert_stmt.inserted.created_at,
+            last_hit_at=insert_stmt.inserted.last_hit_at,
+        )
+        self.db.execute(upsert_stmt, rows)
+        self.db.commit()
+
+    def find_training_examples(self, model: str | None = None, limit: int | None = None) -> List[Tuple[str, List[str]]]:
+        """
+        메시지가 함께 저장된 태그 할당을 최근에 사용된 순으로 조회하여 (정제된 메시지, tag_codes) 목록으로 반환합니다.
+        같은 메시지가 여러 태그 목록/모델로 저장되어 있다면 가장 최근의 할당만 사용합니다.
+        """
+        query = (
+            self.db.query(TbTagAssignmentCache.message_hash, TbTagAssignmentCache.message, TbTagAssignmentCache.tag_codes)
+            .filter(TbTagAssignmentCache.message.isnot(None))
+        )
+        if model is not None:
+            query = query.filter(TbTagAssignmentCache.model == model)
+        query = query.order_by(TbTagAssignmentCache.last_hit_at.desc())
+        if limit is not None:
+            query = query.limit(limit)
+
+        examples: Dict[str, Tuple[str, List[str]]] = {}
+        for message_hash, message, tag_codes in query.all():
+            examples.setdefault(message_hash, (message, json.loads(tag_codes)))
+        return list(examples.values())
+
+    def count(self) -> int:
+        return self.db.query(func.count(TbTagAssignmentCache.id)).scalar() or 0
+
+    def delete_expired(self, created_before: datetime) -> int:
+        """created_before 이전에 저장된 (TTL 이 지난) row 를 삭제하고 삭제한 row 수를 반환합니다."""
+        deleted = (
+            self.db.query(TbTagAssignmentCache)
+            .filter(TbTagAssignmentCache.created_at < created_before)
+            .delete(synchronize_session=False)
+        )
+        self.db.commit()
+        return deleted
+
+    def delete_least_recently_used(self, max_entries: int) -> int:
+        """row 수가 max_entries 를 넘으면 last_hit_at 이 오래된 순으로 초과분을 삭제하고 삭제한 row 수를 반환합니다."""
+        overflow = self.count() - max_entries
+        if overflow <= 0:
+            return 0
+
+        ids = [
+            row_id for (row_id,) in (
+                self.db.query(TbTagAssignmentCache.id)
+                .order_by(TbTagAssignmentCache.last_hit_at.asc())
+                .limit(overflow)
+                .all()
+            )
+        ]
+        for i in range(0, len(ids), _IN_CLAUSE_CHUNK_SIZE):
+            (
+                self.db.query(TbTagAssignmentCache)
+                .filter(TbTagAssignmentCache.id.in_(ids[i:i + _IN_CLAUSE_CHUNK_SIZE]))
+                .delete(synchronize_session=False)
+            )
+        self.db.commit()
+        return len(ids)
@@ -0,0 +1,125 @@
+import uuid
+from datetime import date
+from typing import Dict, List, Tuple
+from sqlalchemy import func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+
+from app.models.tb_tag_backfill_checkpoint import TbTagBackfillCheckpoint
+from app.util.date_utils import get_seoul_time
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+class TagBackfillCheckpointRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create_shards(self, run_id: str, shards: List[Tuple[date, date]]) -> None:
+        """
+        (shard_start, shard_end) 목록을 pending 상태로 저장합니다.
+        이미 저장된 shard 는 상태와 처리 결과를 그대로 두므로, 같은 run_id 로 다시 실행하면 이어서 처리할 수 있습니다.
+        """
+        if not shards:
+            return
+
+        created_at = get_seoul_time()
+        rows = [
+            {
+                "id": uuid.uuid4().hex,
+                "run_id": run_id,
+                "shard_start": shard_start,
+                "shard_end": shard_end,
+                "status": STATUS_PENDING,
+                "feed_count": 0,
+                "succeeded_count": 0,
+                "attempts": 0,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+            for shard_start, shard_end in shards
+        ]
+
+        insert_stmt = mysql_insert(TbTagBackfillCheckpoint)
+        # 이미 있는 shard 는 아무것도 바꾸지 않는다.
+        upsert_stmt = insert_stmt.on_duplicate_key_update(run_id=TbTagBackfillCheckpoint.run_id)
+        self.db.execute(upsert_stmt, rows)
+        self.db.commit()
+
+    def reset_interrupted(self, run_id: str) -> int:
+        """이전 실행이 중단되어 running 으로 남은 shard 를 pending 으로 되돌리고 그 수를 반환합니다."""
+        updated = (
+            self.db.query(TbTagBackfillCheckpoint)
+            .filter(
+                TbTagBackfillCheckpoint.run_id == run_id,
+                TbTagBackfillCheckpoint.status == STATUS_RUNNING,
+            )
+            .update({TbTagBackfillCheckpoint.status: STATUS_PENDING}, synchronize_session=False)
+        )
+        self.db.commit()
+        return updated
+
+    def find_unfinished(self, run_id: str) -> List[TbTagBackfillCheckpoint]:
+        """아직 끝나지 않은(pending, failed) shard 를 날짜순으로 조회합니다."""
+        return (
+            self.db.query(TbTagBackfillCheckpoint)
+            .filter(
+                TbTagBackfillCheckpoint.run_id == run_id,
+                TbTagBackfillCheckpoint.status.in_([STATUS_PENDING, STATUS_FAILED]),
+            )
+            .order_by(TbTagBackfillCheckpoint.shard_start.asc())
+            .all()
+        )
+
+    def mark_running(self, checkpoint_id: str) -> None:
+        self._update(checkpoint_id, {
+            TbTagBackfillCheckpoint.status: STATUS_RUNNING,
+            TbTagBackfillCheckpoint.attempts: TbTagBackfillCheckpoint.attempts + 1,
+            TbTagBackfillCheckpoint.error_message: None,
+            TbTagBackfillCheckpoint.started_at: get_seoul_time(),
+            TbTagBackfillCheckpoint.finished_at: None,
+        })
+
+    def mark_done(self, checkpoint_id: str, feed_count: int, succeeded_count: int) -> None:
+        self._update(checkpoint_id, {
+            TbTagBackfillCheckpoint.status: STATUS_DONE,
+            TbTagBackfillCheckpoint.feed_count: feed_count,
+            TbTagBackfillCheckpoint.succeeded_count: succeeded_count,
+            TbTagBackfillCheckpoint.finished_at: get_seoul_time(),
+        })
+
+    def mark_failed(self, checkpoint_id: str, feed_count: int, succeeded_count: int, error_message: str) -> None:
+        self._update(checkpoint_id, {
+            TbTagBackfillCheckpoint.status: STATUS_FAILED,
+            TbTagBackfillCheckpoint.feed_count: feed_count,
+            TbTagBackfillCheckpoint.succeeded_count: succeeded_count,
+            TbTagBackfillCheckpoint.error_message: error_message,
+            TbTagBackfillCheckpoint.finished_at: get_seoul_time(),
+        })
+
+    def summarize(self, run_id: str) -> Dict[str, Tuple[int, int, int]]:
+        """{status: (shard 수, 처리한 피드 수, 태그 할당에 성공한 피드 수)} 를 반환합니다."""
+        rows = (
+            self.db.query(
+                TbTagBackfillCheckpoint.status,
+                func.count(TbTagBackfillCheckpoint.id),
+                func.coalesce(func.sum(TbTagBackfillCheckpoint.feed_count), 0),
+                func.coalesce(func.sum(TbTagBackfillCheckpoint.succeeded_count), 0),
+            )
+            .filter(TbTagBackfillCheckpoint.run_id == run_id)
+            .group_by(TbTagBackfillCheckpoint.status)
+            .all()
+        )
+        return {status: (int(shards), int(feeds), int(succeeded)) for status, shards, feeds, succeeded in rows}
+
+    def _update(self, checkpoint_id: str, values: dict) -> None:
+        values = {**values, TbTagBackfillCheckpoint.updated_at: get_seoul_time()}
+        (
+            self.db.query(TbTagBackfillCheckpoint)
+            .filter(TbTagBackfillCheckpoint.id == checkpoint_id)
+            .update(values, synchronize_session=False)
+        )
+        self.db.commit()
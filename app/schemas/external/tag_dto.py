@@ -1,7 +1,10 @@
+import json
 from datetime import datetime
 from pydantic import BaseModel
 from typing import Optional, List
 
+from app.util.hash_utils import sha256_hex
+
 
 class TagDto:
     class ReadResDto(BaseModel):
@@ -17,4 +20,13 @@ class TagDto:
     @staticmethod
     def extract_tag_codes(tags: List["TagDto.ReadResDto"]) -> List[str]:
         """주어진 TagDto.ReadResDto 리스트에서 각 태그의 'code' 필드만 추출하여 문자열 배열로 반환"""
-        return [tag.code for tag in tags]
\ No newline at end of file
+        return [tag.code for tag in tags]
+
+    @staticmethod
+    def compute_catalog_hash(tags: List["TagDto.ReadResDto"]) -> str:
+        """
+        태그 목록(code, label, llmDesc)의 SHA-256 해시를 반환.
+        태그가 추가/삭제되거나 선별 기준이 바뀌면 값이 달라지므로, 태그 할당 캐시 키로 사용합니다.
+        """
+        catalog = sorted((tag.code, tag.label, tag.llmDesc or "") for tag in tags)
+        return sha256_hex(json.dumps(catalog, ensure_ascii=False))
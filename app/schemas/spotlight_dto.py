@@ -1,4 +1,5 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from pydantic import BaseModel
 
 from app.schemas.feed_message_dto import FeedMessageDto
@@ -7,6 +8,8 @@ from app.schemas.feed_message_dto import FeedMessageDto
 class SpotlightDto:
     class GetSpotlightReqDto(BaseModel):
         target_date: str
+        incremental: bool = False
+        collapse_duplicates: bool = False   # 응답 점수 목록에서 유사 중복 메시지는 대표 메시지 하나만 남길지 여부
 
     class GetSpotlightRespDto(BaseModel):
         for_date: str
@@ -21,4 +24,23 @@ class SpotlightDto:
         tb_ka_message_id: str
         score: int
 
-SpotlightDto.GetSpotlightRespDto.model_rebuild()
\ No newline at end of file
+    class SubmitSpotlightJobReqDto(BaseModel):
+        target_date: str
+        incremental: bool = False
+        collapse_duplicates: bool = False   # 결과 점수 목록에서 유사 중복 메시지는 대표 메시지 하나만 남길지 여부
+
+    class SpotlightJobRespDto(BaseModel):
+        job_id: str
+        target_date: str
+        incremental: bool
+        collapse_duplicates: bool = False
+        status: str                 # pending, running, succeeded, failed
+        stage: str                  # queued, fetching, scoring, summarizing, done
+        progress: float             # 0.0 ~ 1.0
+        error: Optional[str] = None
+        result: Optional["SpotlightDto.GetSpotlightRespDto"] = None
+        created_at: datetime
+        finished_at: Optional[datetime] = None
+
+SpotlightDto.GetSpotlightRespDto.model_rebuild()
+SpotlightDto.SpotlightJobRespDto.model_rebuild()
\ No newline at end of file
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
-from typing import List, Optional
-from datetime import date
+from typing import Dict, List, Optional
+from datetime import date, datetime
 
 from app.schemas.external.subject_tag_dto import SubjectTagDto
 
@@ -8,6 +8,8 @@ from app.schemas.external.subject_tag_dto import SubjectTagDto
 class MessageTagAssignment(BaseModel):
     subject_id: str
     tag_codes: List[str]
+    # 태그 사전 분류 모델로 할당한 경우 {태그 코드: 확률}. LLM 으로 할당한 경우 None
+    confident_values: Optional[Dict[str, float]] = None
 
 class MessageTagLabelingRespDto(BaseModel):
     assign_resp_dtos_list: List[List[SubjectTagDto.AssignRespDto]]
@@ -17,4 +19,25 @@ class AssignTagsToMessageServDto(BaseModel):
     subject_id: str
     for_date: str
     message: str
-    
\ No newline at end of file
+    
+
+class TagAssignmentCacheStatsRespDto(BaseModel):
+    enabled: bool
+    hits: int               # 서버 시작 이후 캐시에서 태그 할당을 찾은 메시지 수
+    misses: int             # 서버 시작 이후 캐시에 없어 LLM 을 호출한 메시지 수
+    hit_rate: float         # hits / (hits + misses), 조회가 없었다면 0
+    entries: Optional[int] = None   # 현재 저장된 캐시 row 수 (DB 조회 실패 시 None)
+    ttl_seconds: int
+    max_entries: int
+
+class TagCatalogCacheStatsRespDto(BaseModel):
+    cached: bool
+    catalog_hash: Optional[str] = None      # 캐시된 태그 목록의 해시 (태그 할당 캐시 키로 사용)
+    tag_count: int
+    etag: Optional[str] = None
+    fetched_at: Optional[datetime] = None   # 태그 목록이 마지막으로 바뀐(다시 받은) 시각
+    age_seconds: Optional[float] = None     # 마지막으로 feed-app 에 확인한 뒤 지난 시간(초)
+    ttl_seconds: int
+    hits: int               # 서버 시작 이후 feed-app 을 호출하지 않고 캐시를 사용한 횟수
+    not_modified: int       # 다시 확인했지만 태그 목록이 바뀌지 않은 횟수 (304 또는 같은 해시)
+    refreshes: int          # 태그 목록을 새로 받은 횟수
@@ -0,0 +1,99 @@
+"""
+이름 마스킹 NER backend(torch / onnx int8) 비교 스크립트.
+
+같은 메시지에 대해 두 backend 의 mask_korean_names_ner_batch 결과가 같은지 확인(parity)한 뒤,
+모델 로딩 시간과 처리량(messages/s)을 비교합니다. onnx backend 는 `optimum[onnxruntime]` 패키지가 필요합니다.
+
+int8 양자화로 인해 일부 경계 토큰의 판단이 달라질 수 있으므로, 결과가 다른 메시지는 개수와 예시를 출력하고
+불일치 비율이 --max-mismatch-ratio 를 넘으면 실패(exit code 1)로 처리합니다.
+
+실행 방법:
+    PYTHONPATH=. python app/scripts/benchmark_ner_backends.py --messages 500 --repeat 3
+"""
+import argparse
+import random
+import sys
+import time
+import timeit
+
+from app.util.io_utils import output_ln
+from app.util.ner_provider import NerProvider
+from app.util.pii_cleaner import mask_korean_names_ner_batch
+
+
+_SAMPLE_SENTENCES = [
+    "안녕하세요 전산전자공학부 김민수입니다.",
+    "이번 주 금요일 학생회관에서 동아리 박람회가 열립니다!!",
+    "분실물 찾으신 분은 박지영 학우에게 연락 부탁드립니다.",
+    "[공지] 도서관 정기 청소 안내 (3/17 ~ 3/18)",
+    "이서준 교수님 특강이 오후 7시 NTH 313 에서 진행됩니다.",
+    "중고 전공서적 팝니다. 관심 있으신 분은 최유진에게 DM 주세요.",
+    "장학금 신청 마감이 얼마 남지 않았습니다 꼭 확인하세요",
+    "Hello everyone, the CRA meeting starts at 7pm.",
+]
+
+
+def build_messages(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(_SAMPLE_SENTENCES) for _ in range(rng.randint(1, 8)))
+        for _ in range(count)
+    ]
+
+
+def load_provider(backend: str) -> NerProvider:
+    provider = NerProvider(backend=backend)
+    started_at = time.perf_counter()
+    provider.warm_up()
+    output_ln(f"[{backend}] 모델 로딩: {time.perf_counter() - started_at:.2f}s")
+    return provider
+
+
+def run(message_count: int, repeat: int, seed: int, batch_size: int, max_mismatch_ratio: float) -> bool:
+    messages = build_messages(message_count, seed)
+    output_ln(f"messages={message_count}, repeat={repeat}, seed={seed}, batch_size={batch_size}")
+
+    providers = {backend: load_provider(backend) for backend in NerProvider.BACKENDS}
+    results = {
+        backend: mask_korean_names_ner_batch(messages, batch_size=batch_size, ner_provider=provider)
+        for backend, provider in providers.items()
+    }
+
+    mismatches = [
+        (message, torch_result, onnx_result)
+        for message, torch_result, onnx_result in zip(messages, results["torch"], results["onnx"])
+        if torch_result != onnx_result
+    ]
+    mismatch_ratio = len(mismatches) / len(messages) if messages else 0.0
+    output_ln(f"[parity] 불일치 {len(mismatches)}/{len(messages)} ({mismatch_ratio:.2%})")
+    for message, torch_result, onnx_result in mismatches[:3]:
+        output_ln(f"  원문 : {message}")
+        output_ln(f"  torch: {torch_result}")
+        output_ln(f"  onnx : {onnx_result}")
+
+    throughputs = {}
+    for backend, provider in providers.items():
+        elapsed = min(timeit.repeat(
+            lambda: mask_korean_names_ner_batch(messages, batch_size=batch_size, ner_provider=provider),
+            number=1,
+            repeat=repeat,
+        ))
+        throughputs[backend] = len(messages) / elapsed
+        output_ln(f"[{backend}] {elapsed:.2f}s, {throughputs[backend]:.1f} messages/s")
+
+    output_ln(f"speedup(onnx/torch)={throughputs['onnx'] / throughputs['torch']:.2f}x")
+    return mismatch_ratio <= max_mismatch_ratio
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="이름 마스킹 NER backend 비교")
+    parser.add_argument("--messages", type=int, default=500, help="벤치마크에 사용할 메시지 수")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (최소값을 사용)")
+    parser.add_argument("--seed", type=int, default=42, help="메시지 생성 시드")
+    parser.add_argument("--batch-size", type=int, default=16, help="NER 파이프라인 batch 크기")
+    parser.add_argument("--max-mismatch-ratio", type=float, default=0.0,
+                        help="허용할 마스킹 결과 불일치 비율 (0.0 이면 모든 결과가 같아야 함)")
+    args = parser.parse_args()
+
+    if not run(args.messages, args.repeat, args.seed, args.batch_size, args.max_mismatch_ratio):
+        sys.exit(1)
@@ -0,0 +1,113 @@
+"""
+텍스트 전처리 micro-benchmark.
+
+기존 구현(메시지마다 정규식을 다시 찾고 += 로 문자열을 이어 붙이던 방식)과 app.util.text_preprocessor 의
+batch API 의 결과가 같은지 확인한 뒤, 같은 입력에 대한 실행 시간을 비교합니다.
+
+실행 방법:
+    PYTHONPATH=. python app/scripts/benchmark_text_preprocessing.py --messages 2000 --repeat 5
+"""
+import argparse
+import random
+import re
+import timeit
+
+from app.util import text_preprocessor
+from app.util.io_utils import output_ln
+from app.util.text_cleaner import TextCleaner
+
+
+_SAMPLE_SENTENCES = [
+    "이번 주 금요일 학생회관에서 동아리 박람회가 열립니다!!",
+    "신청은 https://forms.gle/abcDEF123 에서 해주세요 :)",
+    "문의: 010-1234-5678 또는 handong@handong.edu 로 연락 주세요.",
+    "[공지] 도서관 정기 청소 안내 (3/17 ~ 3/18)",
+    "분실물 찾습니다 ㅠㅠ 검정색 지갑이에요... 01098765432",
+    "Hello everyone, the CRA meeting starts at 7pm in NTH 313.",
+    "장학금 신청 마감이 얼마 남지 않았습니다 — 꼭 확인하세요 → http://hisnet.handong.edu/notice?id=42",
+    "중고 책 판매합니다 #전공서적 #싸게 010 2222 3333",
+]
+
+
+# ---- 기존 구현 (비교 기준) -------------------------------------------------------
+
+def legacy_preprocess_messages(texts) -> str:
+    result = ""
+    for text in texts:
+        text = re.sub(r'https?://\S+', '', text)
+        text = re.sub(r'[^\w\s]', '', text, flags=re.UNICODE)
+        text = text.strip()
+        result += text
+        result += "\n"
+    return result
+
+
+def legacy_clean(text: str, stopwords: set) -> str:
+    text = text.lower()
+    text = re.sub(r"[^가-힣a-zA-Z0-9\s]", " ", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    return " ".join(word for word in text.split() if word not in stopwords)
+
+
+def legacy_mask_contact_info(text: str) -> str:
+    text = re.sub(r'https?://[^\s]+', '[링크]', text)
+    text = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '[이메일]', text)
+    phone_pattern = re.compile(r'\b(01[0-9])[-.\s]?(\d{3,4})[-.\s]?(\d{4})\b')
+    return phone_pattern.sub('[전화번호]', text)
+
+
+# ---- 새 구현 --------------------------------------------------------------------
+
+def batch_preprocess_messages(texts) -> str:
+    return "".join(text + "\n" for text in text_preprocessor.clean_for_summary_batch(texts))
+
+
+def build_messages(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(_SAMPLE_SENTENCES) for _ in range(rng.randint(1, 6)))
+        for _ in range(count)
+    ]
+
+
+def run(message_count: int, repeat: int, seed: int) -> None:
+    messages = build_messages(message_count, seed)
+    stopwords = TextCleaner().stopwords
+
+    cases = [
+        (
+            "spotlight summary 전처리",
+            lambda: legacy_preprocess_messages(messages),
+            lambda: batch_preprocess_messages(messages),
+        ),
+        (
+            "태깅 정규화 + 불용어 제거",
+            lambda: [legacy_clean(text, stopwords) for text in messages],
+            lambda: text_preprocessor.clean_for_tagging_batch(messages, stopwords),
+        ),
+        (
+            "링크/이메일/전화번호 마스킹",
+            lambda: [legacy_mask_contact_info(text) for text in messages],
+            lambda: text_preprocessor.mask_contact_info_batch(messages),
+        ),
+    ]
+
+    output_ln(f"messages={message_count}, repeat={repeat}, seed={seed}")
+    for name, legacy_func, batch_func in cases:
+        if legacy_func() != batch_func():
+            raise AssertionError(f"{name}: 기존 구현과 결과가 다릅니다.")
+
+        legacy_sec = min(timeit.repeat(legacy_func, number=1, repeat=repeat))
+        batch_sec = min(timeit.repeat(batch_func, number=1, repeat=repeat))
+        output_ln(f"[{name}] legacy={legacy_sec * 1000:.2f}ms, batch={batch_sec * 1000:.2f}ms, "
+                  f"speedup={legacy_sec / batch_sec:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="텍스트 전처리 micro-benchmark")
+    parser.add_argument("--messages", type=int, default=2000, help="벤치마크에 사용할 메시지 수")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (최소값을 사용)")
+    parser.add_argument("--seed", type=int, default=42, help="메시지 생성 시드")
+    args = parser.parse_args()
+
+    run(args.messages, args.repeat, args.seed)
@@ -2,7 +2,7 @@ import logging
 from datetime import date, timedelta
 from fastapi import HTTPException
 
-from app.clients.handong_feed_app_client import HandongFeedAppClient
+from app.clients.handong_feed_app_client import handong_feed_app_client_singleton
 from app.services.tag_labeling_service import TagLabelingService
 from app.core.database import SessionLocal
 
@@ -15,7 +15,7 @@ logging.basicConfig(
 def run():
     db = SessionLocal()
     service = TagLabelingService(db)
-    client = HandongFeedAppClient()
+    client = handong_feed_app_client_singleton
 
     try:
         today = (date.today()).isoformat()
@@ -23,15 +23,14 @@ def run():
 
         logging.info(f"[ACTION] Assigning tags to new feeds for {latest_for_date} ~ {today}")
         try:
-            resp = service.process_feeds_with_date(
+            # 쌓인 피드를 다음 날로 미루지 않도록, 조건에 맞는 모든 피드를 시간 구간별로 나누어 읽으며 처리한다.
+            succeeded = service.drain_feeds_with_date(
                 start_date=latest_for_date,
                 end_date=today,
                 is_filter_new=1,
                 onlyUnassignedFeeds=1,
-                limit=100
             )
-            logging.info(
-                f"[ACTION] Number of new feeds that were successfully assigned: {len(resp.assign_resp_dtos_list)}")
+            logging.info(f"[ACTION] Number of new feeds that were successfully assigned: {succeeded}")
 
 
         except HTTPException as e:
@@ -0,0 +1,268 @@
+"""
+임의의 기간에 대한 태그 할당 backfill/replay 스크립트.
+
+기간을 --shard-days 일 단위의 shard 로 나누고, --workers 개의 워커가 shard 마다 TagLabelingService.drain_feeds_with_date 로
+조건에 맞는 모든 피드를 처리합니다. 태그 목록을 바꾼 뒤 한 학기의 피드를 다시 태그 할당(--include-assigned)할 때 사용합니다.
+
+- --include-assigned 는 이미 태그가 할당된 피드도 다시 LLM 으로 태그를 할당하여, 새로 할당된 태그를 추가합니다.
+  feed-app 에는 태그 배정을 지우는 API 가 없으므로 기존 태그는 그대로 남습니다. (삭제된 태그 등은 feed-app 에서 따로 정리해야 합니다)
+  이미 배정된 태그는 중복 저장 실패가 아닌 '이미 할당됨'으로 처리하고, subject 는 태그 할당 완료로 갱신합니다.
+
+- shard 의 진행 상태는 TbTagBackfillCheckpoint 테이블에 저장됩니다. 중단된 실행은 같은 인자(또는 같은 --run-id)로 다시 실행하면
+  끝나지 않은 shard(pending, failed, 중단 시 running 이던 shard)부터 이어서 처리합니다.
+- 모든 워커는 같은 LLM 서비스 싱글톤과 프로세스 공용 rate limiter(LLM_RATE_LIMITS)를 사용하므로, 워커를 늘려도 LLM 호출 한도를 넘지 않습니다.
+  (워커를 늘리면 피드 조회와 저장처럼 LLM 을 기다리지 않는 작업이 겹쳐 처리됩니다)
+- 워커마다 TagLabelingService 와 TagAssignmentPipeline 을 따로 만들므로, 워커 하나가 mask/llm/write 단계 스레드
+  (TAG_PIPELINE_MASK_WORKERS + TAG_PIPELINE_LLM_WORKERS + TAG_PIPELINE_WRITE_WORKERS 개)와 feeder 스레드를 사용합니다.
+  NER 모델은 프로세스에서 하나를 공유하므로, 워커를 늘리면 mask 단계 스레드들이 같은 모델과 CPU 를 나누어 씁니다.
+- --report-interval 초마다 처리한 shard/피드 수, 처리량(feeds/s)과 남은 shard 기준 예상 완료 시간(ETA)을 출력합니다.
+
+실행 방법:
+    # 2025년 1학기 피드를 모두 다시 태그 할당
+    PYTHONPATH=. python app/scripts/tag_assignment_backfill.py --start-date 2025-03-01 --end-date 2025-06-30 --include-assigned --workers 4
+    # 중단된 실행은 같은 명령을 다시 실행하면 이어서 처리합니다. 기간을 바꾸어 이어서 처리하려면 --run-id 를 지정합니다.
+    PYTHONPATH=. python app/scripts/tag_assignment_backfill.py --start-date 2025-03-01 --end-date 2025-06-30 --shard-days 7 --run-id retag-2025-1
+"""
+import argparse
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import date, timedelta
+from typing import List, Tuple
+
+from fastapi import HTTPException
+
+from app.core.database import SessionLocal
+from app.repositories.tb_tag_backfill_checkpoint_repository import (
+    TagBackfillCheckpointRepository, STATUS_DONE, STATUS_FAILED,
+)
+from app.services.tag_assignment_pipeline import PipelineOutcome
+from app.services.tag_labeling_service import TagLabelingService
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
+)
+
+
+def split_shards(start_date: date, end_date: date, shard_days: int) -> List[Tuple[date, date]]:
+    """[start_date, end_date] 기간을 shard_days 일 단위의 (시작 날짜, 종료 날짜) 목록으로 나눕니다. (양 끝 포함)"""
+    shards = []
+    shard_start = start_date
+    while shard_start <= end_date:
+        shard_end = min(shard_start + timedelta(days=shard_days - 1), end_date)
+        shards.append((shard_start, shard_end))
+        shard_start = shard_end + timedelta(days=1)
+    return shards
+
+
+def default_run_id(start_date: date, end_date: date, shard_days: int, is_filter_new: int, only_unassigned_feeds: int) -> str:
+    """같은 인자로 다시 실행하면 이전 실행을 이어서 처리하도록, 인자로 run_id 를 만듭니다."""
+    return (f"{start_date:%Y%m%d}-{end_date:%Y%m%d}-d{shard_days}"
+            f"-new{is_filter_new}-unassigned{only_unassigned_feeds}")
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+class BackfillProgress:
+    """여러 워커가 함께 갱신하는 backfill 진행 상황. 처리량과 ETA 는 이번 실행에서 처리한 shard 기준으로 계산합니다."""
+
+    def __init__(self, total_shards: int, done_shards: int, pending_shards: int):
+        self.total_shards = total_shards
+        self.done_before = done_shards
+        self.pending_shards = pending_shards
+        self.done = 0
+        self.failed = 0
+        self.feeds = 0
+        self.succeeded = 0
+        self.started_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def add_outcome(self, outcome: PipelineOutcome) -> None:
+        with self.lock:
+            self.feeds += 1
+            self.succeeded += outcome.succeeded
+
+    def finish_shard(self, succeeded: bool) -> None:
+        with self.lock:
+            if succeeded:
+                self.done += 1
+            else:
+                self.failed += 1
+
+    def report(self) -> str:
+        with self.lock:
+            done, failed, feeds, succeeded = self.done, self.failed, self.feeds, self.succeeded
+        elapsed = time.monotonic() - self.started_at
+        finished = done + failed
+        remaining = self.pending_shards - finished
+        if remaining <= 0:
+            eta = "00:00:00"
+        elif finished:
+            eta = format_duration(elapsed / finished * remaining)
+        else:
+            eta = "계산 중"
+        completed = self.done_before + done
+        return (f"[BACKFILL] shard {completed}/{self.total_shards} ({completed / self.total_shards:.1%}), 실패 {failed}, "
+                f"피드 {feeds}건 (성공 {succeeded}건), {feeds / elapsed if elapsed else 0.0:.2f} feeds/s, "
+                f"경과 {format_duration(elapsed)}, ETA {eta}")
+
+
+def process_shard(checkpoint_id: str,
+                  shard_start: date,
+                  shard_end: date,
+                  is_filter_new: int,
+                  only_unassigned_feeds: int,
+                  progress: BackfillProgress) -> None:
+    """shard 하나를 처리하고 결과를 checkpoint 에 저장합니다. 워커 스레드마다 DB 세션과 TagLabelingService 를 따로 사용합니다."""
+    db = SessionLocal()
+    repository = TagBackfillCheckpointRepository(db)
+    feed_count = 0
+    succeeded_count = 0
+
+    def on_progress(outcome: PipelineOutcome) -> None:
+        nonlocal feed_count, succeeded_count
+        feed_count += 1
+        succeeded_count += outcome.succeeded
+        progress.add_outcome(outcome)
+
+    try:
+        repository.mark_running(checkpoint_id)
+        service = TagLabelingService(db)
+        try:
+            service.drain_feeds_with_date(
+                start_date=shard_start.isoformat(),
+                end_date=shard_end.isoformat(),
+                is_filter_new=is_filter_new,
+                onlyUnassignedFeeds=only_unassigned_feeds,
+                on_progress=on_progress,
+                # 이미 태그가 할당된 피드를 다시 처리할 때는 기존 태그와 겹치는 배정을 실패로 보지 않는다.
+                allow_existing_tags=not only_unassigned_feeds,
+            )
+        except HTTPException as e:
+            # 조건에 맞는 피드가 없는 shard 는 0건으로 완료한다.
+            if e.status_code != 204:
+                raise
+
+        repository.mark_done(checkpoint_id, feed_count, succeeded_count)
+        progress.finish_shard(True)
+        logging.info(f"[BACKFILL] shard {shard_start} ~ {shard_end} 완료: 피드 {feed_count}건, 성공 {succeeded_count}건")
+
+    except Exception as e:
+        progress.finish_shard(False)
+        logging.error(f"[BACKFILL] shard {shard_start} ~ {shard_end} 실패: {e}", exc_info=True)
+        try:
+            db.rollback()
+            repository.mark_failed(checkpoint_id, feed_count, succeeded_count, str(e))
+        except Exception as mark_error:
+            # checkpoint 를 저장하지 못해도 running 으로 남으므로 다음 실행에서 다시 처리된다.
+            logging.error(f"[BACKFILL] shard {shard_start} ~ {shard_end} 실패 상태 저장 실패: {mark_error}")
+
+    finally:
+        db.close()
+
+
+def report_progress(progress: BackfillProgress, stop_event: threading.Event, interval: float) -> None:
+    while not stop_event.wait(interval):
+        logging.info(progress.report())
+
+
+def run(start_date: date,
+        end_date: date,
+        shard_days: int,
+        workers: int,
+        is_filter_new: int,
+        only_unassigned_feeds: int,
+        run_id: str | None,
+        report_interval: float) -> bool:
+    if start_date > end_date:
+        logging.error("[BACKFILL] --start-date 는 --end-date 보다 늦을 수 없습니다.")
+        return False
+    if shard_days < 1 or workers < 1:
+        logging.error("[BACKFILL] --shard-days 와 --workers 는 1 이상이어야 합니다.")
+        return False
+
+    run_id = run_id or default_run_id(start_date, end_date, shard_days, is_filter_new, only_unassigned_feeds)
+    db = SessionLocal()
+    try:
+        repository = TagBackfillCheckpointRepository(db)
+        repository.create_shards(run_id, split_shards(start_date, end_date, shard_days))
+        interrupted = repository.reset_interrupted(run_id)
+        if interrupted:
+            logging.info(f"[BACKFILL] 이전 실행에서 중단된 shard {interrupted}개를 다시 처리합니다.")
+        pending = [(checkpoint.id, checkpoint.shard_start, checkpoint.shard_end) for checkpoint in repository.find_unfinished(run_id)]
+        summary = repository.summarize(run_id)
+    finally:
+        db.close()
+
+    total_shards = sum(shards for shards, _, _ in summary.values())
+    done_shards = summary.get(STATUS_DONE, (0, 0, 0))[0]
+    logging.info(f"[BACKFILL] run_id={run_id}, 기간 {start_date} ~ {end_date}, shard {total_shards}개 "
+                 f"(완료 {done_shards}개, 처리할 shard {len(pending)}개), 워커 {workers}개")
+    if not pending:
+        logging.info("[BACKFILL] 모든 shard 를 이미 처리했습니다.")
+        return True
+
+    progress = BackfillProgress(total_shards, done_shards, len(pending))
+    stop_event = threading.Event()
+    reporter = threading.Thread(target=report_progress, args=(progress, stop_event, report_interval), daemon=True)
+    reporter.start()
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tag-backfill")
+    futures = [
+        executor.submit(process_shard, checkpoint_id, shard_start, shard_end, is_filter_new, only_unassigned_feeds, progress)
+        for checkpoint_id, shard_start, shard_end in pending
+    ]
+    try:
+        wait(futures)
+    except KeyboardInterrupt:
+        # 아직 시작하지 않은 shard 는 취소되어 pending 으로 남고, 처리 중인 shard 는 끝까지 처리된 뒤 종료한다.
+        # 기다리지 않고 프로세스를 강제 종료하면 처리 중이던 shard 는 running 으로 남아 다음 실행에서 처음부터 다시 처리된다.
+        logging.warning("[BACKFILL] 중단 요청을 받았습니다. 대기 중인 shard 는 취소하고, 처리 중인 shard 가 모두 끝날 때까지 기다린 뒤 종료합니다. "
+                        "같은 인자로 다시 실행하면 남은 shard 부터 처리합니다.")
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    finally:
+        executor.shutdown(wait=True)
+        stop_event.set()
+        reporter.join()
+
+    logging.info(progress.report())
+    db = SessionLocal()
+    try:
+        summary = TagBackfillCheckpointRepository(db).summarize(run_id)
+    finally:
+        db.close()
+    for status, (shards, feeds, succeeded) in sorted(summary.items()):
+        logging.info(f"[BACKFILL] {status}: shard {shards}개, 피드 {feeds}건, 성공 {succeeded}건")
+
+    failed_shards = summary.get(STATUS_FAILED, (0, 0, 0))[0]
+    if failed_shards:
+        logging.warning(f"[BACKFILL] 실패한 shard {failed_shards}개는 같은 인자로 다시 실행하면 다시 처리합니다.")
+    return failed_shards == 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="기간별 태그 할당 backfill/replay")
+    parser.add_argument("--start-date", type=date.fromisoformat, required=True, help="처리 시작 날짜 (yyyy-mm-dd, 포함)")
+    parser.add_argument("--end-date", type=date.fromisoformat, required=True, help="처리 종료 날짜 (yyyy-mm-dd, 포함)")
+    parser.add_argument("--shard-days", type=int, default=1, help="shard 하나의 기간(일). checkpoint 와 재처리의 단위입니다.")
+    parser.add_argument("--workers", type=int, default=2,
+                        help="동시에 처리할 shard 수. 워커마다 별도의 pipeline 을 만들므로 스레드 수는 "
+                             "workers x (TAG_PIPELINE_MASK_WORKERS + TAG_PIPELINE_LLM_WORKERS + TAG_PIPELINE_WRITE_WORKERS) 만큼 늘어나며, "
+                             "NER 모델은 모든 워커가 공유합니다.")
+    parser.add_argument("--include-assigned", action="store_true",
+                        help="이미 태그가 할당된 피드도 다시 태그 할당하여 새 태그를 추가 (기존 태그는 지우지 않음)")
+    parser.add_argument("--is-filter-new", type=int, choices=[0, 1], default=1, help="feed-app 의 isFilterNew 조건")
+    parser.add_argument("--run-id", default=None, help="checkpoint 실행 식별자 (기본값: 인자로 생성하여 같은 인자로 실행하면 이어서 처리)")
+    parser.add_argument("--report-interval", type=float, default=30.0, help="진행 상황 출력 주기(초)")
+    args = parser.parse_args()
+
+    if not run(args.start_date, args.end_date, args.shard_days, args.workers,
+               args.is_filter_new, 0 if args.include_assigned else 1, args.run_id, args.report_interval):
+        sys.exit(1)
@@ -0,0 +1,91 @@
+"""
+태그 사전 분류 모델(TF-IDF + 로지스틱 회귀) 학습 스크립트. `scikit-learn` 패키지가 필요합니다.
+
+태그 할당 캐시(TbTagAssignmentCache)에 메시지와 함께 저장된 LLM 태그 할당 결과와 feed-app 태그의 label, llmDesc 로 학습합니다.
+먼저 --test-ratio 만큼의 메시지를 떼어 두고 나머지로 학습한 모델을 평가하여, threshold 별로
+- coverage: LLM 없이 로컬에서 태그를 할당하는 메시지 비율
+- precision: 로컬에서 할당한 태그 목록이 LLM 의 태그 목록과 완전히 같은 비율
+을 출력한 뒤, 모든 메시지로 다시 학습한 모델을 --output 경로에 저장합니다.
+
+실행 방법:
+    PYTHONPATH=. python app/scripts/train_tag_preclassifier.py --limit 20000 --output .cache/tag_preclassifier.pkl
+"""
+import argparse
+import random
+import sys
+import time
+
+from app.clients.handong_feed_app_client import handong_feed_app_client_singleton
+from app.core.config import EnvVariables
+from app.core.database import SessionLocal
+from app.repositories.tb_tag_assignment_cache_repository import TagAssignmentCacheRepository
+from app.util.io_utils import output_ln
+from app.util.tag_preclassifier import TagPreClassifier
+
+_EVALUATION_THRESHOLDS = [0.7, 0.8, 0.85, 0.9, 0.95]
+
+
+def load_examples(limit: int | None) -> list:
+    db = SessionLocal()
+    try:
+        return TagAssignmentCacheRepository(db).find_training_examples(limit=limit)
+    finally:
+        db.close()
+
+
+def evaluate(model: TagPreClassifier, examples: list, tag_codes: list) -> None:
+    texts = [text for text, _ in examples]
+    for threshold in _EVALUATION_THRESHOLDS:
+        predictions = model.predict_confident(texts, threshold, tag_codes)
+        covered = [
+            (set(prediction), set(expected))
+            for prediction, (_, expected) in zip(predictions, examples)
+            if prediction is not None
+        ]
+        correct = sum(1 for predicted, expected in covered if predicted == expected)
+        coverage = len(covered) / len(examples) if examples else 0.0
+        precision = correct / len(covered) if covered else 0.0
+        output_ln(f"[eval] threshold={threshold:.2f} coverage={coverage:.2%} precision={precision:.2%} ({correct}/{len(covered)})")
+
+
+def run(limit: int | None, test_ratio: float, seed: int, output: str) -> bool:
+    tags = handong_feed_app_client_singleton.get_all_tags()
+    tag_codes = [tag.code for tag in tags]
+    tag_descriptions = {tag.code: " ".join(filter(None, [tag.label, tag.llmDesc])) for tag in tags}
+
+    examples = [
+        (text, [code for code in codes if code in tag_descriptions])
+        for text, codes in load_examples(limit)
+    ]
+    examples = [(text, codes) for text, codes in examples if codes]
+    output_ln(f"학습 메시지 {len(examples)}건, 태그 {len(tag_codes)}개")
+    if not examples:
+        output_ln("태그 할당 캐시에 메시지가 저장된 할당 결과가 없습니다. (TAG_ASSIGNMENT_CACHE=true 로 태그 할당을 먼저 실행하세요)")
+        return False
+
+    shuffled = examples[:]
+    random.Random(seed).shuffle(shuffled)
+    test_size = int(len(shuffled) * test_ratio)
+    if test_size:
+        started_at = time.perf_counter()
+        model = TagPreClassifier.train(shuffled[test_size:], tag_descriptions)
+        output_ln(f"[eval] 학습 {len(shuffled) - test_size}건, 평가 {test_size}건, 학습 시간 {time.perf_counter() - started_at:.2f}s")
+        evaluate(model, shuffled[:test_size], tag_codes)
+
+    started_at = time.perf_counter()
+    model = TagPreClassifier.train(examples, tag_descriptions)
+    model.save(output)
+    output_ln(f"모델 저장 완료: {output} (학습 시간 {time.perf_counter() - started_at:.2f}s)")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="태그 사전 분류 모델 학습")
+    parser.add_argument("--limit", type=int, default=None, help="최근에 사용된 순으로 학습에 사용할 최대 메시지 수")
+    parser.add_argument("--test-ratio", type=float, default=0.2, help="평가에 사용할 메시지 비율 (0 이면 평가 생략)")
+    parser.add_argument("--seed", type=int, default=42, help="학습/평가 분할 시드")
+    parser.add_argument("--output", default=EnvVariables.TAG_PRECLASSIFIER_MODEL_PATH, help="모델 저장 경로")
+    args = parser.parse_args()
+
+    if not run(args.limit, args.test_ratio, args.seed, args.output):
+        sys.exit(1)
@@ -1,168 +1,274 @@
 import json
-import ollama
 import logging
-import time
 
-from datetime import datetime, timedelta, UTC
-from typing import List
-
-from google import genai
-from google.genai import types
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
+from app.clients.llm_providers.registry import get_provider
 from app.core.config import EnvVariables
 from app.schemas.tag_labeling_dto import MessageTagAssignment
+from app.services.tag_assignment_cache_service import TagAssignmentCacheService, tag_assignment_cache_service_singleton
+from app.util.json_utils import loads_llm_json
+from app.util.rate_limiter import get_rate_limiter
+from app.util.token_utils import estimate_tokens
 
 logger = logging.getLogger(__name__)
 
 class LLMService:
-    def __init__(self):
-        self.request_count = 0
-        self.request_window_start = datetime.now(UTC)
-
-    def enforce_rate_limit(self):
-        # LLM_API_REQUESTS_PER_MINUTE 제한
-        now = datetime.now(UTC)
-        if (now - self.request_window_start) > timedelta(minutes=1):
-            # 1분 지났으면 초기화
-            self.request_count = 0
-            self.request_window_start = now
-
-        if self.request_count >= EnvVariables.LLM_API_REQUESTS_PER_MINUTE:
-            # 분당 요청 초과했으면 대기
-            wait_seconds = 60 - (now - self.request_window_start).seconds
-            logger.info(f"[LLMService] {EnvVariables.LLM_API_REQUESTS_PER_MINUTE}회 요청 완료. {wait_seconds}초 대기합니다...")
-            time.sleep(wait_seconds)
-            # 초기화
-            self.request_count = 0
-            self.request_window_start = datetime.now(UTC)
+    SINGLE_SYSTEM_PROMPT_TEMPLATE = """
+             persona: 너는 콘텐츠 라벨링 전문가야.
+             instruction:
+                  - 아래 단일 메시지를 참고하여, 해당 메시지에 적합한 태그 코드 배열 (string[])만을 출력해줘.
+                  - 태그의 "llm_desc"가 각 태그의 선별 기준이야.
+                  - 적합성이 95% 이상일 경우에만 출력에 포함시키며, 태그는 최대 3개까지만 선택해.
+                  - 출력은 반드시 오직 순수한 JSON 배열만 출력해야 해. 다른 텍스트나 번호 매김 없이 오직 JSON 형식이어야 해.
+             태그 목록:
+             {tags_json}
+             출력 형식 예시:
+             ["<tag_code1>", "<tag_code2>", ...]
+             """
+
+    BATCH_SYSTEM_PROMPT_TEMPLATE = """
+             persona: 너는 콘텐츠 라벨링 전문가야.
+             instruction:
+                  - 아래 메시지 목록의 각 메시지를 따로 참고하여, 메시지마다 적합한 태그 코드 배열 (string[])을 골라줘.
+                  - 태그의 "llm_desc"가 각 태그의 선별 기준이야.
+                  - 적합성이 95% 이상일 경우에만 출력에 포함시키며, 태그는 메시지마다 최대 3개까지만 선택해.
+                  - 출력은 메시지의 "id" 를 key 로, 태그 코드 배열을 value 로 하는 JSON 객체여야 하며, 모든 id 를 빠짐없이 포함해야 해.
+                  - 출력은 반드시 오직 순수한 JSON 객체만 출력해야 해. 다른 텍스트나 번호 매김 없이 오직 JSON 형식이어야 해.
+             태그 목록:
+             {tags_json}
+             출력 형식 예시:
+             {{"<id1>": ["<tag_code1>", "<tag_code2>"], "<id2>": ["<tag_code3>"], ...}}
+             """
+
+    def __init__(self,
+                 provider_name: str | None = None,
+                 tag_assignment_cache: TagAssignmentCacheService | None = None):
+        self.provider_name = (provider_name or EnvVariables.LLM_PROVIDER).lower()
+        # provider 별 RPM/TPM 한도를 적용하는 프로세스 공용 token-bucket limiter (여러 스레드에서 안전하게 공유)
+        self.rate_limiter = get_rate_limiter(self.provider_name)
+        self.tag_assignment_cache = tag_assignment_cache or tag_assignment_cache_service_singleton
+
+    @property
+    def cache_model(self) -> str:
+        """태그 할당 캐시의 model 키 ("provider/모델명")"""
+        return f"{self.provider_name}/{get_provider(self.provider_name).default_model or ''}"
+
+    def enforce_rate_limit(self, tokens: int = 0):
+        """
+        LLM 호출 1회와 tokens 만큼의 토큰을 한도에서 차감하고, 한도에 도달했다면 호출 가능해질 때까지 대기합니다.
+        응답 성공 여부와 관계없이 모든 호출 시도 전에 호출해야 합니다.
+        """
+        self.rate_limiter.acquire(tokens)
 
     def assign_tag_to_message(self, subject_id: str, message: str, tags: List[str]) -> MessageTagAssignment | None:
         """
         단일 메시지에 적합한 태그 코드를 할당합니다.
-        최대 3번까지 재시도하며, 설정된 LLM Provider API(Ollama 혹은 Gemini)를 호출하여 태그 코드 배열(JSON 문자열)을 반환받습니다.
+        설정된 LLM Provider API(Ollama 혹은 Gemini)를 태그 코드 배열 JSON schema 의 structured output 모드로 호출합니다.
+        응답이 schema 를 따르지 않아 파싱에 실패한 경우에만 최대 3번까지 재시도합니다.
         """
         max_attempts = 3
+        prompt_dict = self.get_prompt(message, tags)
+        prompt_tokens = estimate_tokens(prompt_dict["system_prompt"]) + estimate_tokens(prompt_dict["content"])
         for attempt in range(1, max_attempts + 1):
-            self.enforce_rate_limit()
+            self.enforce_rate_limit(prompt_tokens)
             try:
                 response_text = self.request_tag_assignment(message, tags)
-                self.request_count += 1
-                logger.info(f"{EnvVariables.LLM_PROVIDER.capitalize()} API response for subject_id {subject_id}, attempt {attempt}: {response_text}")
+                logger.info(f"{self.provider_name.capitalize()} API response for subject_id {subject_id}, attempt {attempt}: {response_text}")
                 tag_codes = self.extract_tag_codes_array_from_json_str(response_text)
                 if isinstance(tag_codes, list) and all(isinstance(tc, str) for tc in tag_codes) and tag_codes:
                     return MessageTagAssignment(subject_id=subject_id, tag_codes=tag_codes)
                 else:
                     raise Exception("추출된 결과가 유효한 문자열 배열이 아닙니다.")
             except Exception as e:
-                logger.error(f"{EnvVariables.LLM_PROVIDER.capitalize()} API 응답 파싱 실패 for subject_id {subject_id} on attempt {attempt}: {e}")
+                logger.error(f"{self.provider_name.capitalize()} API 응답 파싱 실패 for subject_id {subject_id} on attempt {attempt}: {e}")
                 if attempt == max_attempts:
                     raise Exception(
                         f"assign_tag_to_message 실패: {subject_id}에 대해 {max_attempts}번 시도했으나 실패했습니다. ({e})") from e
         return None
 
-    def request_tag_assignment(self, message, tags) -> str:
+    def assign_tags_to_messages(self,
+                                messages: List[Tuple[str, str]],
+                                tags: List[str],
+                                catalog_hash: str | None = None) -> List[MessageTagAssignment | Exception]:
         """
-        EnvVariables.LLM_PROVIDER 값을 참조하여, Ollama 또는 Gemini API 호출 함수를 선택합니다.
-        """
-        provider = EnvVariables.LLM_PROVIDER.lower()
-        if provider == "gemini":
-            return self.request_tag_assignment_gemini(message, tags)
-        elif provider == "ollama":
-            return self.request_tag_assignment_ollama(message, tags)
-        else:
-            raise Exception(f"지원하지 않는 LLM provider: {provider}")
+        여러 메시지를 한 번의 LLM 호출로 태그 할당합니다.
 
+        catalog_hash (TagDto.compute_catalog_hash) 가 주어지면, rate limit 을 적용하기 전에 태그 할당 캐시를 먼저 조회하여
+        같은 메시지에 같은 태그 목록으로 할당한 결과가 있는 메시지는 LLM 을 호출하지 않고, 새로 할당한 결과는 캐시에 저장합니다.
 
-    def request_tag_assignment_ollama(self, message, tags) -> str:
-        """
-        Ollama 를 호출하여 프롬프트에 따른 LLM 응답(태그 코드 배열의 JSON 문자열)을 반환합니다.
+        나머지 (subject_id, message) 목록을 id 와 함께 하나의 프롬프트로 보내고, {subject_id: [tag_codes]} JSON 객체를 응답으로 받습니다.
+        응답에서 누락되었거나 유효하지 않은 항목, 그리고 같은 batch 안에서 중복된 subject_id 는
+        assign_tag_to_message 로 개별 재시도합니다.
+
+        Returns:
+            입력 순서대로의 결과 목록. 개별 재시도까지 실패한 항목은 해당 위치에 Exception 이 담깁니다.
         """
+        results: List[MessageTagAssignment | Exception | None] = [None] * len(messages)
+
+        if catalog_hash:
+            cached = self.tag_assignment_cache.get_many([message for _, message in messages], catalog_hash, self.cache_model)
+            for index, (subject_id, message) in enumerate(messages):
+                tag_codes = cached.get(TagAssignmentCacheService.compute_message_hash(message))
+                if tag_codes:
+                    results[index] = MessageTagAssignment(subject_id=str(subject_id), tag_codes=tag_codes)
+        cached_indexes = {index for index, result in enumerate(results) if result is not None}
 
-        if not EnvVariables.OLLAMA_MODEL:
-            raise Exception("OLLAMA_MODEL 환경 변수가 설정되지 않았습니다.")
+        batch_indexes: Dict[str, int] = {}
+        for index, (subject_id, _) in enumerate(messages):
+            if index not in cached_indexes:
+                batch_indexes.setdefault(str(subject_id), index)
 
-        prompt_dict =  self.get_prompt(message, tags)
-        messages = [
-            {"role": "system", "content": prompt_dict["system_prompt"]},
-            {"role": "user", "content": prompt_dict["content"]},
-        ]
+        if len(batch_indexes) > 1:
+            batch_messages = [(subject_id, messages[index][1]) for subject_id, index in batch_indexes.items()]
+            prompt_dict = self.get_batch_prompt(batch_messages, tags)
+            self.enforce_rate_limit(estimate_tokens(prompt_dict["system_prompt"]) + estimate_tokens(prompt_dict["content"]))
+            try:
+                response_text = self.request_completion(
+                    prompt_dict, self.get_batch_tag_codes_schema([subject_id for subject_id, _ in batch_messages], tags)
+                )
+                logger.info(f"{self.provider_name.capitalize()} API batch response for {len(batch_messages)} messages: {response_text}")
+                tag_code_map = self.extract_tag_code_map_from_json_str(response_text)
+                for subject_id, index in batch_indexes.items():
+                    tag_codes = tag_code_map.get(subject_id)
+                    if isinstance(tag_codes, list) and tag_codes and all(isinstance(tc, str) for tc in tag_codes):
+                        results[index] = MessageTagAssignment(subject_id=subject_id, tag_codes=tag_codes)
+            except Exception as e:
+                logger.error(f"{self.provider_name.capitalize()} API batch 응답 처리 실패 ({len(batch_messages)}건), 개별 재시도합니다: {e}")
 
-        llm_resp = ollama.chat(model=EnvVariables.OLLAMA_MODEL, messages=messages)
-        try:
-            response_text = llm_resp["message"]["content"]
-            return response_text
-        except Exception as e:
-            logger.error(f"Ollama call failed: {e}")
-            raise Exception("Ollama 호출 실패: " + str(e)) from e
+        retry_count = sum(1 for result in results if result is None)
+        if retry_count:
+            logger.info(f"[LLMService] batch 응답에서 누락되었거나 유효하지 않은 {retry_count}건을 개별 재시도합니다.")
+        for index, (subject_id, message) in enumerate(messages):
+            if results[index] is not None:
+                continue
+            try:
+                results[index] = self.assign_tag_to_message(str(subject_id), message, tags)
+            except Exception as e:
+                results[index] = e
 
+        if catalog_hash:
+            self.tag_assignment_cache.put_many(
+                {
+                    message: results[index].tag_codes
+                    for index, (_, message) in enumerate(messages)
+                    if index not in cached_indexes and isinstance(results[index], MessageTagAssignment)
+                },
+                catalog_hash,
+                self.cache_model,
+            )
 
-    def request_tag_assignment_gemini(self, message, tags) -> str:
+        return results
+
+    def request_tag_assignment(self, message, tags) -> str:
         """
-        Gemini API를 호출하여 프롬프트에 따른 LLM 응답(태그 코드 배열의 JSON 문자열)을 반환합니다.
+        단일 메시지 태그 할당 프롬프트로 LLM 을 호출하여 응답(태그 코드 배열의 JSON 문자열)을 반환합니다.
         """
-        try:
-            client = genai.Client(api_key=EnvVariables.GEMINI_API_KEY)
-            prompt_dict = self.get_prompt(message, tags)
+        return self.request_completion(self.get_prompt(message, tags), self.get_tag_codes_schema(tags))
 
-            response = client.models.generate_content(
-                model="gemini-2.0-flash-lite",
-                config=types.GenerateContentConfig(
-                    system_instruction=prompt_dict["system_prompt"]),
-                contents=prompt_dict["content"],
-            )
+    def request_completion(self, prompt_dict: dict, json_schema: dict | None = None) -> str:
+        """
+        LLM_PROVIDER 에 해당하는 provider(registry 참고)로 프롬프트를 보내고 응답 문자열을 반환합니다.
+        """
+        response = get_provider(self.provider_name).chat_sync(
+            [
+                {"role": "system", "content": prompt_dict["system_prompt"]},
+                {"role": "user", "content": prompt_dict["content"]},
+            ],
+            json_schema=json_schema,
+        )
+        return response.text
+
+    @staticmethod
+    def get_prompt(message, tags) -> dict:
+        system_prompt = LLMService.get_system_prompt(LLMService.SINGLE_SYSTEM_PROMPT_TEMPLATE, tags)
+        content = json.dumps({"message": message}, ensure_ascii=False, indent=2)
+        return {"system_prompt": system_prompt, "content": content}
 
-            return response.text
-        except Exception as e:
-            logger.error(f"Gemini API call failed: {e}")
-            raise Exception("Gemini API 호출 실패: " + str(e)) from e
+    @staticmethod
+    def get_batch_prompt(messages: List[Tuple[str, str]], tags) -> dict:
+        system_prompt = LLMService.get_system_prompt(LLMService.BATCH_SYSTEM_PROMPT_TEMPLATE, tags)
+        content = json.dumps(
+            {"messages": [{"id": subject_id, "message": message} for subject_id, message in messages]},
+            ensure_ascii=False,
+            indent=2
+        )
+        return {"system_prompt": system_prompt, "content": content}
 
+    @staticmethod
+    def get_tag_codes_schema(tags) -> dict:
+        """단일 메시지 태그 할당 응답(태그 코드 배열)의 JSON schema"""
+        tag_codes = [tag if isinstance(tag, str) else getattr(tag, "code", None) or tag.get("code") for tag in tags]
+        return {
+            "type": "array",
+            "items": {"type": "string", "enum": tag_codes},
+            "minItems": 1,
+            "maxItems": 3,
+            "uniqueItems": True,
+        }
 
     @staticmethod
-    def get_prompt(message, tags) -> dict:
+    def get_batch_tag_codes_schema(ids: List[str], tags) -> dict:
+        """여러 메시지 태그 할당 응답({id: 태그 코드 배열})의 JSON schema"""
+        tag_codes_schema = LLMService.get_tag_codes_schema(tags)
+        return {
+            "type": "object",
+            "properties": {message_id: tag_codes_schema for message_id in ids},
+            "required": list(ids),
+        }
+
+    @staticmethod
+    def get_system_prompt(template: str, tags) -> str:
+        """
+        태그 목록을 포함한 system prompt 를 반환합니다.
+        태그 목록은 실행 중 거의 바뀌지 않으므로, 같은 (template, 태그 목록) 에 대해서는 한 번 만든 prompt 를 재사용합니다.
+        """
         # tags 인자가 Pydantic 모델일 경우, 각 항목을 dict로 변환합니다.
         tags_serializable = [tag.dict() for tag in tags] if tags and hasattr(tags[0], "dict") else tags
+        return _render_system_prompt(template, json.dumps(tags_serializable, ensure_ascii=False))
 
-        system_prompt = f"""
-             persona: 너는 콘텐츠 라벨링 전문가야.
-             instruction:
-                  - 아래 단일 메시지를 참고하여, 해당 메시지에 적합한 태그 코드 배열 (string[])만을 출력해줘.
-                  - 태그의 "llm_desc"가 각 태그의 선별 기준이야.
-                  - 적합성이 95% 이상일 경우에만 출력에 포함시키며, 태그는 최대 3개까지만 선택해.
-                  - 출력은 반드시 오직 순수한 JSON 배열만 출력해야 해. 다른 텍스트나 번호 매김 없이 오직 JSON 형식이어야 해.
-             태그 목록:
-             {json.dumps(tags_serializable, ensure_ascii=False, indent=2)}
-             출력 형식 예시:
-             ["<tag_code1>", "<tag_code2>", ...]
-             """
-        content = json.dumps({"message": message}, ensure_ascii=False, indent=2)
-        return {"system_prompt": system_prompt, "content": content}
+    @staticmethod
+    def extract_tag_code_map_from_json_str(text) -> Dict[str, list]:
+        """
+        JSON str 을 {id: 태그 코드 배열} object 로 파싱 (structured output 이 아닌 응답은 중괄호 사이 값을 추출)
+        - 값이 dict 배열이면, 각 dict의 "code" 필드만 추출하여 문자열 배열로 변환
+
+        :param text: JSON 문자열
+        :return: {id: 태그 코드 문자열 배열}
+        """
+        tag_code_map = loads_llm_json(text, dict)
+
+        result = {}
+        for key, tag_codes in tag_code_map.items():
+            if isinstance(tag_codes, list) and tag_codes and isinstance(tag_codes[0], dict):
+                tag_codes = [d.get("code", "") for d in tag_codes if "code" in d]
+            result[str(key)] = tag_codes
+        return result
 
     @staticmethod
     def extract_tag_codes_array_from_json_str(text) -> list:
         """
-        JSON str 에서 array 부분만 추출 (대괄호 사이 값)
+        JSON str 을 태그 코드 배열로 파싱 (structured output 이 아닌 응답은 대괄호 사이 값을 추출)
         - 만약 추출 결과가 dict 배열이면, 각 dict의 "code" 필드만 추출하여 문자열 배열로 변환/
 
         :param text: JSON 문자열
         :return: 태그 코드 문자열 배열
         """
-        try:
-            start = text.find('[')
-            end = text.rfind(']')
-            if start == -1 or end == -1:
-                raise Exception("Can't find JSON array in text")
-            json_array_str = text[start:end + 1]
-            tag_codes = json.loads(json_array_str)
-            if not isinstance(tag_codes, list):
-                raise Exception("Result is not a list")
-
-            # 만약 추출 결과가 dict 배열인 경우, 'code' 필드만 빼내어 문자열 배열로 변환
-            if tag_codes and isinstance(tag_codes[0], dict):
-                tag_codes = [d.get("code", "") for d in tag_codes if "code" in d]
+        tag_codes = loads_llm_json(text, list)
+
+        # 만약 추출 결과가 dict 배열인 경우, 'code' 필드만 빼내어 문자열 배열로 변환
+        if tag_codes and isinstance(tag_codes[0], dict):
+            tag_codes = [d.get("code", "") for d in tag_codes if "code" in d]
+
+        return tag_codes
+
+@lru_cache(maxsize=16)
+def _render_system_prompt(template: str, tags_json: str) -> str:
+    """(template, 태그 목록 JSON) 별로 system prompt 를 한 번만 만들어 재사용합니다."""
+    tags_serializable = json.loads(tags_json)
+    return template.format(tags_json=json.dumps(tags_serializable, ensure_ascii=False, indent=2))
 
-            return tag_codes
-        except Exception as e:
-            raise Exception(str(e)) from e
 
 # 싱글톤으로 서비스를 사용하기 위함
 llm_service_singleton = LLMService()
\ No newline at end of file
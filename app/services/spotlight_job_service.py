@@ -0,0 +1,127 @@
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Dict, Optional, Tuple
+
+from app.core.config import EnvVariables
+from app.core.database import SessionLocal
+from app.schemas.spotlight_dto import SpotlightDto
+from app.services.spotlight_service import SpotlightService
+from app.util.date_utils import get_seoul_time
+
+logger = logging.getLogger(__name__)
+
+
+class SpotlightJobService:
+    """
+    spotlight 생성(메시지 조회, 점수 생성, summary 생성, 저장)을 백그라운드 워커에서 실행하고
+    job 상태를 메모리에 보관하는 서비스.
+
+    같은 요청(target_date, incremental, collapse_duplicates)으로 대기 중이거나 실행 중인 job 이 있으면 새 job 을 만들지 않고 기존 job 을 반환합니다.
+    job 상태는 프로세스 메모리에만 보관되므로, 여러 워커 프로세스로 서버를 띄우는 경우 job 을 제출한 프로세스에서만 조회됩니다.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or EnvVariables.SPOTLIGHT_JOB_WORKERS,
+            thread_name_prefix="spotlight-job"
+        )
+        self.lock = threading.Lock()
+        self.jobs: Dict[str, SpotlightDto.SpotlightJobRespDto] = {}
+        # {(target_date, incremental, collapse_duplicates): 대기 중이거나 실행 중인 job_id}
+        self.active_job_ids_by_key: Dict[Tuple[str, bool, bool], str] = {}
+
+    def submit_job(self, job_req_dto: SpotlightDto.SubmitSpotlightJobReqDto) -> SpotlightDto.SpotlightJobRespDto:
+        """
+        spotlight job 을 제출하고 즉시 job 상태를 반환합니다.
+        같은 요청(target_date, incremental, collapse_duplicates)의 job 이 이미 대기 중이거나 실행 중이라면 해당 job 을 그대로 반환합니다.
+        (예: incremental job 이 실행 중일 때 전체 생성 job 을 제출하면 새 job 을 만듭니다)
+        """
+        job_key = self._job_key(job_req_dto)
+        with self.lock:
+            self._evict_finished_jobs()
+
+            active_job_id = self.active_job_ids_by_key.get(job_key)
+            if active_job_id is not None:
+                logger.info(f"[SpotlightJob] {job_key} 의 job {active_job_id} 이 이미 진행 중이므로 해당 job 을 반환합니다.")
+                return self.jobs[active_job_id].model_copy()
+
+            job = SpotlightDto.SpotlightJobRespDto(
+                job_id=uuid.uuid4().hex,
+                target_date=job_req_dto.target_date,
+                incremental=job_req_dto.incremental,
+                collapse_duplicates=job_req_dto.collapse_duplicates,
+                status="pending",
+                stage="queued",
+                progress=0.0,
+                created_at=get_seoul_time(),
+            )
+            self.jobs[job.job_id] = job
+            self.active_job_ids_by_key[job_key] = job.job_id
+
+        self.executor.submit(self._run_job, job.job_id)
+        return job.model_copy()
+
+    def get_job(self, job_id: str) -> Optional[SpotlightDto.SpotlightJobRespDto]:
+        """job_id 의 현재 상태를 반환합니다. 존재하지 않거나 보관 기간이 지난 job 이면 None 을 반환합니다."""
+        with self.lock:
+            job = self.jobs.get(job_id)
+            return job.model_copy() if job else None
+
+    def _run_job(self, job_id: str) -> None:
+        """백그라운드 워커에서 spotlight 를 생성하고 job 상태를 갱신하는 메서드"""
+        with self.lock:
+            job = self.jobs[job_id].model_copy()
+        self._update_job(job_id, status="running")
+
+        db = SessionLocal()
+        try:
+            service = SpotlightService(
+                db,
+                progress_callback=lambda stage, progress: self._update_job(job_id, stage=stage, progress=progress)
+            )
+            result = service.get_spotlight(
+                SpotlightDto.GetSpotlightReqDto(
+                    target_date=job.target_date,
+                    incremental=job.incremental,
+                    collapse_duplicates=job.collapse_duplicates,
+                )
+            )
+            self._update_job(job_id, status="succeeded", stage="done", progress=1.0, result=result)
+        except Exception as e:
+            logger.error(f"[SpotlightJob] job {job_id} ({job.target_date}) 실패: {e}", exc_info=True)
+            self._update_job(job_id, status="failed", error=str(e))
+        finally:
+            db.close()
+            with self.lock:
+                self.jobs[job_id].finished_at = get_seoul_time()
+                job_key = self._job_key(job)
+                if self.active_job_ids_by_key.get(job_key) == job_id:
+                    del self.active_job_ids_by_key[job_key]
+
+    @staticmethod
+    def _job_key(job) -> Tuple[str, bool, bool]:
+        """SubmitSpotlightJobReqDto 또는 SpotlightJobRespDto 로 같은 요청의 job 인지 구분하는 키를 만듭니다."""
+        return job.target_date, job.incremental, job.collapse_duplicates
+
+    def _update_job(self, job_id: str, **fields) -> None:
+        with self.lock:
+            job = self.jobs[job_id]
+            for field, value in fields.items():
+                setattr(job, field, value)
+
+    def _evict_finished_jobs(self) -> None:
+        """보관 기간(SPOTLIGHT_JOB_RETENTION_SECONDS)이 지난 완료 job 을 메모리에서 제거합니다. lock 을 잡은 상태에서 호출해야 합니다."""
+        expire_before = get_seoul_time() - timedelta(seconds=EnvVariables.SPOTLIGHT_JOB_RETENTION_SECONDS)
+        expired_job_ids = [
+            job_id for job_id, job in self.jobs.items()
+            if job.finished_at is not None and job.finished_at < expire_before
+        ]
+        for job_id in expired_job_ids:
+            del self.jobs[job_id]
+
+
+# 싱글톤으로 서비스를 사용하기 위함 (job 상태와 워커를 프로세스 내에서 공유)
+spotlight_job_service_singleton = SpotlightJobService()
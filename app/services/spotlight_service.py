@@ -1,59 +1,319 @@
 import json
-import re
-from typing import List
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
 
-import ollama
 from datetime import datetime
 from sqlalchemy.orm import Session
 
+from app.clients.llm_providers.registry import get_provider
+from app.core.config import EnvVariables
 from app.repositories.tb_ka_message_repository import TbKaMessageRepository
+from app.repositories.tb_spotlight_chunk_summary_repository import SpotlightChunkSummaryRepository
 from app.repositories.tb_spotlight_score_repository import SpotlightScoreRepository
 from app.repositories.tb_spotlight_summary_repository import SpotlightSummaryRepository
 from app.schemas.feed_message_dto import FeedMessageDto
 from app.schemas.spotlight_dto import SpotlightDto
+from app.util.hash_utils import sha256_hex
+from app.util.json_utils import loads_llm_json
+from app.util.near_duplicate import cluster_near_duplicates
+from app.util.text_cleaner import TextCleaner
+from app.util.text_preprocessor import clean_for_summary_batch
+from app.util.token_utils import estimate_tokens
+
+logger = logging.getLogger(__name__)
 
 
 class SpotlightService:
 
-    def __init__(self, db: Session):
+    # Spotlight 점수/요약 생성에 사용하는 LLM provider 와 모델
+    SPOTLIGHT_PROVIDER = EnvVariables.SPOTLIGHT_LLM_PROVIDER.lower()
+    SPOTLIGHT_MODEL = EnvVariables.SPOTLIGHT_LLM_MODEL
+
+    # 점수/부분 요약 캐시의 model 키. 기존 ollama 캐시를 그대로 쓰도록 ollama 는 모델명만, 그 외 provider 는 "provider/모델" 로 구분한다.
+    SPOTLIGHT_CACHE_MODEL = SPOTLIGHT_MODEL if SPOTLIGHT_PROVIDER == "ollama" else f"{SPOTLIGHT_PROVIDER}/{SPOTLIGHT_MODEL}"
+
+    # 단건 점수 응답의 JSON schema. structured output 모드로 전달되어 응답이 0~100 의 정수 하나가 되도록 강제한다.
+    SCORE_SCHEMA = {"type": "integer", "minimum": 0, "maximum": 100}
+
+    # 유사 중복 메시지 탐지에 사용하는 텍스트 정제기 (불용어 파일을 한 번만 읽도록 공유한다)
+    TEXT_CLEANER = TextCleaner()
+
+    # 요약 프롬프트(SUMMARY_SYSTEM_PROMPT, CHUNK_SUMMARY_SYSTEM_PROMPT)가 바뀌면 올려서 기존 부분 요약 캐시를 무효화한다.
+    SUMMARY_PROMPT_VERSION = "v1"
+
+    # map-reduce 요약에서 부분 요약을 다시 요약하는 최대 단계 수
+    MAX_SUMMARY_REDUCE_LEVELS = 3
+
+    # 점수 프롬프트(SCORE_SYSTEM_PROMPT, BATCH_SCORE_SYSTEM_PROMPT)나 점수 기준이 바뀌면 올려서 기존 점수 캐시를 무효화한다.
+    SCORE_PROMPT_VERSION = "v1"
+
+    SCORE_SYSTEM_PROMPT = (
+        """
+        너는 대학교 게시판에 올라온 메시지를 평가하는 전문가야.
+        아래 메시지에 대해 학생들이 관심을 가질 만한 정도와 유용성을 고려해서 100점 만점 중 몇 점인지 평가해줘.
+        출력은 오직 숫자만, 추가 설명이나 텍스트 없이 오직 숫자만 출력해야 해.
+        
+        점수 기준:
+            - 분실물이나 판매글은 점수를 낮게 줘야해.
+        """
+    )
+
+    BATCH_SCORE_SYSTEM_PROMPT = (
+        """
+        너는 대학교 게시판에 올라온 메시지들을 평가하는 전문가야.
+        아래에 주어진 입력은 메시지 리스트로, 각 메시지는 다음 두 필드를 가진 JSON 객체야:
+            - id: 메시지의 식별자 (문자열)
+            - message: 메시지 내용 (문자열)
+        각 메시지에 대해 학생들이 관심을 가질 만한 정도와 유용성을 고려해서 100점 만점 중 몇 점인지 평가해줘.
+        출력은 반드시 입력된 모든 id 에 대한 점수를 담은 순수한 JSON 배열이어야 하고, 추가 설명이나 텍스트는 포함하면 안 돼.
+        
+        점수 기준:
+            - 분실물이나 판매글은 점수를 낮게 줘야해.
+        
+        출력 형식 예시:
+            [{"id": "1", "score": 85}, {"id": "2", "score": 60}]
+        """
+    )
+
+    SUMMARY_SYSTEM_PROMPT = (
+        """
+        Persona:
+            - 너는 대학교 게시판에 올라온 글을 종합하여, 전체적인 분위기와 핵심 정보를 오직 딱 한 문장으로 요약하는 한국인 전문가야.
+        
+        Instruction:
+            - 출력은 반드시 단 하나의 완성된 문장으로만 작성해야해.
+            - 답변은 반드시 한국어로 생성해.
+            - 출력 형식은 반드시 다음과 같아:
+                "오늘은 [핵심 정보] 한 정보들이 주로 나왔네요! 전반적으로 [분위기/트렌드] 한 분위기 인 듯해요!"
+        """
+    )
+
+    CHUNK_SUMMARY_SYSTEM_PROMPT = (
+        """
+        Persona:
+            - 너는 대학교 게시판에 올라온 글 묶음을 읽고 핵심만 정리하는 한국인 전문가야.
+        
+        Instruction:
+            - 주어진 글들에서 학생들에게 중요한 핵심 정보와 전반적인 분위기를 3문장 이내로 요약해.
+            - 답변은 반드시 한국어로 생성해.
+            - 요약 외의 다른 설명이나 텍스트는 포함하면 안 돼.
+        """
+    )
+
+    def __init__(self, db: Session, progress_callback: Optional[Callable[[str, float], None]] = None):
+        """
+        Args:
+            db: DB 세션
+            progress_callback: (stage, progress) 를 받아 진행 상황을 전달받는 콜백. 비동기 spotlight job 에서 사용합니다.
+        """
         self.db = db
         self.tb_ka_message_repository = TbKaMessageRepository(db)
+        self.progress_callback = progress_callback
 
-    def get_spotlight(self, spotlight_req_dto: SpotlightDto.GetSpotlightReqDto) -> SpotlightDto.GetSpotlightRespDto:
-        """target_date 의 spotlight 와 summary 를 반환 하는 메서드"""
+    def report_progress(self, stage: str, progress: float) -> None:
+        """progress_callback 이 있다면 현재 단계(stage)와 진행률(0.0 ~ 1.0)을 전달하는 메서드"""
+        if self.progress_callback:
+            self.progress_callback(stage, progress)
 
-        # target_date 에 업로드 된 신규 메세지를 가져온다.
-        fetch_feed_messages_by_date_serv_dto = self.fetch_feed_messages_by_date(spotlight_req_dto.target_date)
-
-        # 가져온 메세지들의 spotlight 점수 생성
-        generate_spotlight_score_serv_dtos = self.generate_spotlight_scores(fetch_feed_messages_by_date_serv_dto.messages)
+    def get_spotlight(self, spotlight_req_dto: SpotlightDto.GetSpotlightReqDto) -> SpotlightDto.GetSpotlightRespDto:
+        """
+        target_date 의 spotlight 와 summary 를 반환 하는 메서드
 
-        # 스코어 DB에 저장
+        (메시지 해시, 프롬프트 버전, 모델) 이 같은 점수가 이미 TbSpotlightScore 에 있으면 LLM 을 호출하지 않고 재사용합니다.
+        incremental 모드에서는 target_date 의 TbSpotlightScore 가 아직 없거나 점수 생성에 실패한 (-1) 메시지만 가져와 점수를 매기며,
+        응답에는 해당 날짜에 저장된 모든 점수가 담깁니다.
+        summary 는 점수가 매겨진 메시지 집합이 마지막 summary 생성 시점과 달라진 경우에만 다시 생성합니다.
+        유사 중복 메시지는 대표 메시지 하나만 LLM 으로 점수를 매기며, collapse_duplicates 이면 응답에서도 대표 메시지만 남깁니다.
+        """
+        target_date = spotlight_req_dto.target_date
         score_repo = SpotlightScoreRepository(self.db)
-        score_repo.save_scores(generate_spotlight_score_serv_dtos, spotlight_req_dto.target_date)
 
-        # 가져온 메세지들의 spotlight summary 생성
-        generated_summary = self.generate_spotlight_summary(fetch_feed_messages_by_date_serv_dto.messages)
-
-        # summary DB에 저장
-        summary_repo = SpotlightSummaryRepository(self.db)
-        summary_repo.save_summary(generated_summary, spotlight_req_dto.target_date)
+        self.report_progress("fetching", 0.0)
+        if spotlight_req_dto.incremental:
+            # target_date 에 업로드 된 메세지 중 아직 점수가 없거나 실패한 (-1) 메세지만 가져온다.
+            messages = self.fetch_unscored_feed_messages_by_date(target_date).messages
+        else:
+            # target_date 에 업로드 된 신규 메세지를 가져온다.
+            messages = self.fetch_feed_messages_by_date(target_date).messages
+
+        # 가져온 메세지들의 spotlight 점수 생성 후 DB에 저장
+        generate_spotlight_score_serv_dtos = self.generate_and_save_scores(messages, target_date, score_repo)
+        if spotlight_req_dto.incremental:
+            generate_spotlight_score_serv_dtos = score_repo.get_scores_by_date(target_date)
+
+        # 점수가 매겨진 메세지 집합이 바뀐 경우에만 spotlight summary 생성 후 DB에 저장
+        self.report_progress("summarizing", 0.8)
+        generated_summary = self.get_or_generate_summary(
+            target_date, score_repo, None if spotlight_req_dto.incremental else messages
+        )
 
+        # 응답의 점수 목록에서 유사 중복 메시지는 대표 메시지 하나만 남긴다.
+        if spotlight_req_dto.collapse_duplicates:
+            if spotlight_req_dto.incremental:
+                messages = self.fetch_feed_messages_by_date(target_date).messages
+            generate_spotlight_score_serv_dtos = self.collapse_duplicate_scores(generate_spotlight_score_serv_dtos, messages)
 
         # 생성된 spotlight score 와 summary 로 최종 response dto 생성
         get_spotlight_resp_dto = SpotlightDto.GetSpotlightRespDto(
-            for_date = spotlight_req_dto.target_date,
+            for_date = target_date,
             summary = generated_summary,
             scores = generate_spotlight_score_serv_dtos
         )
 
+        self.report_progress("done", 1.0)
         return get_spotlight_resp_dto
 
+    def get_stored_spotlight(self, target_date: str) -> SpotlightDto.GetSpotlightRespDto | None:
+        """
+        LLM 을 호출하지 않고 target_date 에 저장된 spotlight 점수와 summary 만 조회하는 메서드.
+        저장된 summary 가 없다면 None 을 반환합니다.
+        """
+        latest_summary = SpotlightSummaryRepository(self.db).find_latest_summary(target_date)
+        if latest_summary is None:
+            return None
+
+        return SpotlightDto.GetSpotlightRespDto(
+            for_date=target_date,
+            summary=latest_summary.summary,
+            scores=SpotlightScoreRepository(self.db).get_scores_by_date(target_date)
+        )
+
+    def generate_and_save_scores(self,
+                                 messages: List[FeedMessageDto],
+                                 target_date: str,
+                                 score_repo: SpotlightScoreRepository) -> List[SpotlightDto.GenerateSpotlightScoreServDto]:
+        """
+        messages 의 spotlight 점수를 생성하여 DB 에 저장하고, 입력 순서대로 반환하는 메서드.
+        점수 캐시에 있는 메시지는 LLM 을 호출하지 않고 캐시된 점수를 사용합니다.
+        유사 중복으로 대표의 점수를 공유한 메시지는 점수 캐시에 남기지 않도록 message_hash 없이 저장합니다.
+        """
+        message_hashes = {msg.id: self.compute_message_hash(msg.message) for msg in messages}
+        cached_scores = score_repo.find_cached_scores(
+            list(message_hashes.values()), self.SCORE_PROMPT_VERSION, self.SPOTLIGHT_CACHE_MODEL
+        )
+        uncached_messages = [msg for msg in messages if message_hashes[msg.id] not in cached_scores]
+
+        # 유사 중복 메시지는 묶음의 대표 메시지만 점수를 매기고, 나머지는 대표의 점수를 그대로 사용한다.
+        representative_ids = self.find_representative_ids(uncached_messages)
+        representative_messages = [msg for msg in uncached_messages if representative_ids[msg.id] == msg.id]
+
+        # 점수 생성 단계는 전체 진행률의 0.1 ~ 0.7 구간으로 보고한다.
+        self.report_progress("scoring", 0.1)
+        new_scores = {
+            score_dto.tb_ka_message_id: score_dto.score
+            for score_dto in self.generate_spotlight_scores(
+                representative_messages,
+                progress_callback=lambda done, total: self.report_progress("scoring", 0.1 + 0.6 * done / total)
+            )
+        }
+        new_scores.update({
+            msg.id: new_scores[representative_ids[msg.id]]
+            for msg in uncached_messages if representative_ids[msg.id] != msg.id
+        })
+        logger.info(
+            f"[{target_date}] 점수 캐시 적중 {len(messages) - len(uncached_messages)}건, "
+            f"신규 생성 {len(representative_messages)}건, 유사 중복 공유 {len(uncached_messages) - len(representative_messages)}건"
+        )
+
+        generate_spotlight_score_serv_dtos = [
+            SpotlightDto.GenerateSpotlightScoreServDto(
+                tb_ka_message_id=msg.id,
+                score=new_scores[msg.id] if msg.id in new_scores else cached_scores[message_hashes[msg.id]]
+            )
+            for msg in messages
+        ]
+
+        # 대표의 점수를 빌려 쓴 유사 중복 메시지는 LLM 이 직접 매긴 점수가 아니므로 캐시 키(message_hash) 없이 저장한다.
+        cacheable_message_hashes = {
+            msg.id: message_hashes[msg.id]
+            for msg in messages if representative_ids.get(msg.id, msg.id) == msg.id
+        }
+
+        if generate_spotlight_score_serv_dtos:
+            score_repo.save_scores(
+                generate_spotlight_score_serv_dtos, target_date,
+                message_hashes=cacheable_message_hashes,
+                prompt_version=self.SCORE_PROMPT_VERSION,
+                model=self.SPOTLIGHT_CACHE_MODEL
+            )
+
+        return generate_spotlight_score_serv_dtos
+
+    def get_or_generate_summary(self,
+                                target_date: str,
+                                score_repo: SpotlightScoreRepository,
+                                messages: List[FeedMessageDto] | None = None) -> str:
+        """
+        target_date 의 summary 를 반환하는 메서드.
+
+        점수가 매겨진 메시지 id 집합의 해시가 가장 최근 summary 의 message_set_hash 와 같으면 저장된 summary 를 재사용하고,
+        다르면 summary 를 새로 생성하여 저장합니다. messages 가 주어지지 않으면 target_date 의 메시지를 새로 조회합니다.
+        """
+        summary_repo = SpotlightSummaryRepository(self.db)
+
+        message_set_hash = self.compute_message_set_hash(score_repo.get_scored_message_ids(target_date))
+        latest_summary = summary_repo.find_latest_summary(target_date)
+        if latest_summary is not None and latest_summary.message_set_hash == message_set_hash:
+            logger.info(f"[{target_date}] 점수가 매겨진 메시지 집합이 바뀌지 않아 저장된 summary 를 재사용합니다.")
+            return latest_summary.summary
+
+        if messages is None:
+            messages = self.fetch_feed_messages_by_date(target_date).messages
+
+        generated_summary = self.generate_spotlight_summary(messages)
+        summary_repo.save_summary(generated_summary, target_date, message_set_hash=message_set_hash)
+        return generated_summary
+
+    @staticmethod
+    def find_representative_ids(messages: List[FeedMessageDto]) -> Dict[str, str]:
+        """
+        messages 를 TextCleaner 로 정제한 텍스트 기준으로 유사 중복끼리 묶고, {메시지 id: 묶음의 대표 메시지 id} 를 반환하는 메서드.
+        NEAR_DUPLICATE_DEDUP 이 꺼져 있으면 모든 메시지가 자기 자신의 대표입니다.
+        """
+        if not EnvVariables.NEAR_DUPLICATE_DEDUP or len(messages) < 2:
+            return {msg.id: msg.id for msg in messages}
+
+        representatives = cluster_near_duplicates(SpotlightService.TEXT_CLEANER.clean_batch(msg.message for msg in messages))
+        return {msg.id: messages[representative].id for msg, representative in zip(messages, representatives)}
+
+    @staticmethod
+    def collapse_duplicate_scores(scores: List[SpotlightDto.GenerateSpotlightScoreServDto],
+                                  messages: List[FeedMessageDto]) -> List[SpotlightDto.GenerateSpotlightScoreServDto]:
+        """
+        유사 중복 메시지의 점수 중 묶음의 대표 메시지 점수 하나만 남겨 반환하는 메서드. (입력 순서 유지)
+        messages 에 없는 메시지의 점수는 그대로 남깁니다.
+        """
+        representative_ids = SpotlightService.find_representative_ids(messages)
+        return [
+            score_dto for score_dto in scores
+            if representative_ids.get(score_dto.tb_ka_message_id, score_dto.tb_ka_message_id) == score_dto.tb_ka_message_id
+        ]
+
+    @staticmethod
+    def compute_message_hash(message: str) -> str:
+        """점수 캐시 키로 사용할 메시지 본문의 해시를 계산하는 메서드"""
+        return sha256_hex(message.strip())
+
+    @staticmethod
+    def compute_message_set_hash(message_ids) -> str:
+        """메시지 id 집합의 순서와 무관한 해시를 계산하는 메서드"""
+        return sha256_hex(",".join(sorted(message_ids)))
+
 
     def fetch_feed_messages_by_date(self, target_date: str) -> SpotlightDto.FetchFeedMessagesByDateServDto:
         """target_date 에 업로드된 신규 메세지들을 가져오는 메서드"""
         messages = self.tb_ka_message_repository.get_messages_by_date(target_date)
+        return self.to_fetch_feed_messages_by_date_serv_dto(target_date, messages)
 
+    def fetch_unscored_feed_messages_by_date(self, target_date: str) -> SpotlightDto.FetchFeedMessagesByDateServDto:
+        """target_date 에 업로드된 신규 메세지들 중 아직 spotlight 점수가 없거나 실패한 (-1) 메세지들을 가져오는 메서드"""
+        messages = self.tb_ka_message_repository.get_unscored_messages_by_date(target_date)
+        return self.to_fetch_feed_messages_by_date_serv_dto(target_date, messages)
+
+    @staticmethod
+    def to_fetch_feed_messages_by_date_serv_dto(target_date: str, messages) -> SpotlightDto.FetchFeedMessagesByDateServDto:
+        """조회된 메세지 row 들을 FetchFeedMessagesByDateServDto 로 변환하는 메서드"""
         converted_messages = []
         for msg in messages:
             msg_dict = dict(msg)
@@ -134,8 +394,7 @@ class SpotlightService:
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": converted_content}
         ]
-        llm_resp = ollama.chat(model="mistral", messages=messages)
-        llm_content = llm_resp["message"]["content"]
+        llm_content = SpotlightService.request_chat(messages)
         print("LLM response content:", llm_content)
 
         # try:
@@ -153,108 +412,281 @@ class SpotlightService:
         return dto
 
     @staticmethod
-    def generate_spotlight_scores(messages: List[FeedMessageDto]) -> List[SpotlightDto.GenerateSpotlightScoreServDto]:
+    def generate_spotlight_scores(messages: List[FeedMessageDto],
+                                  max_workers: int | None = None,
+                                  progress_callback: Optional[Callable[[int, int], None]] = None) -> List[SpotlightDto.GenerateSpotlightScoreServDto]:
         """
-        각 FeedMessageDto 객체에 대해 개별적으로 100점 만점의 점수를 LLM에게 받아
+        각 FeedMessageDto 객체에 대해 100점 만점의 점수를 LLM에게 받아
         숫자 배열로 반환하는 메서드.
 
+        메시지는 SPOTLIGHT_SCORE_BATCH_SIZE 개, SPOTLIGHT_SCORE_BATCH_TOKEN_BUDGET 토큰 이내로 묶여
+        하나의 프롬프트로 평가되며, 배치 단위 LLM 호출은 최대 max_workers 개까지 동시에 수행됩니다
+        (기본값: SPOTLIGHT_SCORE_CONCURRENCY). 결과는 입력 messages 의 순서를 그대로 유지합니다.
+        progress_callback 이 주어지면 배치 결과를 받을 때마다 (점수가 매겨진 메시지 수, 전체 메시지 수) 로 호출합니다.
+
         IMPORTANT: 만약 LLM 응답을 Int 형으로 캐스팅 할 때 ValueError (실패) 발생시 -1 로 저장.
         """
+        if not messages:
+            return []
+
+        batches = SpotlightService.build_score_batches(messages)
 
+        max_workers = max_workers or EnvVariables.SPOTLIGHT_SCORE_CONCURRENCY
+        max_workers = max(1, min(max_workers, len(batches)))
+
+        # 배치는 입력 순서대로 잘려 있고 executor.map 도 입력 순서대로 결과를 돌려주므로 별도의 정렬이 필요 없다.
         generate_spotlight_score_serv_dtos: List[SpotlightDto.GenerateSpotlightScoreServDto] = []
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="spotlight-score") as executor:
+            for batch_result in executor.map(SpotlightService.generate_spotlight_score_batch, batches):
+                generate_spotlight_score_serv_dtos.extend(batch_result)
+                if progress_callback:
+                    progress_callback(len(generate_spotlight_score_serv_dtos), len(messages))
 
-        system_prompt = (
-            """
-            너는 대학교 게시판에 올라온 메시지를 평가하는 전문가야.
-            아래 메시지에 대해 학생들이 관심을 가질 만한 정도와 유용성을 고려해서 100점 만점 중 몇 점인지 평가해줘.
-            출력은 오직 숫자만, 추가 설명이나 텍스트 없이 오직 숫자만 출력해야 해.
-            
-            점수 기준:
-                - 분실물이나 판매글은 점수를 낮게 줘야해.
-            """
-        )
+        return generate_spotlight_score_serv_dtos
+
+    @staticmethod
+    def build_score_batches(messages: List[FeedMessageDto],
+                            batch_size: int | None = None,
+                            token_budget: int | None = None) -> List[List[FeedMessageDto]]:
+        """
+        messages 를 입력 순서대로 최대 batch_size 개, token_budget 토큰 이내의 배치로 나누는 메서드.
+        단일 메시지가 token_budget 을 넘는 경우 해당 메시지만 담은 배치로 분리합니다.
+        """
+        batch_size = batch_size or EnvVariables.SPOTLIGHT_SCORE_BATCH_SIZE
+        token_budget = token_budget or EnvVariables.SPOTLIGHT_SCORE_BATCH_TOKEN_BUDGET
+
+        batches: List[List[FeedMessageDto]] = []
+        current_batch: List[FeedMessageDto] = []
+        current_tokens = 0
 
         for msg in messages:
-            prompts = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": msg.message}
-            ]
+            msg_tokens = estimate_tokens(msg.message)
+            if current_batch and (len(current_batch) >= batch_size or current_tokens + msg_tokens > token_budget):
+                batches.append(current_batch)
+                current_batch, current_tokens = [], 0
+            current_batch.append(msg)
+            current_tokens += msg_tokens
+
+        if current_batch:
+            batches.append(current_batch)
+        return batches
+
+    @staticmethod
+    def generate_spotlight_score_batch(batch: List[FeedMessageDto]) -> List[SpotlightDto.GenerateSpotlightScoreServDto]:
+        """
+        여러 메시지를 하나의 프롬프트로 묶어 점수를 받는 메서드.
+
+        메시지마다 배치 내 순번("1", "2", ...)을 id 로 부여하여 LLM 에 전달하고, 응답 배열의 id 로
+        tb_ka_message_id 를 다시 찾아 매핑합니다. 응답에서 누락되었거나 점수가 올바르지 않은 메시지는
+        generate_spotlight_score 를 통해 단건으로 다시 평가합니다.
+        """
+        if len(batch) == 1:
+            return [SpotlightService.generate_spotlight_score(batch[0])]
+
+        batch_ids = [str(i) for i in range(1, len(batch) + 1)]
+        content = json.dumps(
+            [{"id": batch_id, "message": msg.message} for batch_id, msg in zip(batch_ids, batch)],
+            ensure_ascii=False
+        )
+        prompts = [
+            {"role": "system", "content": SpotlightService.BATCH_SCORE_SYSTEM_PROMPT},
+            {"role": "user", "content": content}
+        ]
 
-            llm_resp = ollama.chat(model="mistral", messages=prompts)
-            llm_content = llm_resp["message"]["content"].strip()
-            print(f"LLM 응답 (메시지 ID {msg.id}): {llm_content}")
+        try:
+            llm_content = SpotlightService.request_chat(
+                prompts, SpotlightService.get_batch_score_schema(len(batch_ids))
+            ).strip()
+            logger.info(f"LLM 배치 응답 (메시지 {len(batch)}건): {llm_content}")
+            scores_by_batch_id = SpotlightService.extract_batch_scores(llm_content, set(batch_ids))
+        except Exception as e:
+            logger.error(f"배치 점수 생성 실패, 단건 평가로 전환합니다 (메시지 {len(batch)}건): {e}")
+            scores_by_batch_id = {}
+
+        results: List[SpotlightDto.GenerateSpotlightScoreServDto] = []
+        for batch_id, msg in zip(batch_ids, batch):
+            if batch_id in scores_by_batch_id:
+                results.append(SpotlightDto.GenerateSpotlightScoreServDto(
+                    tb_ka_message_id=msg.id,
+                    score=scores_by_batch_id[batch_id]
+                ))
+            else:
+                logger.warning(f"배치 응답에 유효한 점수가 없어 단건 평가합니다 (메시지 ID {msg.id})")
+                results.append(SpotlightService.generate_spotlight_score(msg))
+        return results
 
+    @staticmethod
+    def extract_batch_scores(text: str, valid_ids: set) -> dict:
+        """
+        배치 점수 응답(JSON 배열)에서 {id: score} 딕셔너리를 추출하는 메서드.
+        id 가 valid_ids 에 없거나, 점수가 0~100 사이의 정수가 아닌 항목은 제외합니다.
+        """
+        items = loads_llm_json(text, list)
+
+        scores = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            batch_id = str(item.get("id"))
             try:
-                score = int(llm_content)
-            except ValueError as e:
-                # IMPORTANT: int 형으로 변경 실패시 -1 처리
-                score = -1
+                score = int(item.get("score"))
+            except (TypeError, ValueError):
+                continue
+            if batch_id in valid_ids and batch_id not in scores and 0 <= score <= 100:
+                scores[batch_id] = score
+        return scores
 
-            generate_spotlight_score_serv_dtos.append(SpotlightDto.GenerateSpotlightScoreServDto(
-                tb_ka_message_id=msg.id,
-                score=score
-            ))
+    @staticmethod
+    def generate_spotlight_score(msg: FeedMessageDto) -> SpotlightDto.GenerateSpotlightScoreServDto:
+        """
+        단일 메시지에 대해 LLM 에게 100점 만점의 점수를 받아 DTO 로 반환하는 메서드.
+        SCORE_SCHEMA 의 structured output 모드로 호출하므로 응답은 정수 하나의 JSON 입니다.
 
-        return generate_spotlight_score_serv_dtos
+        IMPORTANT: 만약 LLM 응답을 Int 형으로 캐스팅 할 때 ValueError (실패) 발생시 -1 로 저장.
+        """
+        prompts = [
+            {"role": "system", "content": SpotlightService.SCORE_SYSTEM_PROMPT},
+            {"role": "user", "content": msg.message}
+        ]
+
+        llm_content = SpotlightService.request_chat(prompts, SpotlightService.SCORE_SCHEMA).strip()
+        logger.info(f"LLM 응답 (메시지 ID {msg.id}): {llm_content}")
+
+        try:
+            score = int(llm_content)
+        except ValueError:
+            # IMPORTANT: int 형으로 변경 실패시 -1 처리
+            score = -1
+
+        return SpotlightDto.GenerateSpotlightScoreServDto(
+            tb_ka_message_id=msg.id,
+            score=score
+        )
 
     def generate_spotlight_summary(self, messages: List[FeedMessageDto]) -> str:
+        """
+        messages 전체를 종합한 한 문장 summary 를 생성하는 메서드.
 
-        preprocessed_messages = self.preprocess_messages(messages)
-
-        print(preprocessed_messages)
-
-        system_prompt = (
-            """
-            Persona:
-                - 너는 대학교 게시판에 올라온 글을 종합하여, 전체적인 분위기와 핵심 정보를 오직 딱 한 문장으로 요약하는 한국인 전문가야.
-            
-            Instruction:
-                - 출력은 반드시 단 하나의 완성된 문장으로만 작성해야해.
-                - 답변은 반드시 한국어로 생성해.
-                - 출력 형식은 반드시 다음과 같아:
-                    "오늘은 [핵심 정보] 한 정보들이 주로 나왔네요! 전반적으로 [분위기/트렌드] 한 분위기 인 듯해요!"
-            """
+        전처리된 메시지가 SPOTLIGHT_SUMMARY_CHUNK_TOKEN_BUDGET 을 넘으면 map-reduce 방식으로 요약합니다.
+          1. 메시지를 토큰 예산 단위의 chunk 로 나누어 chunk 별 부분 요약을 병렬로 생성합니다. (map)
+          2. 부분 요약들이 여전히 예산을 넘으면 부분 요약들을 다시 chunk 로 묶어 한 단계 더 요약합니다.
+          3. 최종 부분 요약들을 정해진 한 문장 형식으로 요약합니다. (reduce)
+        부분 요약은 TbSpotlightChunkSummary 에 캐시되므로, 재실행 시 내용이 바뀌지 않은 chunk 는 LLM 을 호출하지 않습니다.
+        """
+        texts = self.preprocess_message_texts(messages)
+        token_budget = EnvVariables.SPOTLIGHT_SUMMARY_CHUNK_TOKEN_BUDGET
+
+        for level in range(1, self.MAX_SUMMARY_REDUCE_LEVELS + 1):
+            if len(texts) <= 1 or estimate_tokens("\n".join(texts)) <= token_budget:
+                break
+            chunks = self.build_summary_chunks(texts, token_budget)
+            logger.info(f"summary map 단계 {level}: 텍스트 {len(texts)}건을 chunk {len(chunks)}개로 나누어 요약합니다.")
+            texts = self.summarize_chunks(chunks)
+
+        return self.request_summary(
+            self.SUMMARY_SYSTEM_PROMPT,
+            "".join(text + "\n" for text in texts)
         )
 
+    @staticmethod
+    def build_summary_chunks(texts: List[str], token_budget: int) -> List[List[str]]:
+        """
+        texts 를 입력 순서대로 token_budget 토큰 이내의 chunk 로 나누는 메서드.
+        메시지가 시간 순으로 정렬되어 있으므로 늦게 도착한 메시지는 마지막 chunk 에만 영향을 줍니다.
+        """
+        chunks: List[List[str]] = []
+        current_chunk: List[str] = []
+        current_tokens = 0
+
+        for text in texts:
+            text_tokens = estimate_tokens(text)
+            if current_chunk and current_tokens + text_tokens > token_budget:
+                chunks.append(current_chunk)
+                current_chunk, current_tokens = [], 0
+            current_chunk.append(text)
+            current_tokens += text_tokens
+
+        if current_chunk:
+            chunks.append(current_chunk)
+        return chunks
+
+    def summarize_chunks(self, chunks: List[List[str]]) -> List[str]:
+        """
+        각 chunk 의 부분 요약을 입력 순서대로 반환하는 메서드.
+        캐시에 없는 chunk 만 최대 SPOTLIGHT_SUMMARY_CONCURRENCY 개까지 동시에 요약하고, 새로 만든 부분 요약은 캐시에 저장합니다.
+        """
+        chunk_repo = SpotlightChunkSummaryRepository(self.db)
+
+        chunk_contents = ["".join(text + "\n" for text in chunk) for chunk in chunks]
+        chunk_hashes = [sha256_hex(content) for content in chunk_contents]
+        summaries = chunk_repo.find_summaries(chunk_hashes, self.SUMMARY_PROMPT_VERSION, self.SPOTLIGHT_CACHE_MODEL)
+
+        missing = {
+            chunk_hash: content
+            for chunk_hash, content in zip(chunk_hashes, chunk_contents)
+            if chunk_hash not in summaries
+        }
+        logger.info(f"부분 요약 캐시 적중 {len(set(chunk_hashes)) - len(missing)}건, 신규 생성 {len(missing)}건")
+
+        if missing:
+            max_workers = max(1, min(EnvVariables.SPOTLIGHT_SUMMARY_CONCURRENCY, len(missing)))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="spotlight-summary") as executor:
+                new_summaries = dict(zip(
+                    missing.keys(),
+                    executor.map(
+                        lambda content: self.request_summary(self.CHUNK_SUMMARY_SYSTEM_PROMPT, content),
+                        missing.values()
+                    )
+                ))
+            chunk_repo.save_summaries(new_summaries, self.SUMMARY_PROMPT_VERSION, self.SPOTLIGHT_CACHE_MODEL)
+            summaries.update(new_summaries)
+
+        return [summaries[chunk_hash] for chunk_hash in chunk_hashes]
+
+    @staticmethod
+    def request_summary(system_prompt: str, content: str) -> str:
+        """system_prompt 와 content 로 LLM 에 요약을 요청하고 응답 텍스트를 반환하는 메서드"""
         prompts = [
             {"role": "system", "content": system_prompt},
-            {"role": "user", "content": preprocessed_messages}
+            {"role": "user", "content": content}
         ]
 
-        llm_resp = ollama.chat(model="mistral", messages=prompts)
-        llm_content = llm_resp["message"]["content"].strip()
+        llm_content = SpotlightService.request_chat(prompts).strip()
 
-        print(f"LLM 응답: {llm_content}")
-        summary:str = llm_content
+        logger.info(f"LLM 요약 응답: {llm_content}")
+        return llm_content
 
-        return summary
+    @staticmethod
+    def request_chat(prompts: List[dict], json_schema: dict | None = None) -> str:
+        """SPOTLIGHT_LLM_PROVIDER 의 provider 로 SPOTLIGHT_LLM_MODEL 모델을 호출하고 응답 텍스트를 반환하는 메서드"""
+        response = get_provider(SpotlightService.SPOTLIGHT_PROVIDER).chat_sync(
+            prompts, model=SpotlightService.SPOTLIGHT_MODEL, json_schema=json_schema
+        )
+        return response.text
 
+    @staticmethod
+    def get_batch_score_schema(batch_size: int) -> dict:
+        """배치 점수 응답([{"id": ..., "score": ...}, ...])의 JSON schema"""
+        return {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string", "enum": [str(i) for i in range(1, batch_size + 1)]},
+                    "score": SpotlightService.SCORE_SCHEMA,
+                },
+                "required": ["id", "score"],
+            },
+            "minItems": batch_size,
+            "maxItems": batch_size,
+        }
 
     @staticmethod
     def preprocess_messages(messages) -> str:
-        # result = {}
-        # for i, msg in enumerate(messages, start=1):
-        #     text = msg.message
-        #     # URL 제거
-        #     text = re.sub(r'https?://\S+', '', text)
-        #     # 모든 특수문자 제거 (문자, 숫자, 공백만 남김; Unicode 문자를 포함)
-        #     text = re.sub(r'[^\w\s]', '', text, flags=re.UNICODE)
-        #     # 앞뒤 공백 제거
-        #     text = text.strip()
-        #     # 각 메시지를 "message1", "message2", ... 키로 저장
-        #     result[f"message{i}"] = text
-        # # JSON 문자열 형식으로 리턴 (들여쓰기로 가독성 높임)
-        # return json.dumps(result, ensure_ascii=False, indent=2)
-        result = ""
-        for i, msg in enumerate(messages, start=1):
-            text = msg.message
-            # URL 제거
-            text = re.sub(r'https?://\S+', '', text)
-            # 모든 특수문자 제거 (문자, 숫자, 공백만 남김; Unicode 문자를 포함)
-            text = re.sub(r'[^\w\s]', '', text, flags=re.UNICODE)
-            # 앞뒤 공백 제거
-            text = text.strip()
-            # 각 메시지를 "message1", "message2", ... 키로 저장
-            result += text
-            result += "\n"
-        return result
+        """메시지들을 전처리하여 한 줄에 하나씩 이어 붙인 문자열로 반환하는 메서드"""
+        return "".join(text + "\n" for text in SpotlightService.preprocess_message_texts(messages))
+
+    @staticmethod
+    def preprocess_message_texts(messages) -> List[str]:
+        """메시지마다 URL 과 특수문자를 제거한 텍스트를 입력 순서대로 반환하는 메서드"""
+        return clean_for_summary_batch(msg.message for msg in messages)
@@ -0,0 +1,132 @@
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import Dict, List
+
+from app.core.config import EnvVariables
+from app.core.database import SessionLocal
+from app.repositories.tb_tag_assignment_cache_repository import TagAssignmentCacheRepository
+from app.schemas.tag_labeling_dto import TagAssignmentCacheStatsRespDto
+from app.util.date_utils import get_seoul_time
+from app.util.hash_utils import sha256_hex
+
+logger = logging.getLogger(__name__)
+
+
+class TagAssignmentCacheService:
+    """
+    (정제된 메시지 해시, 태그 목록 해시, 모델) 별 태그 할당 결과를 TbTagAssignmentCache 에 저장하고 재사용하는 캐시.
+
+    - 여러 채팅방에 다시 올라온 같은 공지나, 실패 로그로 다시 들어온 메시지는 LLM 을 호출하지 않고 저장된 태그를 사용합니다.
+    - TAG_ASSIGNMENT_CACHE_TTL_SECONDS 가 지난 결과는 사용하지 않으며, row 수가 TAG_ASSIGNMENT_CACHE_MAX_ENTRIES 를 넘으면
+      마지막으로 사용된 시각(last_hit_at)이 오래된 순으로 삭제합니다. (LRU)
+    - pipeline 워커 스레드에서 호출되므로 호출마다 별도의 DB Session 을 열어 사용하며,
+      캐시 조회/저장 실패는 로그만 남기고 태그 할당을 계속 진행합니다.
+    """
+
+    # 캐시를 저장한 뒤 TTL/LRU 삭제를 수행하는 최소 간격(초)
+    EVICTION_INTERVAL_SECONDS = 300
+
+    def __init__(self):
+        self.enabled = EnvVariables.TAG_ASSIGNMENT_CACHE
+        self.ttl_seconds = EnvVariables.TAG_ASSIGNMENT_CACHE_TTL_SECONDS
+        self.max_entries = EnvVariables.TAG_ASSIGNMENT_CACHE_MAX_ENTRIES
+        self.hits = 0
+        self.misses = 0
+        self.last_evicted_at = 0.0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def compute_message_hash(cleaned_message: str) -> str:
+        return sha256_hex(cleaned_message)
+
+    def get_many(self, cleaned_messages: List[str], catalog_hash: str, model: str) -> Dict[str, List[str]]:
+        """
+        정제된 메시지들의 캐시된 태그 코드를 조회하여 {message_hash: tag_codes} 로 반환합니다.
+        조회한 메시지 수 기준으로 hit/miss 를 집계합니다.
+        """
+        if not self.enabled or not cleaned_messages:
+            return {}
+
+        message_hashes = [self.compute_message_hash(message) for message in cleaned_messages]
+        db = SessionLocal()
+        try:
+            created_after = get_seoul_time() - timedelta(seconds=self.ttl_seconds)
+            cached = TagAssignmentCacheRepository(db).find_tag_codes(message_hashes, catalog_hash, model, created_after)
+        except Exception as e:
+            logger.warning(f"[TagAssignmentCache] 캐시 조회 실패, LLM 으로 태그를 할당합니다: {e}")
+            cached = {}
+        finally:
+            db.close()
+
+        hits = sum(1 for message_hash in message_hashes if message_hash in cached)
+        with self.lock:
+            self.hits += hits
+            self.misses += len(message_hashes) - hits
+        return cached
+
+    def put_many(self, tag_codes_by_message: Dict[str, List[str]], catalog_hash: str, model: str) -> None:
+        """{cleaned_message: tag_codes} 형태의 태그 할당 결과를 캐시에 저장합니다."""
+        if not self.enabled or not tag_codes_by_message:
+            return
+
+        db = SessionLocal()
+        try:
+            repository = TagAssignmentCacheRepository(db)
+            message_hashes = {message: self.compute_message_hash(message) for message in tag_codes_by_message}
+            repository.save_tag_codes(
+                {message_hashes[message]: tag_codes for message, tag_codes in tag_codes_by_message.items()},
+                catalog_hash,
+                model,
+                messages_by_hash={message_hash: message for message, message_hash in message_hashes.items()},
+            )
+            if self._should_evict():
+                self._evict(repository)
+        except Exception as e:
+            logger.warning(f"[TagAssignmentCache] 캐시 저장 실패: {e}")
+        finally:
+            db.close()
+
+    def get_stats(self) -> TagAssignmentCacheStatsRespDto:
+        with self.lock:
+            hits, misses = self.hits, self.misses
+
+        entries = None
+        if self.enabled:
+            db = SessionLocal()
+            try:
+                entries = TagAssignmentCacheRepository(db).count()
+            except Exception as e:
+                logger.warning(f"[TagAssignmentCache] 캐시 row 수 조회 실패: {e}")
+            finally:
+                db.close()
+
+        return TagAssignmentCacheStatsRespDto(
+            enabled=self.enabled,
+            hits=hits,
+            misses=misses,
+            hit_rate=hits / (hits + misses) if hits + misses else 0.0,
+            entries=entries,
+            ttl_seconds=self.ttl_seconds,
+            max_entries=self.max_entries,
+        )
+
+    def _should_evict(self) -> bool:
+        """여러 워커가 동시에 삭제하지 않도록, EVICTION_INTERVAL_SECONDS 마다 한 번만 true 를 반환합니다."""
+        now = time.monotonic()
+        with self.lock:
+            if now - self.last_evicted_at < self.EVICTION_INTERVAL_SECONDS:
+                return False
+            self.last_evicted_at = now
+            return True
+
+    def _evict(self, repository: TagAssignmentCacheRepository) -> None:
+        expired = repository.delete_expired(get_seoul_time() - timedelta(seconds=self.ttl_seconds))
+        evicted = repository.delete_least_recently_used(self.max_entries)
+        if expired or evicted:
+            logger.info(f"[TagAssignmentCache] 만료 {expired}건, LRU {evicted}건 삭제")
+
+
+# 싱글톤으로 서비스를 사용하기 위함
+tag_assignment_cache_service_singleton = TagAssignmentCacheService()
@@ -0,0 +1,448 @@
+"""
+태그 할당을 마스킹(CPU) → LLM 호출(I/O, rate limit) → feed-app 저장(I/O) 단계로 나누어 동시에 실행하는 pipeline.
+
+각 단계는 독립된 워커 스레드 풀과 크기가 제한된 큐로 연결되어, 앞 단계가 뒤 단계보다 지나치게 앞서 나가지 않습니다.
+따라서 전체 처리 시간은 모든 지연 시간의 합이 아니라 가장 느린 단계(보통 LLM 호출 quota)에 의해 결정됩니다.
+
+DB Session 은 스레드 간에 공유할 수 없으므로, 워커는 DB 에 접근하지 않고 처리 결과(PipelineOutcome)만 내보냅니다.
+실패 로그 저장 등 DB 작업은 run() 을 호출한 스레드에서 on_outcome 콜백으로 처리합니다.
+"""
+import logging
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Optional
+
+from app.clients.handong_feed_app_client import HandongFeedAppClient
+from app.core.config import EnvVariables
+from app.schemas.external.subject_tag_dto import SubjectTagDto
+from app.schemas.tag_labeling_dto import AssignTagsToMessageServDto, MessageTagAssignment
+from app.services.llm_service import LLMService
+from app.util.near_duplicate import cluster_near_duplicates
+from app.util.pii_cleaner import mask_all_ppi_batch
+from app.util.tag_preclassifier import TagPreClassifierProvider, tag_preclassifier_singleton
+from app.util.text_cleaner import TextCleaner
+
+logger = logging.getLogger(__name__)
+
+# 단계 워커에게 더 이상 처리할 항목이 없음을 알리는 값
+_STAGE_DONE = object()
+
+
+@dataclass
+class PipelineItem:
+    index: int
+    feed: AssignTagsToMessageServDto
+    cleaned_message: Optional[str] = None
+    assignment: Optional[MessageTagAssignment] = None
+    # 이 피드를 대표로 하는 유사 중복 피드들. LLM 을 호출하지 않고 대표의 할당 결과를 공유한다.
+    duplicates: List["PipelineItem"] = field(default_factory=list)
+
+
+@dataclass
+class PipelineOutcome:
+    """피드 하나의 처리 결과. 성공 시 assign_resp_dtos, 실패 시 error 가 채워집니다."""
+    index: int
+    feed: AssignTagsToMessageServDto
+    cleaned_message: Optional[str] = None
+    assign_resp_dtos: Optional[List[SubjectTagDto.AssignRespDto]] = None
+    error: Optional[Exception] = None
+    stage: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and self.assign_resp_dtos is not None
+
+
+@dataclass
+class _Stage:
+    name: str
+    workers: int
+    input_queue: queue.Queue
+    threads: List[threading.Thread] = field(default_factory=list)
+
+
+class TagAssignmentPipeline:
+    """
+    마스킹, LLM 호출, feed-app 저장 단계를 각각의 동시성 제한으로 실행하는 태그 할당 pipeline.
+
+    - mask 단계: 피드를 mask_chunk_size 개씩 묶어 NER batch 추론과 정규화를 수행합니다. (TAG_PIPELINE_MASK_WORKERS)
+    - llm 단계: 대기 중인 메시지를 최대 llm_batch_size 개씩 묶어 한 번의 LLM 호출로 태그를 요청합니다.
+      rate limit 은 LLMService 에서 처리합니다. (TAG_PIPELINE_LLM_WORKERS, LLM_TAG_BATCH_SIZE)
+    - write 단계: 대기 중인 할당 결과를 최대 write_batch_size 개씩 묶어 feed-app 에 저장하고 subject 의 태그 할당 완료 상태를 갱신합니다.
+      subject 별 요청 대신 bulk 요청(또는 동시 요청)을 사용합니다. (TAG_PIPELINE_WRITE_WORKERS, TAG_PIPELINE_WRITE_BATCH_SIZE)
+
+    피드는 리스트뿐 아니라 generator(HandongFeedAppClient.iter_feeds 등)로도 받을 수 있으며, 별도의 스레드가 segment_size 개씩 읽어
+    크기가 제한된 대기열로 mask 단계에 넘기므로 피드 수와 관계없이 메모리 사용량이 일정합니다. (TAG_PIPELINE_SEGMENT_SIZE)
+
+    dedup_near_duplicates 가 true 이면 (기본값: NEAR_DUPLICATE_DEDUP) segment 마다 TextCleaner 로 정제한 메시지를 유사 중복끼리 묶어,
+    묶음의 대표 피드만 llm 단계를 거치고 나머지 피드는 대표의 태그를 그대로 write 단계에서 저장합니다.
+    (유사 중복 피드도 대표 피드와 같은 batch 로 마스킹하므로, 결과의 cleaned_message 는 항상 마스킹된 메시지입니다)
+
+    TAG_PRECLASSIFIER 가 켜져 있으면 mask 단계에서 태그 사전 분류 모델로 확신할 수 있는 피드는 llm 단계를 건너뛰고
+    바로 write 단계로 보냅니다. (app/util/tag_preclassifier.py)
+    """
+
+    def __init__(self,
+                 llm_service: LLMService,
+                 handong_feed_app_client: HandongFeedAppClient,
+                 cleaner: TextCleaner,
+                 mask_workers: int | None = None,
+                 llm_workers: int | None = None,
+                 write_workers: int | None = None,
+                 queue_size: int | None = None,
+                 mask_chunk_size: int | None = None,
+                 llm_batch_size: int | None = None,
+                 write_batch_size: int | None = None,
+                 segment_size: int | None = None,
+                 dedup_near_duplicates: bool | None = None,
+                 preclassifier: TagPreClassifierProvider | None = None):
+        self.llm_service = llm_service
+        self.handong_feed_app_client = handong_feed_app_client
+        self.cleaner = cleaner
+        self.mask_workers = mask_workers or EnvVariables.TAG_PIPELINE_MASK_WORKERS
+        self.llm_workers = llm_workers or EnvVariables.TAG_PIPELINE_LLM_WORKERS
+        self.write_workers = write_workers or EnvVariables.TAG_PIPELINE_WRITE_WORKERS
+        self.queue_size = queue_size or EnvVariables.TAG_PIPELINE_QUEUE_SIZE
+        self.mask_chunk_size = mask_chunk_size or EnvVariables.NER_BATCH_SIZE
+        self.llm_batch_size = llm_batch_size or EnvVariables.LLM_TAG_BATCH_SIZE
+        self.write_batch_size = write_batch_size or EnvVariables.TAG_PIPELINE_WRITE_BATCH_SIZE
+        self.segment_size = segment_size or EnvVariables.TAG_PIPELINE_SEGMENT_SIZE
+        self.dedup_near_duplicates = (
+            EnvVariables.NEAR_DUPLICATE_DEDUP if dedup_near_duplicates is None else dedup_near_duplicates
+        )
+        self.preclassifier = preclassifier or tag_preclassifier_singleton
+
+    def run(self,
+            feeds: Iterable[AssignTagsToMessageServDto],
+            tag_codes: list,
+            on_outcome: Callable[[PipelineOutcome], None] | None = None,
+            catalog_hash: str | None = None,
+            collect_outcomes: bool = True,
+            allow_existing_tags: bool = False) -> List[PipelineOutcome]:
+        """
+        모든 피드를 pipeline 으로 처리하고, 입력 순서대로 정렬된 결과 목록을 반환합니다.
+        on_outcome 은 결과가 나올 때마다 run() 을 호출한 스레드에서 실행됩니다.
+        catalog_hash 가 주어지면 llm 단계에서 태그 할당 캐시를 사용합니다. (LLMService.assign_tags_to_messages 참고)
+        collect_outcomes 가 false 이면 결과를 모아 두지 않고 빈 목록을 반환합니다. (on_outcome 으로만 결과를 처리하는 긴 stream 용)
+        allow_existing_tags 가 true 이면(재태깅) 이미 배정된 태그를 중복 저장 실패로 보지 않고, 새 태그만 저장한 뒤 태그 할당 완료로 갱신합니다.
+        feeds 를 읽다가 예외가 발생하면, 이미 읽은 피드를 모두 처리한 뒤 그 예외를 다시 던집니다.
+        """
+        chunk_queue: queue.Queue = queue.Queue(maxsize=self.mask_workers * 2)
+        llm_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        write_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        outcome_queue: queue.Queue = queue.Queue()
+
+        mask_stage = _Stage("mask", self.mask_workers, chunk_queue)
+        llm_stage = _Stage("llm", self.llm_workers, llm_queue)
+        write_stage = _Stage("write", self.write_workers, write_queue)
+
+        self._start_stage(mask_stage, lambda chunk: self._mask_chunk(chunk, tag_codes, llm_queue, write_queue, outcome_queue))
+        self._start_stage(
+            llm_stage,
+            lambda items: self._request_assignments(items, tag_codes, catalog_hash, write_queue, outcome_queue),
+            batch_size=self.llm_batch_size,
+        )
+        self._start_stage(
+            write_stage,
+            lambda items: self._write_assignments(items, outcome_queue, allow_existing_tags),
+            batch_size=self.write_batch_size,
+        )
+
+        # mask 단계의 종료 신호는 feeder 가 모든 피드를 넣은 뒤에 보내고,
+        # 이후 단계는 앞 단계의 워커가 모두 끝난 뒤에 종료 신호를 보낸다.
+        feed_errors: List[Exception] = []
+        feeder = threading.Thread(
+            target=self._feed_chunks,
+            args=(feeds, chunk_queue, mask_stage.workers, feed_errors),
+            name="tag-pipeline-feeder",
+            daemon=True,
+        )
+        feeder.start()
+        closer = threading.Thread(
+            target=self._close_stages,
+            args=([mask_stage, llm_stage, write_stage], outcome_queue),
+            name="tag-pipeline-closer",
+            daemon=True,
+        )
+        closer.start()
+
+        outcomes: List[PipelineOutcome] = []
+        while True:
+            outcome = outcome_queue.get()
+            if outcome is _STAGE_DONE:
+                break
+            if collect_outcomes:
+                outcomes.append(outcome)
+            if on_outcome:
+                on_outcome(outcome)
+
+        feeder.join()
+        closer.join()
+        if feed_errors:
+            raise feed_errors[0]
+        outcomes.sort(key=lambda o: o.index)
+        return outcomes
+
+    def _feed_chunks(self,
+                     feeds: Iterable[AssignTagsToMessageServDto],
+                     chunk_queue: queue.Queue,
+                     mask_workers: int,
+                     feed_errors: List[Exception]) -> None:
+        """
+        feeds 를 segment_size 개씩 읽어 유사 중복을 묶은 뒤 mask_chunk_size 개씩 mask 단계로 보냅니다.
+        chunk_queue 의 크기가 제한되어 있으므로, mask 단계가 밀리면 feeds 를 더 읽지 않고 기다립니다.
+        """
+        index = 0
+        segment: List[AssignTagsToMessageServDto] = []
+        try:
+            try:
+                for feed in feeds:
+                    segment.append(feed)
+                    if len(segment) >= self.segment_size:
+                        index = self._put_segment(segment, index, chunk_queue)
+                        segment = []
+            except Exception as e:
+                logger.error(f"[TagPipeline] 피드를 읽는 중 오류가 발생하여 이미 읽은 피드까지만 처리합니다: {e}")
+                feed_errors.append(e)
+            if segment:
+                self._put_segment(segment, index, chunk_queue)
+        except Exception as e:
+            logger.error(f"[TagPipeline] 피드를 mask 단계로 보내지 못했습니다: {e}")
+            feed_errors.append(e)
+        finally:
+            for _ in range(mask_workers):
+                chunk_queue.put(_STAGE_DONE)
+
+    def _put_segment(self, segment: List[AssignTagsToMessageServDto], start_index: int, chunk_queue: queue.Queue) -> int:
+        """segment 의 유사 중복을 묶어 mask_chunk_size 개씩 chunk_queue 에 넣고, 다음 segment 의 시작 index 를 반환합니다."""
+        items = self._group_near_duplicates(
+            [PipelineItem(index=start_index + offset, feed=feed) for offset, feed in enumerate(segment)]
+        )
+        for i in range(0, len(items), self.mask_chunk_size):
+            chunk_queue.put(items[i:i + self.mask_chunk_size])
+        return start_index + len(segment)
+
+    def _group_near_duplicates(self, items: List[PipelineItem]) -> List[PipelineItem]:
+        """
+        유사 중복 피드를 묶음의 대표 피드의 duplicates 로 옮기고, 대표 피드 목록을 입력 순서대로 반환합니다.
+        """
+        if not self.dedup_near_duplicates or len(items) < 2:
+            return items
+
+        representatives = cluster_near_duplicates(self.cleaner.clean_batch(item.feed.message for item in items))
+        for position, (item, representative) in enumerate(zip(items, representatives)):
+            if representative != position:
+                items[representative].duplicates.append(item)
+
+        representative_items = [
+            item for position, (item, representative) in enumerate(zip(items, representatives)) if representative == position
+        ]
+        if len(representative_items) < len(items):
+            logger.info(f"[TagPipeline] 유사 중복 피드 {len(items) - len(representative_items)}건은 대표 피드의 태그를 공유합니다.")
+        return representative_items
+
+    @staticmethod
+    def _start_stage(stage: _Stage, handler: Callable, batch_size: int | None = None) -> None:
+        """
+        stage 워커를 시작합니다.
+        batch_size 가 주어지면 대기열에 이미 쌓여 있는 항목을 최대 batch_size 개까지 모아 리스트로 handler 에 전달합니다.
+        """
+        def worker():
+            while True:
+                item = stage.input_queue.get()
+                if item is _STAGE_DONE:
+                    return
+                if batch_size is None:
+                    handler(item)
+                    continue
+
+                batch = [item]
+                done = False
+                while len(batch) < batch_size:
+                    try:
+                        next_item = stage.input_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if next_item is _STAGE_DONE:
+                        done = True
+                        break
+                    batch.append(next_item)
+                handler(batch)
+                if done:
+                    return
+
+        for i in range(stage.workers):
+            thread = threading.Thread(target=worker, name=f"tag-pipeline-{stage.name}-{i}", daemon=True)
+            thread.start()
+            stage.threads.append(thread)
+
+    @staticmethod
+    def _close_stages(stages: List[_Stage], outcome_queue: queue.Queue) -> None:
+        for stage, next_stage in zip(stages, stages[1:] + [None]):
+            for thread in stage.threads:
+                thread.join()
+            if next_stage is not None:
+                for _ in range(next_stage.workers):
+                    next_stage.input_queue.put(_STAGE_DONE)
+        outcome_queue.put(_STAGE_DONE)
+
+    def _mask_chunk(self,
+                    chunk: List[PipelineItem],
+                    tag_codes: list,
+                    llm_queue: queue.Queue,
+                    write_queue: queue.Queue,
+                    outcome_queue: queue.Queue) -> None:
+        # 유사 중복 피드도 대표 피드와 함께 마스킹한다. 실패 로그 등에는 마스킹된 메시지만 남겨야 하기 때문이다.
+        members = [member for item in chunk for member in [item, *item.duplicates]]
+        try:
+            masked_texts = mask_all_ppi_batch([member.feed.message for member in members])
+            cleaned_members = self.cleaner.clean_batch(masked_texts)
+        except Exception as e:
+            logger.error(f"[TagPipeline] 메시지 마스킹 실패 ({len(members)}건): {e}")
+            for member in members:
+                outcome_queue.put(PipelineOutcome(index=member.index, feed=member.feed, error=e, stage="mask"))
+            return
+
+        for member, cleaned_message in zip(members, cleaned_members):
+            member.cleaned_message = cleaned_message
+        cleaned_messages = [item.cleaned_message for item in chunk]
+
+        try:
+            predictions = self.preclassifier.predict_confident(cleaned_messages, tag_codes)
+        except Exception as e:
+            logger.warning(f"[TagPipeline] 태그 사전 분류 실패, LLM 으로 태그를 할당합니다: {e}")
+            predictions = [None] * len(chunk)
+
+        for item, confident_values in zip(chunk, predictions):
+            if confident_values is None:
+                llm_queue.put(item)
+            else:
+                self._enqueue_assignment(
+                    item,
+                    MessageTagAssignment(
+                        subject_id=str(item.feed.subject_id),
+                        tag_codes=list(confident_values),
+                        confident_values=confident_values,
+                    ),
+                    write_queue,
+                )
+
+        local_count = sum(1 for confident_values in predictions if confident_values is not None)
+        if local_count:
+            logger.info(f"[TagPipeline] 태그 사전 분류 모델로 {local_count}/{len(chunk)}건의 태그를 LLM 없이 할당했습니다.")
+
+    def _request_assignments(self,
+                             items: List[PipelineItem],
+                             tag_codes: list,
+                             catalog_hash: str | None,
+                             write_queue: queue.Queue,
+                             outcome_queue: queue.Queue) -> None:
+        try:
+            results = self.llm_service.assign_tags_to_messages(
+                [(str(item.feed.subject_id), item.cleaned_message) for item in items], tag_codes, catalog_hash
+            )
+        except Exception as e:
+            for item in items:
+                for member in [item, *item.duplicates]:
+                    outcome_queue.put(self._failure(member, e, "llm"))
+            return
+
+        for item, result in zip(items, results):
+            if isinstance(result, Exception):
+                for member in [item, *item.duplicates]:
+                    outcome_queue.put(self._failure(member, result, "llm"))
+            elif not result:
+                for member in [item, *item.duplicates]:
+                    logger.debug(f"No valid assignment returned for subject_id={member.feed.subject_id}")
+                    outcome_queue.put(PipelineOutcome(index=member.index, feed=member.feed, cleaned_message=member.cleaned_message))
+            else:
+                self._enqueue_assignment(item, result, write_queue)
+
+    @staticmethod
+    def _enqueue_assignment(item: PipelineItem, assignment: MessageTagAssignment, write_queue: queue.Queue) -> None:
+        """대표 피드와 유사 중복 피드에 같은 태그 할당을 지정하여 write 단계로 보냅니다."""
+        item.assignment = assignment
+        write_queue.put(item)
+        for duplicate in item.duplicates:
+            duplicate.assignment = assignment.model_copy(update={"subject_id": str(duplicate.feed.subject_id)})
+            write_queue.put(duplicate)
+
+    def _write_assignments(self, items: List[PipelineItem], outcome_queue: queue.Queue, allow_existing_tags: bool = False) -> None:
+        """
+        여러 피드의 태그 할당을 한 번의 bulk 요청으로 저장하고, 저장에 성공한 subject 의 태그 할당 완료 상태를 한 번에 갱신합니다.
+        결과는 subject 별로 받으므로, 중복 저장 실패나 일부 subject 의 실패는 해당 피드의 결과에만 반영됩니다.
+        """
+        try:
+            assign_results = self.handong_feed_app_client.assign_tags_bulk(
+                [(str(item.feed.subject_id), self._build_assign_req_dtos(item)) for item in items],
+                allow_existing_tags=allow_existing_tags,
+            )
+        except Exception as e:
+            for item in items:
+                outcome_queue.put(self._failure(item, e, "write"))
+            return
+
+        assigned = []
+        for item, result in zip(items, assign_results):
+            if isinstance(result, Exception):
+                outcome_queue.put(self._failure(item, result, "write"))
+            else:
+                assigned.append((item, result))
+
+        tb_subject_ids = [
+            self._tb_subject_id(item, assign_resp_dtos) for item, assign_resp_dtos in assigned
+            if self._tb_subject_id(item, assign_resp_dtos)
+        ]
+        if tb_subject_ids:
+            logger.info(f"Updating subject tag assignment for tbSubjectIds={tb_subject_ids}")
+            try:
+                update_errors = dict(zip(
+                    tb_subject_ids, self.handong_feed_app_client.update_is_tag_assigned_true_bulk(tb_subject_ids)
+                ))
+            except Exception as e:
+                update_errors = {tb_subject_id: e for tb_subject_id in tb_subject_ids}
+        else:
+            update_errors = {}
+
+        for item, assign_resp_dtos in assigned:
+            error = update_errors.get(self._tb_subject_id(item, assign_resp_dtos))
+            if error is not None:
+                outcome_queue.put(self._failure(item, error, "write"))
+                continue
+            outcome_queue.put(PipelineOutcome(
+                index=item.index,
+                feed=item.feed,
+                cleaned_message=item.cleaned_message,
+                assign_resp_dtos=assign_resp_dtos,
+            ))
+
+    @staticmethod
+    def _tb_subject_id(item: PipelineItem, assign_resp_dtos: List[SubjectTagDto.AssignRespDto]) -> Optional[int]:
+        if assign_resp_dtos:
+            return assign_resp_dtos[0].tbSubjectId
+        # 재태깅에서 모든 태그가 이미 배정되어 있었다면 응답에 새 배정이 없으므로 피드의 subject_id 를 사용한다.
+        return int(item.feed.subject_id)
+
+    @staticmethod
+    def _build_assign_req_dtos(item: PipelineItem) -> List[SubjectTagDto.AssignReqDto]:
+        confident_values = item.assignment.confident_values or {}
+        return [
+            SubjectTagDto.AssignReqDto(
+                tagCode=tag_code,
+                forDate=item.feed.for_date,
+                confidentValue=confident_values.get(tag_code, -1.0),
+            )
+            for tag_code in item.assignment.tag_codes
+        ]
+
+    @staticmethod
+    def _failure(item: PipelineItem, error: Exception, stage: str) -> PipelineOutcome:
+        logger.error(f"[FAIL] Tag assignment failed for subject_id={item.feed.subject_id} ({stage}): {error}")
+        return PipelineOutcome(
+            index=item.index,
+            feed=item.feed,
+            cleaned_message=item.cleaned_message,
+            error=error,
+            stage=stage,
+        )
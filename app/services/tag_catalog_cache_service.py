@@ -0,0 +1,162 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+from app.clients.handong_feed_app_client import HandongFeedAppClient, handong_feed_app_client_singleton
+from app.core.config import EnvVariables
+from app.schemas.external.tag_dto import TagDto
+from app.schemas.tag_labeling_dto import TagCatalogCacheStatsRespDto
+from app.util.date_utils import get_seoul_time
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TagCatalog:
+    tags: List[TagDto.ReadResDto]
+    # 태그 목록(code, label, llmDesc)의 해시. 태그 목록에 따라 달라지는 캐시(태그 할당 캐시 등)의 키로 사용한다.
+    catalog_hash: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    # 태그 목록이 마지막으로 바뀐(다시 받은) 시각
+    fetched_at: datetime
+
+    @property
+    def tag_codes(self) -> List[str]:
+        return TagDto.extract_tag_codes(self.tags)
+
+
+class TagCatalogCacheService:
+    """
+    feed-app 의 태그 목록(get_all_tags)을 프로세스 내에 캐시하는 서비스.
+
+    - TAG_CATALOG_CACHE_TTL_SECONDS 동안은 feed-app 을 호출하지 않고 캐시된 태그 목록을 사용합니다.
+    - TTL 이 지나면 이전 응답의 ETag / Last-Modified 로 조건부 요청을 보내, 304 Not Modified 이면 본문 없이 캐시를 그대로 사용합니다.
+    - 다시 확인하지 못하면(feed-app 장애 등) 경고를 남기고 이전 태그 목록을 사용하며, 다음 호출에서 다시 확인합니다.
+    - invalidate() 는 캐시를 비워 다음 호출에서 태그 목록 전체를 다시 받도록 합니다. (POST /v1/tag-labeling/tag-catalog/invalidate)
+    """
+
+    def __init__(self, client: HandongFeedAppClient | None = None, ttl_seconds: int | None = None):
+        self.client = client or handong_feed_app_client_singleton
+        self.ttl_seconds = EnvVariables.TAG_CATALOG_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.catalog: Optional[TagCatalog] = None
+        self.validated_at = 0.0
+        self.hits = 0
+        self.not_modified = 0
+        self.refreshes = 0
+        # 캐시 상태와 통계를 보호하는 lock (짧게만 잡는다)
+        self.lock = threading.Lock()
+        # 여러 스레드가 동시에 TTL 이 지난 캐시를 보더라도 feed-app 에는 한 번만 요청하기 위한 lock
+        self.refresh_lock = threading.Lock()
+
+    def get_catalog(self) -> TagCatalog:
+        """캐시된 태그 목록을 반환합니다. TTL 이 지났다면 feed-app 에 변경 여부를 확인합니다."""
+        catalog = self._get_fresh_catalog()
+        if catalog is not None:
+            return catalog
+
+        with self.refresh_lock:
+            # 다른 스레드가 기다리는 동안 이미 갱신했다면 그 결과를 사용한다.
+            catalog = self._get_fresh_catalog()
+            if catalog is not None:
+                return catalog
+            stale = self.catalog
+            try:
+                result = self.client.get_all_tags_conditional(*self._validators(stale))
+            except Exception as e:
+                return self._use_stale(stale, e)
+            with self.lock:
+                return self._apply(stale, result)
+
+    async def get_catalog_async(self) -> TagCatalog:
+        """get_catalog 의 async 버전. 이벤트 루프를 막지 않도록 refresh_lock 을 잡지 않습니다."""
+        catalog = self._get_fresh_catalog()
+        if catalog is not None:
+            return catalog
+
+        stale = self.catalog
+        try:
+            result = await self.client.get_all_tags_conditional_async(*self._validators(stale))
+        except Exception as e:
+            return self._use_stale(stale, e)
+        with self.lock:
+            return self._apply(stale, result)
+
+    def get_tags(self) -> List[TagDto.ReadResDto]:
+        return self.get_catalog().tags
+
+    def invalidate(self) -> None:
+        """캐시된 태그 목록과 ETag 를 비워, 다음 호출에서 태그 목록 전체를 다시 받도록 합니다."""
+        with self.lock:
+            self.catalog = None
+            self.validated_at = 0.0
+        logger.info("[TagCatalogCache] 태그 목록 캐시를 비웠습니다.")
+
+    def get_stats(self) -> TagCatalogCacheStatsRespDto:
+        with self.lock:
+            catalog = self.catalog
+            validated_at = self.validated_at
+            hits, not_modified, refreshes = self.hits, self.not_modified, self.refreshes
+
+        return TagCatalogCacheStatsRespDto(
+            cached=catalog is not None,
+            catalog_hash=catalog.catalog_hash if catalog else None,
+            tag_count=len(catalog.tags) if catalog else 0,
+            etag=catalog.etag if catalog else None,
+            fetched_at=catalog.fetched_at if catalog else None,
+            age_seconds=time.monotonic() - validated_at if catalog else None,
+            ttl_seconds=self.ttl_seconds,
+            hits=hits,
+            not_modified=not_modified,
+            refreshes=refreshes,
+        )
+
+    def _get_fresh_catalog(self) -> Optional[TagCatalog]:
+        catalog = self.catalog
+        if catalog is None or time.monotonic() - self.validated_at >= self.ttl_seconds:
+            return None
+        with self.lock:
+            self.hits += 1
+        return catalog
+
+    @staticmethod
+    def _validators(catalog: Optional[TagCatalog]):
+        return (catalog.etag, catalog.last_modified) if catalog else (None, None)
+
+    def _apply(self, stale: Optional[TagCatalog], result) -> TagCatalog:
+        """조건부 요청 결과를 캐시에 반영합니다. self.lock 을 잡은 상태에서 호출합니다."""
+        tags, etag, last_modified = result
+        self.validated_at = time.monotonic()
+        if tags is None and stale is not None:
+            self.not_modified += 1
+            return stale
+
+        if tags is None:
+            # 캐시가 비어 있는데 304 를 받은 경우(invalidate 와 동시에 요청한 경우 등)에는 다음 호출에서 다시 받는다.
+            self.validated_at = 0.0
+            raise Exception("태그 목록 캐시가 비어 있는데 304 Not Modified 응답을 받았습니다.")
+
+        catalog_hash = TagDto.compute_catalog_hash(tags)
+        if stale is not None and stale.catalog_hash == catalog_hash:
+            # ETag 를 지원하지 않는 서버라면 본문이 같아도 200 이 오므로, 해시가 같으면 이전 시각을 유지한다.
+            self.catalog = TagCatalog(tags, catalog_hash, etag, last_modified, stale.fetched_at)
+            self.not_modified += 1
+        else:
+            self.catalog = TagCatalog(tags, catalog_hash, etag, last_modified, get_seoul_time())
+            self.refreshes += 1
+            logger.info(f"[TagCatalogCache] 태그 목록 갱신: {len(tags)}개, catalog_hash={catalog_hash[:12]}")
+        return self.catalog
+
+    @staticmethod
+    def _use_stale(stale: Optional[TagCatalog], error: Exception) -> TagCatalog:
+        if stale is None:
+            raise error
+        logger.warning(f"[TagCatalogCache] 태그 목록을 확인하지 못해 이전 목록을 사용합니다: {error}")
+        return stale
+
+
+# 싱글톤으로 서비스를 사용하기 위함
+tag_catalog_cache_service_singleton = TagCatalogCacheService()
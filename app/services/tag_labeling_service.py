@@ -1,18 +1,18 @@
 import logging
-from typing import List
+from itertools import chain
+from typing import Callable, Iterable, Iterator
 from datetime import date
 from sqlalchemy.orm import Session
 
-from app.clients.handong_feed_app_client import HandongFeedAppClient
+from app.clients.handong_feed_app_client import handong_feed_app_client_singleton
 from app.schemas.external.feed_dto import FeedDto
-from app.schemas.external.subject_tag_dto import SubjectTagDto
-from app.schemas.external.tag_dto import TagDto
 from app.schemas.tag_assign_fail_log_dto import TagAssignFailLogDto
 from app.schemas.tag_labeling_dto import MessageTagLabelingRespDto, AssignTagsToMessageServDto
 from app.services.llm_service import llm_service_singleton
+from app.services.tag_assignment_pipeline import TagAssignmentPipeline, PipelineOutcome
+from app.services.tag_catalog_cache_service import tag_catalog_cache_service_singleton
 from app.services.tag_fail_log_service import TagFailLogService
 from app.util.date_utils import convert_start_date_to_unix, convert_end_date_to_unix
-from app.util.pii_cleaner import mask_all_ppi
 from app.util.text_cleaner import TextCleaner
 
 logger = logging.getLogger(__name__)
@@ -22,41 +22,68 @@ class TagLabelingService:
         self.db = db
         self.cleaner = TextCleaner()
         self.llm_service = llm_service_singleton
-        self.handong_feed_app_client = HandongFeedAppClient()
+        self.handong_feed_app_client = handong_feed_app_client_singleton
+        self.tag_catalog_cache = tag_catalog_cache_service_singleton
         self.tag_fail_log_service = TagFailLogService(db)
+        self.tag_assignment_pipeline = TagAssignmentPipeline(self.llm_service, self.handong_feed_app_client, self.cleaner)
 
-    def process_feeds_with_date(self, start_date, end_date, is_filter_new, onlyUnassignedFeeds, limit) -> MessageTagLabelingRespDto:
+    def process_feeds_with_date(self, start_date, end_date, is_filter_new, onlyUnassignedFeeds, limit=None) -> MessageTagLabelingRespDto:
         """
         start_date 와 end_date 사이에 생성됝 피드를 assign 시도합니다.
+        피드는 feed-app 에서 시간 구간별로 나누어 읽으며(HandongFeedAppClient.iter_feeds), 읽는 대로 pipeline 에서 처리합니다.
 
         Args:
             start_date: 조회 시작 날짜
             end_date: 조회 종료 날짜
             is_filter_new: 새로운 피드만 필터링할지 여부
             onlyUnassignedFeeds: 태그가 할당되지 않은 피드만 필터링할지 여부
-            limit: 조회할 피드 수 제한
+            limit: 조회할 피드 수 제한 (None 이면 조건에 맞는 모든 피드)
 
         Returns:
             MessageTagLabelingRespDto: 각 메시지의 subject_id와 할당된 태그 코드 배열을 포함하는 DTO.
         """
+        feeds = self._iter_feeds_with_date(start_date, end_date, is_filter_new, onlyUnassignedFeeds, limit)
+        return self.assign_tags_to_messages_iterative(feeds)
 
+    def drain_feeds_with_date(self, start_date, end_date, is_filter_new, onlyUnassignedFeeds,
+                              on_progress: Callable[[PipelineOutcome], None] | None = None,
+                              allow_existing_tags: bool = False) -> int:
+        """
+        start_date 와 end_date 사이에 생성된 조건에 맞는 모든 피드를 assign 시도하고, 태그 할당에 성공한 피드 수를 반환합니다.
+        할당 결과를 모아 두지 않으므로, 쌓인 피드가 많아도 일정한 메모리로 모두 처리합니다.
+        on_progress 는 피드 하나의 처리(실패 로그 처리 포함)가 끝날 때마다 호출됩니다. (진행률 보고용)
+        allow_existing_tags 가 true 이면(이미 태그가 할당된 피드의 재태깅) 이미 배정된 태그는 중복 저장 실패로 보지 않고,
+        새로 할당된 태그만 추가한 뒤 태그 할당 완료로 갱신합니다. 기존 태그는 지우지 않습니다.
+
+        Raises:
+            HTTPException: 조건에 부합하는 피드가 없는 경우 (204)
+        """
+        feeds = self._iter_feeds_with_date(start_date, end_date, is_filter_new, onlyUnassignedFeeds, None)
+        succeeded = 0
+
+        def on_outcome(outcome: PipelineOutcome) -> None:
+            nonlocal succeeded
+            self.handle_pipeline_outcome(outcome)
+            succeeded += outcome.succeeded
+            if on_progress is not None:
+                on_progress(outcome)
+
+        self._run_pipeline(feeds, on_outcome, collect_outcomes=False, allow_existing_tags=allow_existing_tags)
+        return succeeded
+
+    def _iter_feeds_with_date(self, start_date, end_date, is_filter_new, onlyUnassignedFeeds, limit) -> Iterator[AssignTagsToMessageServDto]:
         # 날짜 문자열을 Unix timestamp로 변환
         start_ts = convert_start_date_to_unix(start_date)
         end_ts = convert_end_date_to_unix(end_date)
 
-        assign_tags_to_messages_serv_dto_list = [
-            dto.to_assign_tags_to_message_serv_dto() for dto in self.handong_feed_app_client.get_feeds(
-                FeedDto.ReadReqDto(
-                    start=start_ts,
-                    end=end_ts,
-                    isFilterNew=is_filter_new,
-                    onlyUnassignedFeeds=onlyUnassignedFeeds,
-                    limit=limit
-                )
-            )
-        ]
-
-        return self.assign_tags_to_messages_iterative(assign_tags_to_messages_serv_dto_list)
+        feed_req = FeedDto.ReadReqDto(
+            start=start_ts,
+            end=end_ts,
+            isFilterNew=is_filter_new,
+            onlyUnassignedFeeds=onlyUnassignedFeeds,
+            limit=limit
+        )
+        return (dto.to_assign_tags_to_message_serv_dto() for dto in self.handong_feed_app_client.iter_feeds(feed_req))
 
 
     def process_failed_feeds(self) -> MessageTagLabelingRespDto:
@@ -72,21 +99,24 @@ class TagLabelingService:
         return self.assign_tags_to_messages_iterative(assign_tags_to_messages_serv_dto_list)
 
 
-    def assign_tags_to_messages_iterative(self, feeds: List[AssignTagsToMessageServDto]) -> MessageTagLabelingRespDto:
+    def assign_tags_to_messages_iterative(self, feeds: Iterable[AssignTagsToMessageServDto]) -> MessageTagLabelingRespDto:
         """
         주어진 메시지 리스트와 태그 목록을 기반으로 각 메시지에 적합한 태그 코드를 할당합니다.
 
         이 메서드는 다음의 작업을 수행합니다:
           1. 메시지 리스트가 비어있는 경우 경고 로그를 남기고 빈 결과를 반환합니다.
           2. 태그 목록이 비어있는 경우 경고 로그를 남기고 빈 결과를 반환합니다.
-          3. 각 메시지에 대해 다음을 수행합니다:
-             - 메시지에서 subject_id가 존재하지 않으면 건너뜁니다.
-             - 원본 메시지(raw_text)를 가져와서 개인정보 및 링크 등 민감 정보를 `mask_all_ppi`를 사용하여 마스킹합니다.
-             - TextCleaner를 적용하여 텍스트를 정규화합니다.
-             - 정제된 메시지(cleaned_message)를 이용해 LLMService의 assign_tag_to_message 메서드를 호출하여 태그 코드를 할당합니다.
-             - LLM 응답이 유효하면, 해당 메시지에 대한 할당 결과(MessageTagAssignment)를 수집합니다.
+          3. subject_id 가 없는 메시지를 제외한 뒤, TagAssignmentPipeline 으로 다음 단계를 동시에 수행합니다:
+             (feeds 가 generator 이면 pipeline 이 읽는 대로 처리합니다.)
+             - mask: 원본 메시지의 개인정보 및 링크 등 민감 정보를 `mask_all_ppi_batch`로 마스킹하고 TextCleaner로 정규화합니다.
+               (이름 마스킹 NER 추론은 여러 메시지를 묶어 batch 로 수행됩니다.)
+             - llm: 정제된 메시지(cleaned_message)로 LLMService의 assign_tag_to_message 메서드를 호출하여 태그 코드를 할당합니다.
+               (같은 메시지와 태그 목록으로 할당한 결과가 태그 할당 캐시에 있다면 LLM 을 호출하지 않습니다.)
+             - write: 할당된 태그를 feed-app 에 저장하고 subject 의 태그 할당 완료 상태를 갱신합니다.
+             각 피드의 처리 결과가 나올 때마다 실패 로그 처리(handle_pipeline_outcome)를 이 스레드에서 수행합니다.
           4. 모든 메시지에 대한 할당 결과를 MessageTagLabelingRespDto에 담아 반환합니다.
 
+            feeds (Iterable): 태그를 할당할 피드 목록 또는 generator.
             messages (list): 각 메시지는 딕셔너리 형태로, 최소한 'subject_id'와 'message' 키를 포함해야 합니다.
             tags (list): 할당 가능한 태그 목록. 각 태그는 딕셔너리 형태(예: {"code": "...", "label": "...", "llm_desc": "..."})로 제공됩니다.
 
@@ -94,80 +124,77 @@ class TagLabelingService:
             MessageTagLabelingRespDto: 각 메시지의 subject_id와 할당된 태그 코드 배열을 포함하는 DTO.
     """
 
-        tag_codes = TagDto.extract_tag_codes(self.handong_feed_app_client.get_all_tags())
+        outcomes = self._run_pipeline(feeds, self.handle_pipeline_outcome, collect_outcomes=True)
+        assign_resp_dtos_list = [outcome.assign_resp_dtos for outcome in outcomes if outcome.succeeded]
 
-        # 해당 조건에 부합하는 피드가 없다면, status 204 반환
-        if not feeds:
+        return MessageTagLabelingRespDto(assign_resp_dtos_list= assign_resp_dtos_list)
+
+    def _run_pipeline(self,
+                      feeds: Iterable[AssignTagsToMessageServDto],
+                      on_outcome,
+                      collect_outcomes: bool,
+                      allow_existing_tags: bool = False) -> list:
+        catalog = self.tag_catalog_cache.get_catalog()
+        tag_codes = catalog.tag_codes
+        # 태그 목록이 바뀌면 캐시 키가 달라지므로, 이전 태그 목록으로 할당한 결과는 재사용되지 않는다.
+        catalog_hash = catalog.catalog_hash
+
+        # 해당 조건에 부합하는 피드가 없다면, status 204 반환 (generator 는 첫 피드를 미리 읽어 확인한다)
+        feed_iterator = iter(feeds)
+        first_feed = next(feed_iterator, None)
+        if first_feed is None:
             logger.warning("Empty feed list provided")
             from fastapi import HTTPException
             raise HTTPException(status_code=204, detail="해당 조건에 부합하는 피드가 없습니다.")
 
         if not tag_codes:
             logger.warning("Empty tag code list provided")
-            return MessageTagLabelingRespDto(assign_resp_dtos_list=[])
-
-        assign_resp_dtos_list = []
-
+            return []
+
+        return self.tag_assignment_pipeline.run(
+            self._filter_valid_feeds(chain([first_feed], feed_iterator)),
+            tag_codes,
+            on_outcome=on_outcome,
+            catalog_hash=catalog_hash,
+            collect_outcomes=collect_outcomes,
+            allow_existing_tags=allow_existing_tags,
+        )
+
+    @staticmethod
+    def _filter_valid_feeds(feeds: Iterable[AssignTagsToMessageServDto]) -> Iterator[AssignTagsToMessageServDto]:
         for feed in feeds:
-            subject_id = feed.subject_id
-            for_date = feed.for_date
-
-            if not subject_id:
+            if not feed.subject_id:
                 logger.warning("Message without subject_id found, skipping")
                 continue
+            yield feed
 
-            raw_text = feed.message
-
-            masked_text = mask_all_ppi(raw_text)
-
-            cleaned_message = self.cleaner.clean(masked_text)
-
-            try:
-                # 실패한 피드를 process 하는 것 이라면, 해당 row 의 is_processed 를 True 로 변경
-                if feed.fail_id:
-                    self.tag_fail_log_service.mark_as_processed(feed.fail_id)
-
-                assignment = self.llm_service.assign_tag_to_message(str(subject_id), cleaned_message, tag_codes)
-                if assignment:
-                    assign_req_dtos = []
-                    for tag_code in assignment.tag_codes:
-                        assign_req_dto = SubjectTagDto.AssignReqDto(
-                            tagCode=tag_code,
-                            forDate=for_date,
-                        )
-                        assign_req_dtos.append(assign_req_dto)
-
-                    assign_resp_dtos = self.handong_feed_app_client.assign_tags_batch(str(subject_id), assign_req_dtos)
-                    assign_resp_dtos_list.append(assign_resp_dtos)
-                else:
-                    logger.debug(f"No valid assignment returned for subject_id={subject_id}")
-            except Exception as e:
-                logger.error(f"[FAIL] Tag assignment failed for subject_id={subject_id}: {e}")
-
-                # 중복 저장 실패인 경우 로그를 남기지 않음
-                if "중복으로 인해 저장 실패한" not in str(e):
-                    self.tag_fail_log_service.save_fail_log(
-                        TagAssignFailLogDto.CreateReqDto(
-                            subject_id=int(subject_id),
-                            message=cleaned_message,
-                            for_date=date.fromisoformat(for_date),
-                            error_message=str(e)
-                        )
-                    )
-                continue
-
-        self.update_subject_tag_assignment(assign_resp_dtos_list)
-
-        return MessageTagLabelingRespDto(assign_resp_dtos_list= assign_resp_dtos_list)
-
-    def update_subject_tag_assignment(self, assign_resp_dtos_list):
+    def handle_pipeline_outcome(self, outcome: PipelineOutcome) -> None:
         """
-        주제 태그 할당 완료 처리를 위한 헬퍼 메서드.
-
-        Args:
-            assign_resp_dtos_list: 태그 할당 응답 DTO 리스트
+        pipeline 에서 피드 하나의 처리가 끝날 때마다 호출되어 실패 로그 관련 DB 작업을 수행합니다.
+        pipeline 워커 스레드가 아닌 호출 스레드에서 실행되므로 self.db 를 그대로 사용할 수 있습니다.
         """
-        for dto in assign_resp_dtos_list:
-            if dto and hasattr(dto[0], 'tbSubjectId') and dto[0].tbSubjectId:
-                logger.info(f"Updating subject tag assignment for tbSubjectId={dto[0].tbSubjectId}")
-                self.handong_feed_app_client.update_is_tag_assigned_true(dto[0].tbSubjectId)
+        feed = outcome.feed
+
+        # 마스킹하지 못한 피드는 개인정보가 담긴 원본 메시지밖에 없으므로 실패 로그를 남기지 않는다.
+        # 실패 로그로 재처리하던 피드라면 기존 로그를 처리하지 않은 상태로 두고, feed-app 의 피드는 태그 할당 완료로 갱신되지 않으므로
+        # 다음 실행에서 다시 처리된다.
+        if outcome.cleaned_message is None and outcome.error is not None:
+            logger.error(f"[FAIL] 메시지를 마스킹하지 못해 실패 로그를 남기지 않습니다. subject_id={feed.subject_id}, 오류: {outcome.error}")
+            return
+
+        # 실패한 피드를 process 하는 것 이라면, 해당 row 의 is_processed 를 True 로 변경
+        if feed.fail_id:
+            self.tag_fail_log_service.mark_as_processed(feed.fail_id)
+
+        # 중복 저장 실패인 경우 로그를 남기지 않음
+        if outcome.error is None or "중복으로 인해 저장 실패한" in str(outcome.error):
+            return
+
+        self.tag_fail_log_service.save_fail_log(
+            TagAssignFailLogDto.CreateReqDto(
+                subject_id=int(feed.subject_id),
+                message=outcome.cleaned_message,
+                for_date=date.fromisoformat(feed.for_date),
+                error_message=str(outcome.error)
+            )
+        )
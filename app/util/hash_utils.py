@@ -0,0 +1,12 @@
+import hashlib
+
+
+def sha256_hex(text: str) -> str:
+    """
+    문자열의 SHA-256 해시를 16진수 문자열(64자)로 반환하는 함수.
+    캐시 키 등 내용 기반 식별자를 만들 때 사용합니다.
+
+    :param text:
+    :return str:
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
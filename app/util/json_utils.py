@@ -0,0 +1,32 @@
+import json
+from typing import Any
+
+
+def loads_llm_json(text: str, expected_type: type) -> Any:
+    """
+    LLM 응답 문자열을 expected_type (list 또는 dict) 의 JSON 값으로 파싱하는 함수.
+
+    structured output (JSON schema) 모드의 응답은 그 자체로 JSON 이므로 먼저 전체를 json.loads 하고,
+    실패하거나 타입이 다르면 앞뒤에 다른 텍스트가 붙은 응답을 위해 첫 괄호부터 마지막 괄호까지를 다시 파싱합니다.
+
+    :param text: LLM 응답 문자열
+    :param expected_type: list 또는 dict
+    :return Any:
+    """
+    try:
+        value = json.loads(text)
+        if isinstance(value, expected_type):
+            return value
+    except ValueError:
+        pass
+
+    open_char, close_char = ('[', ']') if expected_type is list else ('{', '}')
+    kind = "array" if expected_type is list else "object"
+    start = text.find(open_char)
+    end = text.rfind(close_char)
+    if start == -1 or end == -1:
+        raise Exception(f"Can't find JSON {kind} in text")
+    value = json.loads(text[start:end + 1])
+    if not isinstance(value, expected_type):
+        raise Exception(f"Result is not {'a list' if expected_type is list else 'an object'}")
+    return value
@@ -0,0 +1,127 @@
+"""
+SimHash 기반 유사 중복(near-duplicate) 메시지 탐지 모듈.
+
+여러 채팅방에 조금씩 수정되어 다시 올라오는 공지처럼, 정제된 텍스트(TextCleaner 출력)가 거의 같은 메시지를 묶어
+대표 메시지 하나만 LLM 에 보내고 그 결과를 나머지 메시지에 공유하기 위해 사용합니다.
+
+- 텍스트의 글자 n-gram(shingle) 으로 64bit SimHash 를 계산하며, 두 SimHash 의 Hamming distance 가 작을수록 비슷한 텍스트입니다.
+- NearDuplicateIndex 는 64bit 를 (max_distance + 1) 개의 band 로 나누어 band 값이 같은 후보만 비교합니다. (LSH)
+  Hamming distance 가 max_distance 이하인 두 값은 비둘기집 원리에 의해 적어도 하나의 band 가 같으므로 후보에서 빠지지 않습니다.
+"""
+import hashlib
+from collections import defaultdict
+from typing import Dict, Hashable, List, Optional, Sequence
+
+from app.core.config import EnvVariables
+
+SIMHASH_BITS = 64
+_SHINGLE_SIZE = 2
+
+
+def simhash(text: str, shingle_size: int = _SHINGLE_SIZE) -> int:
+    """
+    텍스트의 64bit SimHash 를 계산하는 함수.
+    공백을 제외한 글자 n-gram 을 feature 로 사용하므로 띄어쓰기나 조사 변화에 덜 민감합니다.
+    메시지처럼 짧은 텍스트는 feature 수가 적어 bigram 이 trigram 보다 유사 중복과 다른 메시지를 더 잘 구분합니다.
+
+    :param text: 정제된 텍스트
+    :param shingle_size: shingle 의 글자 수
+    :return int:
+    """
+    compact = "".join(text.split())
+    if len(compact) <= shingle_size:
+        shingles = [compact]
+    else:
+        shingles = [compact[i:i + shingle_size] for i in range(len(compact) - shingle_size + 1)]
+
+    # 각 bit 위치에서 1 인 shingle 이 절반을 넘으면 1 (shingle 별 +1/-1 가중치 합이 양수인 것과 같다)
+    bit_strings = [
+        format(int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big"), "064b")
+        for shingle in shingles
+    ]
+    fingerprint = 0
+    for column in zip(*bit_strings):
+        fingerprint = fingerprint << 1 | (column.count("1") * 2 > len(bit_strings))
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class NearDuplicateIndex:
+    """
+    SimHash 값을 band 별로 색인하여 Hamming distance 가 max_distance 이하인 항목을 찾는 LSH 색인.
+    """
+
+    def __init__(self, max_distance: int):
+        if not 0 <= max_distance < SIMHASH_BITS:
+            raise Exception(f"max_distance 는 0 이상 {SIMHASH_BITS} 미만이어야 합니다: {max_distance}")
+        self.max_distance = max_distance
+        band_count = max_distance + 1
+        # 64bit 를 band_count 개의 구간으로 최대한 고르게 나눈다.
+        self.band_ranges = [
+            (SIMHASH_BITS * i // band_count, SIMHASH_BITS * (i + 1) // band_count) for i in range(band_count)
+        ]
+        self.buckets: Dict[tuple, List[Hashable]] = defaultdict(list)
+        self.fingerprints: Dict[Hashable, int] = {}
+
+    def add(self, key: Hashable, fingerprint: int) -> None:
+        self.fingerprints[key] = fingerprint
+        for band_key in self._band_keys(fingerprint):
+            self.buckets[band_key].append(key)
+
+    def find(self, fingerprint: int) -> Optional[Hashable]:
+        """fingerprint 와 Hamming distance 가 가장 작은 (max_distance 이하) 항목의 key 를 반환합니다. 없으면 None."""
+        best_key, best_distance = None, self.max_distance + 1
+        seen = set()
+        for band_key in self._band_keys(fingerprint):
+            for key in self.buckets.get(band_key, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                distance = hamming_distance(fingerprint, self.fingerprints[key])
+                if distance < best_distance:
+                    best_key, best_distance = key, distance
+        return best_key
+
+    def _band_keys(self, fingerprint: int):
+        for band, (start, end) in enumerate(self.band_ranges):
+            yield band, fingerprint >> start & ((1 << (end - start)) - 1)
+
+
+def cluster_near_duplicates(texts: Sequence[str],
+                            max_distance: int | None = None,
+                            min_chars: int | None = None) -> List[int]:
+    """
+    정제된 텍스트 목록을 유사 중복끼리 묶고, 각 텍스트가 속한 묶음의 대표 index 를 입력 순서대로 반환하는 함수.
+
+    - 묶음의 대표는 묶음에서 가장 먼저 나온 텍스트이며, 대표 자신의 값은 자기 index 입니다.
+    - 새 텍스트는 이미 나온 대표들과만 비교하므로, 조금씩 달라지는 텍스트가 꼬리를 물고 하나로 묶이지 않습니다.
+    - SimHash 는 짧은 텍스트에서 부정확하므로, min_chars 보다 짧은 텍스트는 완전히 같은 텍스트끼리만 묶습니다.
+
+    :param texts: TextCleaner 로 정제된 텍스트 목록
+    :param max_distance: 같은 묶음으로 볼 최대 Hamming distance (기본값: NEAR_DUPLICATE_MAX_DISTANCE)
+    :param min_chars: SimHash 로 비교할 최소 글자 수 (기본값: NEAR_DUPLICATE_MIN_CHARS)
+    :return List[int]:
+    """
+    max_distance = EnvVariables.NEAR_DUPLICATE_MAX_DISTANCE if max_distance is None else max_distance
+    min_chars = EnvVariables.NEAR_DUPLICATE_MIN_CHARS if min_chars is None else min_chars
+
+    index = NearDuplicateIndex(max_distance)
+    exact_representatives: Dict[str, int] = {}
+    representatives: List[int] = []
+
+    for i, text in enumerate(texts):
+        representative = exact_representatives.get(text)
+        if representative is None and len(text) >= min_chars:
+            fingerprint = simhash(text)
+            representative = index.find(fingerprint)
+            if representative is None:
+                index.add(i, fingerprint)
+        if representative is None:
+            representative = i
+        exact_representatives.setdefault(text, representative)
+        representatives.append(representative)
+
+    return representatives
@@ -0,0 +1,135 @@
+"""
+이름 마스킹에 사용하는 한국어 NER 파이프라인을 프로세스 단위로 한 번만 불러오는 모듈.
+
+transformers 와 모델 가중치는 처음 마스킹이 필요한 시점에 불러오므로,
+마스킹을 하지 않는 경로(healthcheck, spotlight 등)는 모델 로딩 비용을 치르지 않습니다.
+"""
+import logging
+import os
+import threading
+import time
+
+from app.core.config import EnvVariables
+from app.util.hash_utils import sha256_hex
+
+logger = logging.getLogger(__name__)
+
+
+class NerProvider:
+    """
+    NER 파이프라인을 lazy 하게 생성하여 보관하는 클래스.
+
+    - NER_MODEL_DIR 이 설정되어 있으면 해당 로컬 디렉토리에서만 모델을 불러오므로 네트워크 없이도 동작합니다.
+    - 설정되어 있지 않으면 NER_MODEL_NAME 의 모델을 Hugging Face Hub 에서 (캐시가 없다면) 내려받습니다.
+    - 여러 스레드가 동시에 처음 호출하더라도 모델은 한 번만 불러옵니다.
+
+    backend (NER_BACKEND):
+    - torch: PyTorch 모델을 그대로 사용합니다. (기본값)
+    - onnx: 모델을 ONNX 로 export 한 뒤 int8 dynamic quantization 을 적용하여 onnxruntime 으로 실행합니다.
+      `optimum[onnxruntime]` 패키지가 필요하며, 변환 결과는 NER_ONNX_DIR 아래 원본 모델별 디렉토리에 저장해 두고 다음 로딩부터 재사용합니다.
+    """
+
+    BACKENDS = ("torch", "onnx")
+    QUANTIZED_MODEL_FILE_NAME = "model_quantized.onnx"
+
+    def __init__(self, model_name: str | None = None, model_dir: str | None = None, backend: str | None = None):
+        self.model_name = model_name or EnvVariables.NER_MODEL_NAME
+        self.model_dir = model_dir or EnvVariables.NER_MODEL_DIR
+        self.backend = (backend or EnvVariables.NER_BACKEND).lower()
+        if self.backend not in self.BACKENDS:
+            raise Exception(f"지원하지 않는 NER_BACKEND 입니다: {self.backend} (사용 가능: {', '.join(self.BACKENDS)})")
+        self._pipeline = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._pipeline is not None
+
+    def get_pipeline(self):
+        """NER 파이프라인을 반환합니다. 아직 불러오지 않았다면 이 시점에 불러옵니다."""
+        if self._pipeline is None:
+            with self._lock:
+                if self._pipeline is None:
+                    self._pipeline = self._load_pipeline()
+        return self._pipeline
+
+    def warm_up(self) -> None:
+        """서버 시작 시 모델을 미리 불러오기 위한 메서드"""
+        self.get_pipeline()
+
+    def _load_pipeline(self):
+        # transformers 는 import 자체가 무거우므로 실제로 모델이 필요할 때 import 한다.
+        from transformers import AutoTokenizer, pipeline
+
+        started_at = time.perf_counter()
+        if self.model_dir:
+            source, local_files_only = self.model_dir, True
+        else:
+            source, local_files_only = self.model_name, False
+            if EnvVariables.HUGGING_FACE_TOKEN:
+                from huggingface_hub import HfFolder
+                HfFolder.save_token(EnvVariables.HUGGING_FACE_TOKEN)
+
+        tokenizer = AutoTokenizer.from_pretrained(source, local_files_only=local_files_only)
+        if self.backend == "onnx":
+            model = self._load_quantized_onnx_model(source, local_files_only, tokenizer)
+        else:
+            from transformers import AutoModelForTokenClassification
+            model = AutoModelForTokenClassification.from_pretrained(source, local_files_only=local_files_only)
+        ner_pipeline = pipeline("ner", model=model, tokenizer=tokenizer, aggregation_strategy="simple")
+
+        logger.info(f"[NerProvider] NER 모델 로딩 완료: {source}, backend={self.backend} "
+                    f"({time.perf_counter() - started_at:.2f}s)")
+        return ner_pipeline
+
+    def _load_quantized_onnx_model(self, source: str, local_files_only: bool, tokenizer):
+        """
+        int8 dynamic quantization 이 적용된 ONNX 모델을 불러오는 메서드.
+        변환 결과는 NER_ONNX_DIR/<원본 모델 fingerprint> 에 저장하므로, NER_MODEL_NAME / NER_MODEL_DIR 의 모델이 바뀌면 다시 변환합니다.
+        해당 디렉토리에 변환된 모델이 없다면 source 모델을 ONNX 로 export 하고 양자화하여 저장합니다.
+        """
+        try:
+            from optimum.onnxruntime import ORTModelForTokenClassification, ORTQuantizer
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        except ImportError as e:
+            raise Exception("NER_BACKEND=onnx 를 사용하려면 `pip install \"optimum[onnxruntime]\"` 로 패키지를 설치해야 합니다.") from e
+
+        onnx_dir = os.path.join(EnvVariables.NER_ONNX_DIR, self._model_fingerprint(source, local_files_only)[:16])
+        quantized_model_path = os.path.join(onnx_dir, self.QUANTIZED_MODEL_FILE_NAME)
+
+        if not os.path.exists(quantized_model_path):
+            logger.info(f"[NerProvider] {source} 모델을 ONNX 로 변환하고 int8 양자화합니다. (저장 위치: {onnx_dir})")
+            onnx_model = ORTModelForTokenClassification.from_pretrained(
+                source, export=True, local_files_only=local_files_only
+            )
+            quantizer = ORTQuantizer.from_pretrained(onnx_model)
+            # CPU 전용 노드 대상이므로 대부분의 x86 CPU 에서 동작하는 AVX2 기준 dynamic quantization 을 사용한다.
+            quantization_config = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+            quantizer.quantize(save_dir=onnx_dir, quantization_config=quantization_config)
+            tokenizer.save_pretrained(onnx_dir)
+
+        return ORTModelForTokenClassification.from_pretrained(onnx_dir, file_name=self.QUANTIZED_MODEL_FILE_NAME)
+
+    @staticmethod
+    def _model_fingerprint(source: str, local_files_only: bool) -> str:
+        """
+        변환할 원본 모델을 구분하는 해시. Hub 모델은 이름과 commit hash 로,
+        로컬 디렉토리는 경로와 파일별 크기/수정 시각으로 만들어 같은 경로의 모델을 교체한 경우도 구분합니다.
+        """
+        from transformers import AutoConfig
+
+        parts = [source]
+        commit_hash = getattr(AutoConfig.from_pretrained(source, local_files_only=local_files_only), "_commit_hash", None)
+        if commit_hash:
+            parts.append(commit_hash)
+        if os.path.isdir(source):
+            for file_name in sorted(os.listdir(source)):
+                path = os.path.join(source, file_name)
+                if os.path.isfile(path):
+                    stat = os.stat(path)
+                    parts.append(f"{file_name}:{stat.st_size}:{int(stat.st_mtime)}")
+        return sha256_hex("\n".join(parts))
+
+
+# 싱글톤으로 사용하기 위함 (모델을 프로세스 내에서 공유)
+ner_provider_singleton = NerProvider()
@@ -1,21 +1,14 @@
-import re
-
-from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline
-from huggingface_hub import HfFolder
-from functools import reduce
+from typing import List, Tuple
 
 from app.core.config import EnvVariables
+from app.util.ner_provider import NerProvider, ner_provider_singleton
+from app.util.text_preprocessor import (
+    LINK_PATTERN, EMAIL_PATTERN, PHONE_PATTERN, LINK_MASK, EMAIL_MASK, PHONE_MASK,
+    mask_contact_info, mask_contact_info_batch
+)
 
-HfFolder.save_token(EnvVariables.HUGGING_FACE_TOKEN)
-
-
-# 한국어 NER 모델 불러오기 (본 파일 import 시 바로 실행 됨)
-model_name = "Leo97/KoELECTRA-small-v3-modu-ner"
-tokenizer = AutoTokenizer.from_pretrained(model_name)
-model = AutoModelForTokenClassification.from_pretrained(model_name)
+NAME_MASK = '[이름]'
 
-# NER 파이프라인 만들기
-ner_pipeline = pipeline("ner", model=model, tokenizer=tokenizer, aggregation_strategy="simple")
 
 def mask_korean_names_ner(text: str) -> str:
     """
@@ -24,11 +17,88 @@ def mask_korean_names_ner(text: str) -> str:
     :param text:
     :return text:
     """
-    entities = ner_pipeline(text)
-    for entity in entities:
-        if entity['entity_group'] == 'PS':
-            text = text.replace(entity['word'], '[이름]')
-    return text
+    return mask_korean_names_ner_batch([text])[0]
+
+
+def mask_korean_names_ner_batch(texts: List[str],
+                                batch_size: int | None = None,
+                                ner_provider: NerProvider | None = None) -> List[str]:
+    """
+    여러 텍스트 내의 한국어 이름을 NER 파이프라인 한 번의 batch 추론으로 찾아서 "[이름]" 으로 마스킹하는 함수.
+
+    - 긴 텍스트는 NER_MAX_CHUNK_CHARS 글자 이하의 구간으로 (가능하면 공백 위치에서) 잘라 모델 입력 길이를 넘지 않도록 합니다.
+    - 모든 구간은 batch_size 단위로 묶여 파이프라인에 한 번에 전달됩니다. (기본값: NER_BATCH_SIZE)
+    - 엔티티는 문자 offset 으로 치환하므로, 인식된 위치만 정확히 마스킹합니다.
+    - NER 모델은 처음 호출될 때 불러옵니다. (ner_provider 참고)
+
+    :param texts:
+    :param batch_size:
+    :param ner_provider: NER 파이프라인을 제공할 provider (기본값: NER_BACKEND 설정을 따르는 프로세스 공용 provider)
+    :return texts: 입력 순서대로 마스킹된 텍스트
+    """
+    batch_size = batch_size or EnvVariables.NER_BATCH_SIZE
+    ner_provider = ner_provider or ner_provider_singleton
+
+    # (텍스트 index, 텍스트 내 시작 offset, 구간 문자열)
+    windows: List[Tuple[int, int, str]] = [
+        (text_index, offset, window)
+        for text_index, text in enumerate(texts)
+        for offset, window in _split_into_windows(text, EnvVariables.NER_MAX_CHUNK_CHARS)
+    ]
+    if not windows:
+        return list(texts)
+
+    ner_pipeline = ner_provider.get_pipeline()
+    entities_per_window = ner_pipeline([window for _, _, window in windows], batch_size=batch_size)
+
+    spans_per_text: List[List[Tuple[int, int]]] = [[] for _ in texts]
+    for (text_index, offset, _), entities in zip(windows, entities_per_window):
+        for entity in entities:
+            if entity['entity_group'] == 'PS':
+                spans_per_text[text_index].append((offset + entity['start'], offset + entity['end']))
+
+    return [_replace_spans(text, spans, NAME_MASK) for text, spans in zip(texts, spans_per_text)]
+
+
+def _split_into_windows(text: str, max_chars: int) -> List[Tuple[int, str]]:
+    """
+    텍스트를 max_chars 글자 이하의 (시작 offset, 구간 문자열) 목록으로 나누는 함수.
+    이름이 잘리지 않도록 구간 끝에서 가장 가까운 공백 위치에서 자르고, 공백이 없으면 max_chars 에서 자릅니다.
+    """
+    windows = []
+    start = 0
+    while start < len(text):
+        end = min(start + max_chars, len(text))
+        if end < len(text):
+            split_at = max(text.rfind(" ", start, end), text.rfind("\n", start, end))
+            if split_at > start:
+                end = split_at
+        if text[start:end].strip():
+            windows.append((start, text[start:end]))
+        start = end
+    return windows
+
+
+def _replace_spans(text: str, spans: List[Tuple[int, int]], mask: str) -> str:
+    """겹치는 구간을 합친 뒤, 각 구간을 mask 로 치환한 텍스트를 반환하는 함수"""
+    if not spans:
+        return text
+
+    merged: List[List[int]] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    parts = []
+    cursor = 0
+    for start, end in merged:
+        parts.append(text[cursor:start])
+        parts.append(mask)
+        cursor = end
+    parts.append(text[cursor:])
+    return "".join(parts)
 
 
 def mask_link(text: str) -> str:
@@ -38,7 +108,7 @@ def mask_link(text: str) -> str:
     :param text:
     :return text:
     """
-    return re.sub(r'https?://[^\s]+', '[링크]', text)
+    return LINK_PATTERN.sub(LINK_MASK, text)
 
 
 def mask_email(text: str) -> str:
@@ -49,9 +119,7 @@ def mask_email(text: str) -> str:
     :param text:
     :return text:
     """
-    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    masked_text = re.sub(email_pattern, '[이메일]', text)
-    return masked_text
+    return EMAIL_PATTERN.sub(EMAIL_MASK, text)
 
 
 def mask_phone_number(text: str) -> str:
@@ -62,9 +130,7 @@ def mask_phone_number(text: str) -> str:
     :param text:
     :return text:
     """
-    phone_pattern = re.compile(r'\b(01[0-9])[-.\s]?(\d{3,4})[-.\s]?(\d{4})\b')
-    masked_text = phone_pattern.sub('[전화번호]', text)
-    return masked_text
+    return PHONE_PATTERN.sub(PHONE_MASK, text)
 
 def mask_all_ppi(text: str) -> str:
     """
@@ -75,7 +141,16 @@ def mask_all_ppi(text: str) -> str:
     :return text:
     """
 
-    masking_functions = (mask_korean_names_ner, mask_link, mask_email, mask_phone_number)
+    return mask_contact_info(mask_korean_names_ner(text))
+
 
-    return reduce(lambda acc, func: func(acc), masking_functions, text)
+def mask_all_ppi_batch(texts: List[str], batch_size: int | None = None) -> List[str]:
+    """
+    mask_all_ppi 의 batch 버전. 이름은 NER batch 추론으로, 링크/이메일/전화번호는 정규식으로 마스킹합니다.
+
+    :param texts:
+    :param batch_size: NER 파이프라인 batch 크기 (기본값: NER_BATCH_SIZE)
+    :return texts: 입력 순서대로 마스킹된 텍스트
+    """
+    return mask_contact_info_batch(mask_korean_names_ner_batch(texts, batch_size))
 
@@ -0,0 +1,108 @@
+"""
+LLM provider 호출에 사용하는 thread-safe token-bucket rate limiter.
+
+요청 수(RPM)와 토큰 수(TPM) 한도를 각각의 bucket 으로 관리하며, provider 별 limiter 는 프로세스 내에서 공유됩니다.
+acquire() 는 동기 호출자(스레드)용, acquire_async() 는 async task 용이며 같은 bucket 을 사용합니다.
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+from app.core.config import EnvVariables
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    분당 limit 만큼 소비할 수 있는 token bucket.
+
+    - 임의의 60초 구간에서 소비량이 limit 을 넘지 않도록, 순간적으로 쓸 수 있는 burst 만큼을 제외한
+      (limit - burst) 를 60초에 걸쳐 채웁니다. (burst + 60초 동안 채워지는 양 = limit)
+    - reserve() 는 잔량이 부족하더라도 먼저 예약(잔량을 음수로)하고 기다려야 할 시간을 반환하므로,
+      동시에 호출한 순서대로 대기 시간이 배정되고 한도를 넘겨 호출하는 일이 없습니다.
+    """
+
+    def __init__(self, limit_per_minute: int, burst: int | None = None):
+        if limit_per_minute <= 0:
+            raise Exception(f"limit_per_minute 는 1 이상이어야 합니다: {limit_per_minute}")
+        self.limit_per_minute = limit_per_minute
+        self.capacity = burst if burst is not None else max(1, limit_per_minute // 10)
+        self.capacity = min(self.capacity, limit_per_minute)
+        # limit 과 burst 가 같다면 1분마다 한 번에 채워지는 것과 같도록 최소 refill 속도를 보장한다.
+        self.refill_per_second = max(limit_per_minute - self.capacity, 1) / 60
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """amount 만큼을 예약하고, 예약한 양을 실제로 사용할 수 있을 때까지 기다려야 하는 시간(초)을 반환합니다."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+        self.tokens -= amount
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.refill_per_second
+
+
+class RateLimiter:
+    """
+    요청 수(RPM)와 토큰 수(TPM) 한도를 함께 적용하는 rate limiter.
+    한도가 설정되지 않은(None 또는 0) 항목은 제한하지 않습니다.
+    """
+
+    def __init__(self, name: str, requests_per_minute: int | None = None, tokens_per_minute: int | None = None):
+        self.name = name
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute, burst=tokens_per_minute // 2) if tokens_per_minute else None
+        self.lock = threading.Lock()
+
+    def reserve(self, tokens: int = 0) -> float:
+        """요청 1회와 tokens 만큼의 토큰을 예약하고, 호출 전에 기다려야 할 시간(초)을 반환합니다."""
+        with self.lock:
+            now = time.monotonic()
+            wait_seconds = 0.0
+            if self.request_bucket:
+                wait_seconds = max(wait_seconds, self.request_bucket.reserve(1, now))
+            if self.token_bucket and tokens:
+                wait_seconds = max(wait_seconds, self.token_bucket.reserve(tokens, now))
+
+        if wait_seconds > 0:
+            logger.info(f"[RateLimiter] {self.name} 호출 한도에 도달하여 {wait_seconds:.1f}초 대기합니다...")
+        return wait_seconds
+
+    def acquire(self, tokens: int = 0) -> None:
+        """호출 가능해질 때까지 현재 스레드를 대기시킵니다. 성공/실패와 관계없이 모든 호출 시도 전에 호출해야 합니다."""
+        wait_seconds = self.reserve(tokens)
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+    async def acquire_async(self, tokens: int = 0) -> None:
+        """acquire 의 async 버전. 이벤트 루프를 막지 않고 대기합니다."""
+        wait_seconds = self.reserve(tokens)
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str) -> RateLimiter:
+    """
+    provider 의 프로세스 공용 RateLimiter 를 반환합니다.
+
+    한도는 LLM_RATE_LIMITS (예: {"gemini": {"rpm": 15, "tpm": 1000000}}) 에서 provider 이름으로 찾으며,
+    설정이 없으면 LLM_API_REQUESTS_PER_MINUTE 를 RPM 한도로 사용합니다.
+    """
+    provider = provider.lower()
+    with _rate_limiters_lock:
+        rate_limiter = _rate_limiters.get(provider)
+        if rate_limiter is None:
+            limits: Optional[dict] = EnvVariables.LLM_RATE_LIMITS.get(provider)
+            if limits is None:
+                limits = {"rpm": EnvVariables.LLM_API_REQUESTS_PER_MINUTE}
+            rate_limiter = RateLimiter(provider, limits.get("rpm"), limits.get("tpm"))
+            _rate_limiters[provider] = rate_limiter
+        return rate_limiter
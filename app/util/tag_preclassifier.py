@@ -0,0 +1,166 @@
+"""
+LLM 호출 전에 확실한 태그를 로컬(CPU)에서 할당하기 위한 TF-IDF + 선형 모델 기반 태그 사전 분류기.
+
+- 학습: LLM 으로 할당했던 (정제된 메시지, 태그 코드 배열) 과 태그의 label, llmDesc 텍스트로 학습합니다.
+  (app/scripts/train_tag_preclassifier.py)
+- 추론: 모든 태그에 대해 확신이 있는 메시지(각 태그의 확률이 threshold 이상이거나 1 - threshold 이하)만
+  로컬에서 태그를 할당하고, 나머지는 LLM 으로 보냅니다.
+
+scikit-learn 은 선택 의존성이므로 모델을 학습하거나 불러올 때 import 합니다. (`pip install scikit-learn`)
+"""
+import logging
+import os
+import pickle
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import EnvVariables
+from app.util.date_utils import get_seoul_time
+
+logger = logging.getLogger(__name__)
+
+# 메시지 하나에 할당할 수 있는 최대 태그 수 (LLM 태그 할당과 같다)
+MAX_TAGS_PER_MESSAGE = 3
+
+
+def _import_sklearn():
+    try:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.multiclass import OneVsRestClassifier
+        from sklearn.preprocessing import MultiLabelBinarizer
+    except ImportError as e:
+        raise Exception("태그 사전 분류기를 사용하려면 `pip install scikit-learn` 으로 패키지를 설치해야 합니다.") from e
+    return TfidfVectorizer, LogisticRegression, OneVsRestClassifier, MultiLabelBinarizer
+
+
+class TagPreClassifier:
+    """
+    학습된 TF-IDF 벡터라이저와 태그별 로지스틱 회귀 모델(one-vs-rest)을 보관하고 태그 확률을 계산하는 클래스.
+    """
+
+    def __init__(self, vectorizer, classifier, tag_codes: List[str], example_count: int, trained_at=None):
+        self.vectorizer = vectorizer
+        self.classifier = classifier
+        self.tag_codes = tag_codes
+        self.example_count = example_count
+        self.trained_at = trained_at or get_seoul_time()
+
+    @classmethod
+    def train(cls,
+              examples: Sequence[Tuple[str, List[str]]],
+              tag_descriptions: Dict[str, str] | None = None) -> "TagPreClassifier":
+        """
+        (정제된 메시지, 태그 코드 배열) 목록과 {태그 코드: 설명 텍스트} 로 모델을 학습합니다.
+        태그 설명은 해당 태그 하나만 할당된 예시로 추가되어, 학습 데이터가 적은 태그도 어휘를 익히도록 돕습니다.
+        """
+        TfidfVectorizer, LogisticRegression, OneVsRestClassifier, MultiLabelBinarizer = _import_sklearn()
+
+        texts = [text for text, _ in examples]
+        labels = [list(tag_codes) for _, tag_codes in examples]
+        for tag_code, description in (tag_descriptions or {}).items():
+            if description:
+                texts.append(description)
+                labels.append([tag_code])
+        if not texts:
+            raise Exception("태그 사전 분류기 학습 데이터가 없습니다.")
+
+        binarizer = MultiLabelBinarizer()
+        y = binarizer.fit_transform(labels)
+        if y.shape[1] < 2:
+            raise Exception("태그 사전 분류기를 학습하려면 두 개 이상의 태그가 필요합니다.")
+
+        # 한국어는 띄어쓰기와 조사 변화가 많으므로 단어 경계 안의 글자 n-gram 을 feature 로 사용한다.
+        vectorizer = TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 4), min_df=2, sublinear_tf=True, max_features=200000)
+        x = vectorizer.fit_transform(texts)
+        classifier = OneVsRestClassifier(LogisticRegression(max_iter=1000, C=4.0))
+        classifier.fit(x, y)
+
+        return cls(vectorizer, classifier, list(binarizer.classes_), example_count=len(examples))
+
+    def predict_proba(self, texts: Sequence[str]) -> List[Dict[str, float]]:
+        """메시지마다 {태그 코드: 확률} 을 입력 순서대로 반환합니다."""
+        if not texts:
+            return []
+        probabilities = self.classifier.predict_proba(self.vectorizer.transform(texts))
+        return [dict(zip(self.tag_codes, map(float, row))) for row in probabilities]
+
+    def predict_confident(self,
+                          texts: Sequence[str],
+                          threshold: float,
+                          allowed_tag_codes: Optional[Sequence[str]] = None) -> List[Optional[Dict[str, float]]]:
+        """
+        메시지마다 확신할 수 있는 태그 할당 {태그 코드: 확률} 을 입력 순서대로 반환합니다. 확신할 수 없으면 None 입니다.
+
+        모든 태그의 확률이 threshold 이상(할당)이거나 1 - threshold 이하(미할당)이고, 할당할 태그가 1~3개인 경우에만 확신합니다.
+        allowed_tag_codes 에 없는 태그(삭제된 태그)는 무시합니다.
+        """
+        allowed = set(allowed_tag_codes) if allowed_tag_codes is not None else None
+        results: List[Optional[Dict[str, float]]] = []
+        for probabilities in self.predict_proba(texts):
+            if allowed is not None:
+                probabilities = {code: p for code, p in probabilities.items() if code in allowed}
+            assigned = {code: p for code, p in probabilities.items() if p >= threshold}
+            uncertain = any(1 - threshold < p < threshold for p in probabilities.values())
+            if uncertain or not 1 <= len(assigned) <= MAX_TAGS_PER_MESSAGE:
+                results.append(None)
+            else:
+                results.append(dict(sorted(assigned.items(), key=lambda item: item[1], reverse=True)))
+        return results
+
+    def save(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path: str) -> "TagPreClassifier":
+        _import_sklearn()
+        with open(path, "rb") as f:
+            model = pickle.load(f)
+        if not isinstance(model, TagPreClassifier):
+            raise Exception(f"태그 사전 분류기 모델 파일이 아닙니다: {path}")
+        return model
+
+
+class TagPreClassifierProvider:
+    """
+    TAG_PRECLASSIFIER 가 켜져 있을 때 TAG_PRECLASSIFIER_MODEL_PATH 의 모델을 처음 사용할 때 한 번만 불러오는 클래스.
+    모델 파일이 없거나 불러오지 못하면 경고를 남기고, 모든 메시지를 LLM 으로 보냅니다.
+    """
+
+    def __init__(self, enabled: bool | None = None, model_path: str | None = None, threshold: float | None = None):
+        self.enabled = EnvVariables.TAG_PRECLASSIFIER if enabled is None else enabled
+        self.model_path = model_path or EnvVariables.TAG_PRECLASSIFIER_MODEL_PATH
+        self.threshold = EnvVariables.TAG_PRECLASSIFIER_THRESHOLD if threshold is None else threshold
+        self._model: Optional[TagPreClassifier] = None
+        self._load_failed = False
+        self._lock = threading.Lock()
+
+    def get_model(self) -> Optional[TagPreClassifier]:
+        if not self.enabled or self._load_failed:
+            return None
+        if self._model is None:
+            with self._lock:
+                if self._model is None and not self._load_failed:
+                    try:
+                        self._model = TagPreClassifier.load(self.model_path)
+                        logger.info(f"[TagPreClassifier] 모델 로딩 완료: {self.model_path} "
+                                    f"(학습 메시지 {self._model.example_count}건, 태그 {len(self._model.tag_codes)}개, "
+                                    f"threshold={self.threshold})")
+                    except Exception as e:
+                        logger.warning(f"[TagPreClassifier] 모델을 불러오지 못해 모든 메시지를 LLM 으로 보냅니다: {e}")
+                        self._load_failed = True
+        return self._model
+
+    def predict_confident(self, texts: Sequence[str], allowed_tag_codes: Sequence[str]) -> List[Optional[Dict[str, float]]]:
+        """모델이 없으면 모든 메시지에 대해 None 을 반환합니다."""
+        model = self.get_model()
+        if model is None:
+            return [None] * len(texts)
+        return model.predict_confident(texts, self.threshold, allowed_tag_codes)
+
+
+tag_preclassifier_singleton = TagPreClassifierProvider()
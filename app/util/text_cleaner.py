@@ -1,5 +1,7 @@
 import os
-import re
+from typing import Iterable, List
+
+from app.util import text_preprocessor
 
 
 class TextCleaner:
@@ -21,18 +23,13 @@ class TextCleaner:
         """
         텍스트를 소문자화하고 특수문자 제거 및 다중 공백 정리
         """
-        text = text.lower()
-        text = re.sub(r"[^가-힣a-zA-Z0-9\s]", " ", text)
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
+        return text_preprocessor.normalize_text(text)
 
     def remove_stopwords(self, text: str) -> str:
         """
         불용어 제거
         """
-        tokens = text.split()
-        filtered_tokens = [word for word in tokens if word not in self.stopwords]
-        return " ".join(filtered_tokens)
+        return text_preprocessor.remove_stopwords(text, self.stopwords)
 
     def clean(self, text: str) -> str:
         """
@@ -40,4 +37,10 @@ class TextCleaner:
         """
         normalized = self.normalize_text(text)
         cleaned = self.remove_stopwords(normalized)
-        return cleaned
\ No newline at end of file
+        return cleaned
+
+    def clean_batch(self, texts: Iterable[str]) -> List[str]:
+        """
+        전체 전처리 파이프라인을 메시지 리스트에 한 번에 실행 (입력 순서 유지)
+        """
+        return text_preprocessor.clean_for_tagging_batch(texts, self.stopwords)
\ No newline at end of file
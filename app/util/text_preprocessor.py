@@ -0,0 +1,108 @@
+"""
+서비스 전반에서 공유하는 텍스트 전처리 모듈.
+
+모든 정규식은 모듈 import 시 한 번만 컴파일되며, 각 함수는 메시지 리스트를 받아 한 번에 처리하는 batch 버전을 함께 제공합니다.
+"""
+import re
+from typing import Iterable, List, Set
+
+# Spotlight summary 용: URL 과 특수문자(문자, 숫자, 공백이 아닌 문자)를 한 번의 스캔으로 제거
+# 특수문자 패턴은 한 글자씩만 매칭하고 URL 은 항상 영문자로 시작하므로, URL 제거 후 특수문자를 제거하는 것과 결과가 같다.
+_SUMMARY_STRIP_PATTERN = re.compile(r'https?://\S+|[^\w\s]')
+
+# 태깅 용 정규화: 한글, 영문, 숫자가 아닌 문자(공백 포함)의 연속을 공백 하나로 치환
+# "특수문자를 공백으로 치환 후 다중 공백 정리" 와 결과가 같다.
+_NORMALIZE_PATTERN = re.compile(r"[^가-힣a-zA-Z0-9]+")
+
+# 개인정보 마스킹
+LINK_PATTERN = re.compile(r'https?://[^\s]+')
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE_PATTERN = re.compile(r'\b(01[0-9])[-.\s]?(\d{3,4})[-.\s]?(\d{4})\b')
+
+LINK_MASK = '[링크]'
+EMAIL_MASK = '[이메일]'
+PHONE_MASK = '[전화번호]'
+
+
+def clean_for_summary(text: str) -> str:
+    """
+    Spotlight summary 입력용으로 URL 과 특수문자를 제거하고 앞뒤 공백을 정리하는 함수.
+
+    :param text:
+    :return text:
+    """
+    return _SUMMARY_STRIP_PATTERN.sub('', text).strip()
+
+
+def clean_for_summary_batch(texts: Iterable[str]) -> List[str]:
+    """
+    clean_for_summary 의 batch 버전. 입력 순서대로 결과를 반환합니다.
+
+    :param texts:
+    :return texts:
+    """
+    sub = _SUMMARY_STRIP_PATTERN.sub
+    return [sub('', text).strip() for text in texts]
+
+
+def normalize_text(text: str) -> str:
+    """
+    텍스트를 소문자화하고 특수문자 제거 및 다중 공백 정리
+
+    :param text:
+    :return text:
+    """
+    return _NORMALIZE_PATTERN.sub(" ", text.lower()).strip()
+
+
+def remove_stopwords(text: str, stopwords: Set[str]) -> str:
+    """
+    공백으로 구분된 토큰 중 불용어를 제거하는 함수.
+
+    :param text:
+    :param stopwords:
+    :return text:
+    """
+    return " ".join(word for word in text.split() if word not in stopwords)
+
+
+def clean_for_tagging_batch(texts: Iterable[str], stopwords: Set[str]) -> List[str]:
+    """
+    태깅 입력용 정규화와 불용어 제거를 메시지 리스트에 한 번에 적용하는 함수. 입력 순서대로 결과를 반환합니다.
+
+    :param texts:
+    :param stopwords:
+    :return texts:
+    """
+    sub = _NORMALIZE_PATTERN.sub
+    return [
+        " ".join(word for word in sub(" ", text.lower()).split() if word not in stopwords)
+        for text in texts
+    ]
+
+
+def mask_contact_info(text: str) -> str:
+    """
+    링크, 이메일, 전화번호를 순서대로 마스킹하는 함수.
+    앞선 마스킹 결과가 뒤의 패턴 매칭에 영향을 주므로 (예: 링크 안의 이메일) 순서를 유지합니다.
+
+    :param text:
+    :return text:
+    """
+    text = LINK_PATTERN.sub(LINK_MASK, text)
+    text = EMAIL_PATTERN.sub(EMAIL_MASK, text)
+    return PHONE_PATTERN.sub(PHONE_MASK, text)
+
+
+def mask_contact_info_batch(texts: Iterable[str]) -> List[str]:
+    """
+    mask_contact_info 의 batch 버전. 입력 순서대로 결과를 반환합니다.
+
+    :param texts:
+    :return texts:
+    """
+    link_sub, email_sub, phone_sub = LINK_PATTERN.sub, EMAIL_PATTERN.sub, PHONE_PATTERN.sub
+    return [
+        phone_sub(PHONE_MASK, email_sub(EMAIL_MASK, link_sub(LINK_MASK, text)))
+        for text in texts
+    ]
@@ -0,0 +1,20 @@
+import math
+
+# 한글은 대부분의 토크나이저에서 글자당 1 토큰 안팎으로 분절되고, 영문/숫자는 약 4글자당 1 토큰이다.
+# 정확한 토크나이저 없이 프롬프트 크기를 가늠하기 위한 보수적인 추정치이다.
+_ASCII_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트의 대략적인 LLM 토큰 수를 추정하는 함수.
+    한글 등 비 ASCII 문자는 1글자를 1토큰으로, ASCII 문자는 4글자를 1토큰으로 계산합니다.
+
+    :param text:
+    :return int:
+    """
+    if not text:
+        return 0
+    ascii_count = sum(1 for ch in text if ch.isascii())
+    non_ascii_count = len(text) - ascii_count
+    return non_ascii_count + math.ceil(ascii_count / _ASCII_CHARS_PER_TOKEN)